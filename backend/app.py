@@ -4,7 +4,7 @@ Product UX Community Platform Backend
 """
 import os
 
-from flask import Flask, jsonify
+from flask import Flask, Request, abort, current_app, jsonify, send_from_directory
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -14,8 +14,26 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# 요청 본문 크기 제한을 받지 않는 엔드포인트 (본문을 스트리밍으로 나눠 읽는 일괄 가져오기)
+UNLIMITED_BODY_ENDPOINTS = {"admin.import_posts"}
+
+# multipart 경계/헤더 등 파일 외 본문 여유분
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class AppRequest(Request):
+    """MAX_CONTENT_LENGTH를 엔드포인트별로 해제할 수 있는 요청 클래스"""
+
+    @property
+    def max_content_length(self):
+        if self.endpoint in UNLIMITED_BODY_ENDPOINTS:
+            return None
+        return current_app.config["MAX_CONTENT_LENGTH"] if current_app else None
+
+
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.request_class = AppRequest
 
     # CORS 설정 (환경 변수에서 허용된 오리진 가져오기)
     cors_origins = os.getenv(
@@ -58,7 +76,12 @@ def create_app() -> Flask:
     app.config["GOOGLE_CLIENT_SECRET"] = os.getenv("GOOGLE_CLIENT_SECRET", "")
     app.config["GOOGLE_REDIRECT_URI"] = os.getenv("GOOGLE_REDIRECT_URI", "")
 
+    # 요청 본문 크기 제한 (업로드 최대 크기 기준, 초과하면 본문을 읽기 전에 413)
+    from utils.uploads import MAX_UPLOAD_SIZE
+    app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_SIZE + MULTIPART_OVERHEAD
+
     # Rate Limiting 설정
+    app.config["RATELIMIT_ENABLED"] = os.getenv("RATELIMIT_ENABLED", "True").lower() == "true"
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,
@@ -82,6 +105,7 @@ def create_app() -> Flask:
     from routes.comments import comments_bp
     from routes.reports import reports_bp
     from routes.admin import admin_bp
+    from routes.uploads import uploads_bp
 
     # 모든 API는 /api 이하로 통일
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
@@ -89,6 +113,7 @@ def create_app() -> Flask:
     app.register_blueprint(comments_bp, url_prefix="/api/comments")
     app.register_blueprint(reports_bp, url_prefix="/api/reports")
     app.register_blueprint(admin_bp, url_prefix="/api/admin")
+    app.register_blueprint(uploads_bp, url_prefix="/api/uploads")
 
     # Rate Limiting 적용 (인증 관련 엔드포인트)
     limiter.limit("5 per minute")(auth_bp)
@@ -110,6 +135,15 @@ def create_app() -> Flask:
         """API 상태 확인 엔드포인트"""
         return jsonify({"status": "ok"})
 
+    # 업로드 파일 (내용 해시로 경로가 정해지므로 오래 캐시, 운영 환경에서는 웹 서버가 직접 제공 권장)
+    @app.route("/uploads/<path:filename>")
+    def uploaded_file(filename):
+        """업로드 파일 제공"""
+        from utils.uploads import UPLOAD_DIR
+        if not filename.startswith(("originals/", "thumbnails/")) or filename.endswith(".json"):
+            abort(404)
+        return send_from_directory(UPLOAD_DIR, filename, max_age=31536000)
+
     return app
 
 
@@ -0,0 +1,25 @@
+"""
+댓글 경로 백필 스크립트
+path가 비어 있는 댓글의 경로/깊이를 최상위 댓글부터 배치 단위로 채움
+"""
+import sys
+
+from database import SessionLocal
+from utils.comment_paths import backfill
+
+
+def backfill_comment_paths(batch_size=500):
+    """댓글 경로 백필"""
+    db = SessionLocal()
+    try:
+        count = backfill(db, batch_size=batch_size)
+        print(f"댓글 경로를 채웠습니다. ({count}건)")
+    except Exception as e:
+        db.rollback()
+        print(f"오류 발생: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_comment_paths(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,25 @@
+"""
+게시글 미리보기 백필 스크립트
+preview 컬럼이 비어 있는 게시글의 미리보기/본문 길이를 배치 단위로 채움
+"""
+import sys
+
+from database import SessionLocal
+from utils.preview import backfill
+
+
+def backfill_post_previews(batch_size=500):
+    """게시글 미리보기 백필"""
+    db = SessionLocal()
+    try:
+        count = backfill(db, batch_size=batch_size)
+        print(f"게시글 미리보기를 채웠습니다. ({count}건)")
+    except Exception as e:
+        db.rollback()
+        print(f"오류 발생: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_post_previews(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,107 @@
+"""
+목록 조회 경로 벤치마크 스크립트
+ORM 객체 적재 + 수동 dict 변환과 컬럼 select() + 공용 직렬화 함수의 초당 처리 행 수 비교
+
+사용법: python benchmark_list_read_path.py [게시글 수] [반복 횟수]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, joinedload, defer
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from models import User, Post, Category, UserRole, PostStatus
+from utils.preview import apply_content
+from utils.serializers import post_list_select, serialize_post_row
+
+
+def _seed(db, count):
+    author = User(email='bench@example.com', nickname='벤치마크', role=UserRole.USER, is_active=True)
+    category = Category(name='벤치마크', description='벤치마크용 카테고리')
+    db.add_all([author, category])
+    db.flush()
+    base = datetime(2024, 1, 1)
+    for i in range(count):
+        post = Post(
+            title=f'벤치마크 게시글 {i}',
+            author_id=author.id,
+            category_id=category.id,
+            status=PostStatus.PUBLISHED,
+            created_at=base + timedelta(seconds=i),
+        )
+        apply_content(post, '본문 내용입니다. ' * 100)
+        db.add(post)
+    db.commit()
+
+
+def _orm_path(db):
+    """기존 방식: ORM 객체 적재 후 필드 복사"""
+    posts = db.query(Post).options(
+        joinedload(Post.author), joinedload(Post.category), defer(Post.content)
+    ).filter(Post.status == PostStatus.PUBLISHED).order_by(Post.created_at.desc()).all()
+    return [{
+        'id': post.id,
+        'title': post.title,
+        'content': post.preview or '',
+        'author_id': post.author_id,
+        'author_nickname': post.author.nickname,
+        'category_id': post.category_id,
+        'category_name': post.category.name if post.category else None,
+        'view_count': post.view_count,
+        'like_count': post.like_count,
+        'comment_count': post.comment_count,
+        'created_at': post.created_at.isoformat(),
+        'updated_at': post.updated_at.isoformat() if post.updated_at else None
+    } for post in posts]
+
+
+def _core_path(db):
+    """변경 방식: 필요한 컬럼만 select() 후 Row 직렬화"""
+    rows = db.execute(
+        post_list_select().where(Post.status == PostStatus.PUBLISHED).order_by(Post.created_at.desc())
+    ).all()
+    return [serialize_post_row(row) for row in rows]
+
+
+def _measure(session_factory, func, count, repeat):
+    best = None
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            result = func(db)
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+        assert len(result) == count
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+def run_benchmark(count=5000, repeat=5):
+    """메모리 SQLite에 게시글을 만들고 두 경로의 처리량 출력"""
+    engine = create_engine(
+        'sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+
+    db = session_factory()
+    try:
+        _seed(db, count)
+    finally:
+        db.close()
+
+    orm_rate = _measure(session_factory, _orm_path, count, repeat)
+    core_rate = _measure(session_factory, _core_path, count, repeat)
+    print(f"게시글 {count}건, {repeat}회 중 최고 기록")
+    print(f"  ORM 객체 경로:   {orm_rate:,.0f} rows/sec")
+    print(f"  select() 경로:  {core_rate:,.0f} rows/sec ({core_rate / orm_rate:.1f}배)")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    run_benchmark(*args)
@@ -3,6 +3,8 @@
 """
 from database import SessionLocal, init_db
 from models import User, Post, Category, UserRole, PostStatus
+from utils import counters, hot
+from utils.preview import apply_content
 import bcrypt
 from datetime import datetime
 
@@ -73,9 +75,15 @@ def create_test_data():
             like_count=10,
             comment_count=5
         )
+        for post in (post1, post2):
+            apply_content(post, post.content)
         db.add(post1)
         db.add(post2)
+        db.flush()
         
+        # 목록 전체 개수용 집계 카운터 갱신
+        counters.rebuild(db)
+        hot.rebuild(db)
         db.commit()
         print("테스트 데이터가 생성되었습니다.")
         print(f"- 일반 사용자: test@example.com / password123")
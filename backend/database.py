@@ -2,22 +2,30 @@
 데이터베이스 연결 및 초기화 모듈 (SQLite)
 """
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
 from models import Base
 
-# SQLite 사용 (파일 기반 - MySQL 없이 작동)
+# SQLite 사용 (파일 기반 - MySQL 없이 작동), DATABASE_URL 환경 변수로 변경 가능
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'community_platform.db')
-DATABASE_URL = f'sqlite:///{DATABASE_PATH}'
+DATABASE_URL = os.getenv('DATABASE_URL', f'sqlite:///{DATABASE_PATH}')
 
 # 데이터베이스 엔진 생성
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    connect_args={"check_same_thread": False},  # SQLite용 설정
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith('sqlite') else {},  # SQLite용 설정
     echo=False
 )
 
+if DATABASE_URL.startswith('sqlite'):
+    @event.listens_for(engine, 'connect')
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        """SQLite 외래 키 검사 켜기 (기본값은 꺼져 있어 없는 게시글/댓글을 참조하는 행도 저장됨)"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
 # 세션 팩토리 생성
 SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
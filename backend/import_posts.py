@@ -0,0 +1,37 @@
+"""
+게시글 일괄 가져오기 스크립트
+NDJSON 파일(한 줄에 게시글 하나, images/comments 포함)을 배치 단위로 가져옴
+
+사용법: python import_posts.py <파일 경로> [배치 크기]
+
+예시 한 줄:
+{"author_id": 1, "category_id": 2, "title": "제목", "content": "내용", "created_at": "2020-05-01T12:00:00",
+ "images": ["https://example.com/a.jpg"], "comments": [{"author_id": 3, "content": "댓글"}]}
+"""
+import sys
+
+from database import SessionLocal
+from utils import importer
+
+
+def import_posts(path, batch_size=importer.DEFAULT_BATCH_SIZE):
+    """게시글 일괄 가져오기"""
+    db = SessionLocal()
+    try:
+        with open(path, encoding='utf-8') as f:
+            report = importer.import_posts(db, f, batch_size=batch_size)
+        print(f"게시글을 가져왔습니다. (성공 {report.imported}건, 실패 {report.failed}건)")
+        for error in report.errors:
+            print(f"  {error['line']}번째 줄: {error['errors']}")
+    except Exception as e:
+        db.rollback()
+        print(f"오류 발생: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python import_posts.py <파일 경로> [배치 크기]")
+        sys.exit(1)
+    import_posts(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else importer.DEFAULT_BATCH_SIZE)
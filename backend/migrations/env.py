@@ -0,0 +1,69 @@
+"""
+Alembic 마이그레이션 실행 환경
+database.py의 엔진과 models.py의 메타데이터 사용
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from database import engine, DATABASE_URL
+from models import Base
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """
+    모델에 없는 검색 인덱스 테이블(FTS5 및 내부 테이블)과
+    MySQL의 처리 대기 신고 고유 키(생성 컬럼/인덱스, 대신 쓰지 않는 부분 인덱스)는 비교 대상에서 제외
+    """
+    if type_ == 'table' and name.startswith('posts_fts'):
+        return False
+    if context.get_context().dialect.name == 'mysql':
+        return name not in ('pending_key', 'uq_reports_pending_key', 'uq_reports_pending_target')
+    return True
+
+
+def run_migrations_offline():
+    """SQL 스크립트 출력 모드 (DB 연결 없음)"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=DATABASE_URL.startswith('sqlite'),
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """DB에 직접 마이그레이션 적용"""
+    with engine.connect() as connection:
+        if connection.dialect.name == 'sqlite':
+            # batch 모드의 테이블 재생성(DROP)이 ON DELETE CASCADE로 다른 테이블 행을 지우지 않도록 외래 키 검사 끄기
+            connection.exec_driver_sql('PRAGMA foreign_keys=OFF')
+            connection.commit()
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite는 ALTER TABLE 제약이 있어 batch 모드(테이블 재생성) 사용
+            render_as_batch=connection.dialect.name == 'sqlite',
+            include_object=include_object,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
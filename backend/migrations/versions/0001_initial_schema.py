@@ -0,0 +1,136 @@
+"""initial schema
+
+기존 init_db()(create_all)로 생성되던 테이블 구조.
+이미 init_db()로 만든 DB는 `alembic stamp 0001` 후 upgrade 진행
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+USER_ROLE = sa.Enum('USER', 'ADMIN', name='userrole')
+OAUTH_PROVIDER = sa.Enum('KAKAO', 'NAVER', 'GOOGLE', name='oauthprovider')
+POST_STATUS = sa.Enum('PUBLISHED', 'DRAFT', 'DELETED', name='poststatus')
+REPORT_STATUS = sa.Enum('PENDING', 'PROCESSING', 'RESOLVED', 'REJECTED', name='reportstatus')
+REPORT_TYPE = sa.Enum('POST', 'COMMENT', name='reporttype')
+
+
+def upgrade():
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('email', sa.String(255), nullable=True),
+        sa.Column('password_hash', sa.String(255), nullable=True),
+        sa.Column('nickname', sa.String(100), nullable=False),
+        sa.Column('profile_image_url', sa.String(500), nullable=True),
+        sa.Column('role', USER_ROLE, nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'oauth_accounts',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('provider', OAUTH_PROVIDER, nullable=False),
+        sa.Column('provider_user_id', sa.String(255), nullable=False),
+        sa.Column('access_token', sa.Text(), nullable=True),
+        sa.Column('refresh_token', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        mysql_engine='InnoDB',
+    )
+
+    op.create_table(
+        'categories',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('name', sa.String(100), nullable=False, unique=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('order', sa.Integer(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_table(
+        'posts',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('author_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('category_id', sa.Integer(), sa.ForeignKey('categories.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('title', sa.String(500), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('status', POST_STATUS, nullable=False),
+        sa.Column('view_count', sa.Integer(), nullable=False),
+        sa.Column('like_count', sa.Integer(), nullable=False),
+        sa.Column('comment_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_table(
+        'post_images',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('post_id', sa.Integer(), sa.ForeignKey('posts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('image_url', sa.String(500), nullable=False),
+        sa.Column('order', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_table(
+        'post_likes',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('post_id', sa.Integer(), sa.ForeignKey('posts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        mysql_engine='InnoDB',
+    )
+
+    op.create_table(
+        'comments',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('post_id', sa.Integer(), sa.ForeignKey('posts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('author_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('parent_id', sa.Integer(), sa.ForeignKey('comments.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_table(
+        'reports',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('reporter_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('report_type', REPORT_TYPE, nullable=False),
+        sa.Column('post_id', sa.Integer(), sa.ForeignKey('posts.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('comment_id', sa.Integer(), sa.ForeignKey('comments.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('reason', sa.Text(), nullable=False),
+        sa.Column('status', REPORT_STATUS, nullable=False),
+        sa.Column('admin_note', sa.Text(), nullable=True),
+        sa.Column('processed_by', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table('reports')
+    op.drop_table('comments')
+    op.drop_table('post_likes')
+    op.drop_table('post_images')
+    op.drop_table('posts')
+    op.drop_table('categories')
+    op.drop_table('oauth_accounts')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_table('users')
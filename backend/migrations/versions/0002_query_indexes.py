@@ -0,0 +1,53 @@
+"""composite indexes for list queries and missing unique constraints
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 유니크 제약조건 추가 전 기존 중복 행 정리 (가장 먼저 생성된 행만 유지)
+    # MySQL은 DELETE 대상 테이블을 서브쿼리에서 직접 참조할 수 없어 파생 테이블로 감쌈
+    op.execute(
+        "DELETE FROM post_likes WHERE id NOT IN ("
+        "SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM post_likes GROUP BY user_id, post_id) AS keep)"
+    )
+    op.execute(
+        "DELETE FROM oauth_accounts WHERE id NOT IN ("
+        "SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM oauth_accounts GROUP BY provider, provider_user_id) AS keep)"
+    )
+
+    with op.batch_alter_table('post_likes') as batch_op:
+        batch_op.create_unique_constraint('uq_post_likes_user_post', ['user_id', 'post_id'])
+    op.create_index('ix_post_likes_post_id', 'post_likes', ['post_id'])
+
+    with op.batch_alter_table('oauth_accounts') as batch_op:
+        batch_op.create_unique_constraint('uq_oauth_accounts_provider_user', ['provider', 'provider_user_id'])
+
+    op.create_index('ix_posts_status_category_created', 'posts', ['status', 'category_id', 'created_at', 'id'])
+    op.create_index('ix_posts_status_created', 'posts', ['status', 'created_at', 'id'])
+    op.create_index('ix_comments_post_deleted_created', 'comments', ['post_id', 'is_deleted', 'created_at'])
+    op.create_index('ix_reports_status_created', 'reports', ['status', 'created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_reports_status_created', table_name='reports')
+    op.drop_index('ix_comments_post_deleted_created', table_name='comments')
+    op.drop_index('ix_posts_status_created', table_name='posts')
+    op.drop_index('ix_posts_status_category_created', table_name='posts')
+
+    with op.batch_alter_table('oauth_accounts') as batch_op:
+        batch_op.drop_constraint('uq_oauth_accounts_provider_user', type_='unique')
+
+    op.drop_index('ix_post_likes_post_id', table_name='post_likes')
+    with op.batch_alter_table('post_likes') as batch_op:
+        batch_op.drop_constraint('uq_post_likes_user_post', type_='unique')
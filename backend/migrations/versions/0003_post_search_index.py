@@ -0,0 +1,79 @@
+"""full-text search index for posts
+
+SQLite: bigram 토큰을 저장하는 FTS5 가상 테이블(posts_fts) 생성 및 기존 게시글 색인
+MySQL: posts(title, content) FULLTEXT 인덱스 (ngram parser)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+# 작성 시점의 utils.search.tokenize (이후 앱 코드가 바뀌어도 이 마이그레이션 결과는 그대로 유지)
+_HANGUL = 'ᄀ-ᇿ㄰-㆏가-힣'
+_TOKEN_RE = re.compile(rf'[{_HANGUL}]+|[^\W{_HANGUL}_]+')
+_HANGUL_RE = re.compile(rf'[{_HANGUL}]')
+
+
+def _tokenize(value):
+    """한글은 글자 bigram, 그 외 문자는 단어 단위 소문자 토큰"""
+    tokens = []
+    for run in _TOKEN_RE.findall(value or ''):
+        if _HANGUL_RE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run.lower())
+    return tokens
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.execute(
+            'ALTER TABLE posts ADD FULLTEXT INDEX ft_posts_title_content (title, content) WITH PARSER ngram'
+        )
+        return
+    if bind.dialect.name != 'sqlite' or op.get_context().as_sql:
+        return
+
+    op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(title, content, tokenize = 'unicode61')")
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, title, content FROM posts WHERE id > :last_id AND status != 'DELETED' "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text('INSERT INTO posts_fts (rowid, title, content) VALUES (:id, :title, :content)'),
+            [{'id': r.id, 'title': ' '.join(_tokenize(r.title)), 'content': ' '.join(_tokenize(r.content))}
+             for r in rows]
+        )
+        last_id = rows[-1].id
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.drop_index('ft_posts_title_content', table_name='posts')
+    elif bind.dialect.name == 'sqlite':
+        op.execute('DROP TABLE IF EXISTS posts_fts')
@@ -0,0 +1,64 @@
+"""stat_counters table for list totals
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+_posts = sa.table('posts', sa.column('status', sa.String), sa.column('category_id', sa.Integer))
+_users = sa.table('users', sa.column('id', sa.Integer), sa.column('is_active', sa.Boolean))
+_reports = sa.table('reports', sa.column('status', sa.String))
+_stat_counters = sa.table('stat_counters', sa.column('key', sa.String), sa.column('value', sa.BigInteger))
+
+
+def upgrade():
+    op.create_table(
+        'stat_counters',
+        sa.Column('key', sa.String(100), primary_key=True),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+    )
+    if not op.get_context().as_sql:
+        # 기존 데이터 기준으로 초기값 계산
+        _backfill(op.get_bind())
+
+
+def _backfill(bind):
+    """게시글(상태×카테고리, 상태 전체)/회원/신고(상태별) 개수 (키 형식은 utils.counters와 같음)"""
+    counts = {}
+    for status, category_id, count in bind.execute(
+        sa.select(_posts.c.status, _posts.c.category_id, sa.func.count())
+        .group_by(_posts.c.status, _posts.c.category_id)
+    ):
+        status = status.lower()
+        counts[f'posts:{status}:{"none" if category_id is None else category_id}'] = count
+        counts[f'posts:{status}:all'] = counts.get(f'posts:{status}:all', 0) + count
+
+    total, active = bind.execute(
+        sa.select(
+            sa.func.count(_users.c.id),
+            sa.func.coalesce(sa.func.sum(sa.case((_users.c.is_active.is_(True), 1), else_=0)), 0),
+        )
+    ).one()
+    counts['users:total'] = total
+    counts['users:active'] = active
+
+    for status, count in bind.execute(
+        sa.select(_reports.c.status, sa.func.count()).group_by(_reports.c.status)
+    ):
+        counts[f'reports:{status.lower()}'] = count
+
+    if counts:
+        bind.execute(_stat_counters.insert(), [{'key': key, 'value': value} for key, value in counts.items()])
+
+
+def downgrade():
+    op.drop_table('stat_counters')
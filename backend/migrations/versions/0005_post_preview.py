@@ -0,0 +1,62 @@
+"""stored preview and content_length columns on posts
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# utils.preview.PREVIEW_LENGTH와 같은 값 (마이그레이션은 앱 코드에 의존하지 않음)
+_PREVIEW_LENGTH = 200
+_posts = sa.table(
+    'posts',
+    sa.column('id', sa.Integer),
+    sa.column('content', sa.Text),
+    sa.column('preview', sa.String),
+    sa.column('content_length', sa.Integer),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.add_column(sa.Column('preview', sa.String(200), nullable=True))
+        batch_op.add_column(sa.Column('content_length', sa.Integer(), nullable=True))
+    if not op.get_context().as_sql:
+        # 대용량 테이블은 backfill_post_previews.py로 따로 실행해도 됨
+        _backfill(op.get_bind())
+
+
+def _backfill(bind, batch_size=500):
+    """기존 게시글 미리보기/본문 길이를 ID 범위 단위로 채움 (updated_at은 건드리지 않음)"""
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(_posts.c.id, _posts.c.content)
+            .where(_posts.c.id > last_id, _posts.c.preview.is_(None))
+            .order_by(_posts.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        bind.execute(
+            _posts.update().where(_posts.c.id == sa.bindparam('post_id')).values(
+                preview=sa.bindparam('preview'), content_length=sa.bindparam('content_length')
+            ),
+            [{'post_id': r.id, 'preview': (r.content or '')[:_PREVIEW_LENGTH], 'content_length': len(r.content or '')}
+             for r in rows]
+        )
+        last_id = rows[-1].id
+
+
+def downgrade():
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_column('content_length')
+        batch_op.drop_column('preview')
@@ -0,0 +1,104 @@
+"""time-decayed hot_score column on posts
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+"""
+import os
+import time
+from datetime import timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# utils.hot과 같은 기준 시각 키/반감기/가중치 (마이그레이션은 앱 코드에 의존하지 않음)
+_EPOCH_KEY = 'hot:epoch'
+_HALF_LIFE = float(os.getenv('HOT_HALF_LIFE_HOURS', '24')) * 3600
+_POST_WEIGHT = 1.0
+_LIKE_WEIGHT = 1.0
+_COMMENT_WEIGHT = 2.0
+_VIEW_WEIGHT = 0.05
+
+_posts = sa.table(
+    'posts',
+    sa.column('id', sa.Integer),
+    sa.column('status', sa.String),
+    sa.column('created_at', sa.DateTime),
+    sa.column('view_count', sa.Integer),
+    sa.column('hot_score', sa.Double),
+)
+_post_likes = sa.table('post_likes', sa.column('post_id', sa.Integer), sa.column('created_at', sa.DateTime))
+_comments = sa.table(
+    'comments',
+    sa.column('post_id', sa.Integer),
+    sa.column('created_at', sa.DateTime),
+    sa.column('is_deleted', sa.Boolean),
+)
+_stat_counters = sa.table('stat_counters', sa.column('key', sa.String), sa.column('value', sa.BigInteger))
+
+
+def upgrade():
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.add_column(sa.Column('hot_score', sa.Double(), nullable=False, server_default='0'))
+        batch_op.create_index('ix_posts_status_category_hot', ['status', 'category_id', 'hot_score', 'id'])
+        batch_op.create_index('ix_posts_status_hot', ['status', 'hot_score', 'id'])
+    if not op.get_context().as_sql:
+        # 기존 게시글 점수는 작성/좋아요/댓글 시각으로 계산
+        _backfill(op.get_bind())
+
+
+def _weight_at(epoch, weight, when):
+    # DB의 DateTime은 UTC 기준 naive 값
+    return weight * 2 ** ((when.replace(tzinfo=timezone.utc).timestamp() - epoch) / _HALF_LIFE)
+
+
+def _backfill(bind, batch_size=500):
+    """기준 시각을 현재로 정하고 게시글 점수 계산 (조회는 발생 시각이 없으므로 게시글 작성 시각 기준)"""
+    epoch = bind.execute(sa.select(_stat_counters.c.value).where(_stat_counters.c.key == _EPOCH_KEY)).scalar()
+    if epoch is None:
+        epoch = int(time.time())
+        bind.execute(_stat_counters.insert().values(key=_EPOCH_KEY, value=epoch))
+    stmt = _posts.update().where(_posts.c.id == sa.bindparam('post_id')).values(hot_score=sa.bindparam('score'))
+    last_id = 0
+    while True:
+        posts = bind.execute(
+            sa.select(_posts.c.id, _posts.c.status, _posts.c.created_at, _posts.c.view_count)
+            .where(_posts.c.id > last_id).order_by(_posts.c.id).limit(batch_size)
+        ).all()
+        if not posts:
+            return
+        scores = {}
+        for post in posts:
+            if post.status == 'PUBLISHED':
+                scores[post.id] = (_weight_at(epoch, _POST_WEIGHT, post.created_at)
+                                   + _weight_at(epoch, _VIEW_WEIGHT, post.created_at) * post.view_count)
+            else:
+                scores[post.id] = 0.0
+        ids = [post.id for post in posts]
+        for post_id, created_at in bind.execute(
+            sa.select(_post_likes.c.post_id, _post_likes.c.created_at).where(_post_likes.c.post_id.in_(ids))
+        ):
+            if scores[post_id]:
+                scores[post_id] += _weight_at(epoch, _LIKE_WEIGHT, created_at)
+        for post_id, created_at in bind.execute(
+            sa.select(_comments.c.post_id, _comments.c.created_at)
+            .where(_comments.c.post_id.in_(ids), _comments.c.is_deleted.is_(False))
+        ):
+            if scores[post_id]:
+                scores[post_id] += _weight_at(epoch, _COMMENT_WEIGHT, created_at)
+        bind.execute(stmt, [{'post_id': post_id, 'score': score} for post_id, score in scores.items()])
+        last_id = posts[-1].id
+
+
+def downgrade():
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_index('ix_posts_status_hot')
+        batch_op.drop_index('ix_posts_status_category_hot')
+        batch_op.drop_column('hot_score')
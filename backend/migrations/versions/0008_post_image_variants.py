@@ -0,0 +1,35 @@
+"""content hash, dimensions and thumbnail url on post_images
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('post_images') as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('width', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('height', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('thumbnail_url', sa.String(length=500), nullable=True))
+        batch_op.create_index('ix_post_images_post_order', ['post_id', 'order'])
+        batch_op.create_index('ix_post_images_content_hash', ['content_hash'])
+
+
+def downgrade():
+    with op.batch_alter_table('post_images') as batch_op:
+        batch_op.drop_index('ix_post_images_content_hash')
+        batch_op.drop_index('ix_post_images_post_order')
+        batch_op.drop_column('thumbnail_url')
+        batch_op.drop_column('height')
+        batch_op.drop_column('width')
+        batch_op.drop_column('content_hash')
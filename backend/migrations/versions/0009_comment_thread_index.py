@@ -0,0 +1,22 @@
+"""index on comments (post_id, parent_id, created_at) for paginated threads
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_comments_post_parent_created', 'comments', ['post_id', 'parent_id', 'created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_comments_post_parent_created', table_name='comments')
@@ -0,0 +1,75 @@
+"""materialized path and depth columns on comments
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+# utils.comment_paths.SEGMENT_WIDTH와 같은 값 (마이그레이션은 앱 코드에 의존하지 않음)
+_SEGMENT_WIDTH = 10
+_comments = sa.table(
+    'comments',
+    sa.column('id', sa.Integer),
+    sa.column('parent_id', sa.Integer),
+    sa.column('path', sa.String),
+    sa.column('depth', sa.Integer),
+)
+
+
+def upgrade():
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.add_column(sa.Column('path', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('depth', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.create_index('ix_comments_post_path', ['post_id', 'path'])
+    if not op.get_context().as_sql:
+        # 대용량 테이블은 backfill_comment_paths.py로 따로 실행해도 됨
+        _backfill(op.get_bind())
+
+
+def _backfill(bind, batch_size=500):
+    """path가 비어 있는 댓글을 부모가 채워진 것부터 배치 단위로 채움 (최상위 → 답글 순, updated_at은 건드리지 않음)"""
+    parent = _comments.alias('parent')
+    stmt = (
+        _comments.update()
+        .where(_comments.c.id == sa.bindparam('comment_id'))
+        .values(path=sa.bindparam('path'), depth=sa.bindparam('depth'))
+    )
+    query = (
+        sa.select(_comments.c.id, parent.c.path.label('parent_path'), parent.c.depth.label('parent_depth'))
+        .select_from(_comments.outerjoin(parent, _comments.c.parent_id == parent.c.id))
+        .where(
+            _comments.c.path.is_(None),
+            # 최상위 댓글이거나 부모 경로가 이미 채워진 답글
+            (_comments.c.parent_id.is_(None)) | (parent.c.path.isnot(None)),
+        )
+        .order_by(_comments.c.id)
+        .limit(batch_size)
+    )
+    while True:
+        rows = bind.execute(query).all()
+        if not rows:
+            return
+        bind.execute(stmt, [
+            {
+                'comment_id': row.id,
+                'path': (row.parent_path or '') + str(row.id).zfill(_SEGMENT_WIDTH),
+                'depth': row.parent_depth + 1 if row.parent_path is not None else 0,
+            }
+            for row in rows
+        ])
+
+
+def downgrade():
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.drop_index('ix_comments_post_path')
+        batch_op.drop_column('depth')
+        batch_op.drop_column('path')
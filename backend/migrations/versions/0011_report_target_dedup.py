@@ -0,0 +1,97 @@
+"""target_id column and pending-report unique index on reports
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+_PENDING = sa.text("status = 'PENDING'")
+_MYSQL_PENDING_KEY_DDL = (
+    "ALTER TABLE reports "
+    "ADD COLUMN pending_key TINYINT AS (IF(status = 'PENDING', 1, NULL)) VIRTUAL, "
+    "ADD UNIQUE INDEX uq_reports_pending_key (reporter_id, report_type, target_id, pending_key)"
+)
+
+_reports = sa.table(
+    'reports',
+    sa.column('id', sa.Integer),
+    sa.column('reporter_id', sa.Integer),
+    sa.column('report_type', sa.String),
+    sa.column('post_id', sa.Integer),
+    sa.column('comment_id', sa.Integer),
+    sa.column('target_id', sa.Integer),
+    sa.column('status', sa.String),
+    sa.column('admin_note', sa.Text),
+)
+_stat_counters = sa.table('stat_counters', sa.column('key', sa.String), sa.column('value', sa.BigInteger))
+
+
+def upgrade():
+    with op.batch_alter_table('reports') as batch_op:
+        batch_op.add_column(sa.Column('target_id', sa.Integer(), nullable=True))
+
+    if not op.get_context().as_sql:
+        _backfill(op.get_bind())
+
+    with op.batch_alter_table('reports') as batch_op:
+        batch_op.alter_column('target_id', existing_type=sa.Integer(), nullable=False)
+    if op.get_bind().dialect.name == 'mysql':
+        # 부분 인덱스 대신 처리 대기일 때만 값이 있는 생성 컬럼을 포함한 고유 인덱스
+        op.execute(_MYSQL_PENDING_KEY_DDL)
+    else:
+        op.create_index(
+            'uq_reports_pending_target', 'reports', ['reporter_id', 'report_type', 'target_id'],
+            unique=True, sqlite_where=_PENDING, postgresql_where=_PENDING,
+        )
+
+
+def _backfill(bind):
+    """기존 신고의 target_id를 채우고, 중복된 처리 대기 신고는 먼저 접수된 것만 남김"""
+    table = _reports
+    bind.execute(
+        table.update().values(
+            target_id=sa.func.coalesce(
+                sa.case((table.c.report_type == 'COMMENT', table.c.comment_id), else_=table.c.post_id), 0
+            )
+        )
+    )
+    # MySQL은 UPDATE 대상 테이블을 서브쿼리에서 바로 읽을 수 없어 파생 테이블로 감쌈
+    first = (
+        sa.select(sa.func.min(table.c.id).label('id'))
+        .where(table.c.status == 'PENDING')
+        .group_by(table.c.reporter_id, table.c.report_type, table.c.target_id)
+        .subquery()
+    )
+    duplicates = bind.execute(
+        table.update()
+        .where(table.c.status == 'PENDING', table.c.id.not_in(sa.select(first.c.id)))
+        .values(status='REJECTED', admin_note='중복 신고')
+    ).rowcount
+    if duplicates:
+        # 신고 상태별 카운터(utils.counters의 reports:<상태> 키)를 다시 계산
+        bind.execute(_stat_counters.delete().where(_stat_counters.c.key.like('reports:%')))
+        bind.execute(_stat_counters.insert(), [
+            {'key': f'reports:{status.lower()}', 'value': count}
+            for status, count in bind.execute(
+                sa.select(table.c.status, sa.func.count()).group_by(table.c.status)
+            )
+        ])
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('uq_reports_pending_key', table_name='reports')
+        op.drop_column('reports', 'pending_key')
+    else:
+        op.drop_index('uq_reports_pending_target', table_name='reports')
+    with op.batch_alter_table('reports') as batch_op:
+        batch_op.drop_column('target_id')
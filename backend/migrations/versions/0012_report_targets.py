@@ -0,0 +1,83 @@
+"""report_targets aggregate table and hidden post status
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+_REPORT_TYPE = sa.Enum('POST', 'COMMENT', name='reporttype')
+_OLD_POST_STATUS = sa.Enum('PUBLISHED', 'DRAFT', 'DELETED', name='poststatus')
+_NEW_POST_STATUS = sa.Enum('PUBLISHED', 'DRAFT', 'DELETED', 'HIDDEN', name='poststatus')
+
+_reports = sa.table(
+    'reports',
+    sa.column('report_type', sa.String),
+    sa.column('target_id', sa.Integer),
+    sa.column('status', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+_report_targets = sa.table(
+    'report_targets',
+    sa.column('target_type', sa.String),
+    sa.column('target_id', sa.Integer),
+    sa.column('pending_count', sa.Integer),
+    sa.column('total_count', sa.Integer),
+    sa.column('first_reported_at', sa.DateTime),
+    sa.column('last_reported_at', sa.DateTime),
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'mysql':
+        # MySQL은 네이티브 ENUM이라 새 상태 값 추가 필요 (SQLite는 VARCHAR로 저장)
+        op.alter_column('posts', 'status', existing_type=_OLD_POST_STATUS, type_=_NEW_POST_STATUS,
+                        existing_nullable=False)
+
+    op.create_table(
+        'report_targets',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('target_type', _REPORT_TYPE, nullable=False),
+        sa.Column('target_id', sa.Integer(), nullable=False),
+        sa.Column('pending_count', sa.Integer(), nullable=False),
+        sa.Column('total_count', sa.Integer(), nullable=False),
+        sa.Column('top_reasons', sa.Text(), nullable=True),
+        sa.Column('first_reported_at', sa.DateTime(), nullable=False),
+        sa.Column('last_reported_at', sa.DateTime(), nullable=False),
+        sa.Column('hidden_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('target_type', 'target_id', name='uq_report_targets_target'),
+    )
+    op.create_index('ix_report_targets_pending', 'report_targets', ['pending_count', 'id'])
+    # 대상별 신고 일괄 처리/복원 UPDATE용 (uq_reports_pending_target은 reporter_id가 앞이라 쓸 수 없음)
+    op.create_index('ix_reports_target_status', 'reports', ['report_type', 'target_id', 'status'])
+    # 기존 신고 기준으로 대상별 집계 생성 (사유 목록은 이후 신고부터 채워짐)
+    op.execute(
+        _report_targets.insert().from_select(
+            ['target_type', 'target_id', 'pending_count', 'total_count', 'first_reported_at', 'last_reported_at'],
+            sa.select(
+                _reports.c.report_type,
+                _reports.c.target_id,
+                sa.func.sum(sa.case((_reports.c.status == 'PENDING', 1), else_=0)),
+                sa.func.count(),
+                sa.func.min(_reports.c.created_at),
+                sa.func.max(_reports.c.created_at),
+            ).group_by(_reports.c.report_type, _reports.c.target_id)
+        )
+    )
+
+
+def downgrade():
+    op.drop_index('ix_reports_target_status', table_name='reports')
+    op.drop_index('ix_report_targets_pending', table_name='report_targets')
+    op.drop_table('report_targets')
+    if op.get_bind().dialect.name == 'mysql':
+        op.alter_column('posts', 'status', existing_type=_NEW_POST_STATUS, type_=_OLD_POST_STATUS,
+                        existing_nullable=False)
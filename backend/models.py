@@ -1,9 +1,10 @@
 """
 데이터베이스 모델 정의
-User, Post, Comment, Report, Admin, OAuthAccount 모델 포함
+User, Post, Comment, Report, ReportTarget, Admin, OAuthAccount, StatCounter 모델 포함
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, BigInteger, Double, String, Text, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import DDL, Index, UniqueConstraint, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import enum
@@ -29,6 +30,7 @@ class PostStatus(enum.Enum):
     PUBLISHED = "published"
     DRAFT = "draft"
     DELETED = "deleted"
+    HIDDEN = "hidden"  # 신고 누적으로 자동 숨김
 
 
 class ReportStatus(enum.Enum):
@@ -88,6 +90,7 @@ class OAuthAccount(Base):
 
     # 복합 유니크 제약조건: 같은 제공자에서 같은 사용자 ID는 하나만
     __table_args__ = (
+        UniqueConstraint('provider', 'provider_user_id', name='uq_oauth_accounts_provider_user'),
         {'mysql_engine': 'InnoDB'},
     )
 
@@ -122,10 +125,15 @@ class Post(Base):
     category_id = Column(Integer, ForeignKey('categories.id', ondelete='SET NULL'), nullable=True)
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
+    preview = Column(String(200), nullable=True)  # 목록용 본문 미리보기
+    content_length = Column(Integer, nullable=True)
     status = Column(Enum(PostStatus), default=PostStatus.PUBLISHED, nullable=False)
     view_count = Column(Integer, default=0, nullable=False)
     like_count = Column(Integer, default=0, nullable=False)
     comment_count = Column(Integer, default=0, nullable=False)
+    hot_score = Column(Double, default=0, nullable=False)  # 시간 감쇠 인기 점수 (utils/hot.py)
+    comment_version = Column(Integer, default=0, nullable=False)  # 댓글 작성/수정/삭제 시 증가 (ETag용)
+    image_version = Column(Integer, default=0, nullable=False)  # 썸네일 결과 반영 시 증가 (ETag용)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -137,6 +145,15 @@ class Post(Base):
     reports = relationship("Report", back_populates="post", cascade="all, delete-orphan")
     images = relationship("PostImage", back_populates="post", cascade="all, delete-orphan")
 
+    # 목록 조회용 인덱스: 상태(+카테고리) 필터 후 최신순 정렬
+    __table_args__ = (
+        Index('ix_posts_status_category_created', 'status', 'category_id', 'created_at', 'id'),
+        Index('ix_posts_status_created', 'status', 'created_at', 'id'),
+        # 인기순 조회용 인덱스
+        Index('ix_posts_status_category_hot', 'status', 'category_id', 'hot_score', 'id'),
+        Index('ix_posts_status_hot', 'status', 'hot_score', 'id'),
+    )
+
     def __repr__(self):
         return f"<Post(id={self.id}, title={self.title[:50]}, author_id={self.author_id})>"
 
@@ -149,11 +166,21 @@ class PostImage(Base):
     post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=False)
     image_url = Column(String(500), nullable=False)
     order = Column(Integer, default=0, nullable=False)
+    # 업로드 이미지 정보 (외부 URL 이미지는 NULL, 썸네일은 생성 완료 후 채워짐)
+    content_hash = Column(String(64), nullable=True)
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    thumbnail_url = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # 관계
     post = relationship("Post", back_populates="images")
 
+    __table_args__ = (
+        Index('ix_post_images_post_order', 'post_id', 'order'),
+        Index('ix_post_images_content_hash', 'content_hash'),
+    )
+
     def __repr__(self):
         return f"<PostImage(id={self.id}, post_id={self.post_id})>"
 
@@ -173,6 +200,8 @@ class PostLike(Base):
 
     # 복합 유니크 제약조건: 같은 사용자가 같은 게시글에 중복 좋아요 불가
     __table_args__ = (
+        UniqueConstraint('user_id', 'post_id', name='uq_post_likes_user_post'),
+        Index('ix_post_likes_post_id', 'post_id'),
         {'mysql_engine': 'InnoDB'},
     )
 
@@ -190,6 +219,9 @@ class Comment(Base):
     parent_id = Column(Integer, ForeignKey('comments.id', ondelete='CASCADE'), nullable=True)  # 대댓글용
     content = Column(Text, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
+    # 조상 ID를 이어 붙인 경로와 깊이 (서브트리 조회/표시 순서용, utils/comment_paths.py)
+    path = Column(String(255), nullable=True)
+    depth = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -199,10 +231,27 @@ class Comment(Base):
     parent = relationship("Comment", remote_side=[id], backref="replies")
     reports = relationship("Report", back_populates="comment", cascade="all, delete-orphan")
 
+    # 게시글별 댓글 조회용 인덱스
+    __table_args__ = (
+        Index('ix_comments_post_deleted_created', 'post_id', 'is_deleted', 'created_at'),
+        # 최상위 댓글/답글 페이지 조회용 인덱스
+        Index('ix_comments_post_parent_created', 'post_id', 'parent_id', 'created_at'),
+        # 서브트리 범위 조회용 인덱스
+        Index('ix_comments_post_path', 'post_id', 'path'),
+    )
+
     def __repr__(self):
         return f"<Comment(id={self.id}, post_id={self.post_id}, author_id={self.author_id})>"
 
 
+def _report_target_id(context):
+    """신고 대상 ID 기본값 (게시글 신고는 post_id, 댓글 신고는 comment_id)"""
+    params = context.get_current_parameters()
+    if params.get('report_type') == ReportType.COMMENT:
+        return params.get('comment_id')
+    return params.get('post_id')
+
+
 class Report(Base):
     """신고 모델"""
     __tablename__ = 'reports'
@@ -212,6 +261,8 @@ class Report(Base):
     report_type = Column(Enum(ReportType), nullable=False)
     post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), nullable=True)
     comment_id = Column(Integer, ForeignKey('comments.id', ondelete='CASCADE'), nullable=True)
+    # 신고 대상 게시글/댓글 ID (중복 신고 확인용)
+    target_id = Column(Integer, default=_report_target_id, nullable=False)
     reason = Column(Text, nullable=False)
     status = Column(Enum(ReportStatus), default=ReportStatus.PENDING, nullable=False)
     admin_note = Column(Text, nullable=True)
@@ -226,6 +277,67 @@ class Report(Base):
     comment = relationship("Comment", back_populates="reports")
     processor = relationship("User", foreign_keys=[processed_by])
 
+    # 상태별 신고 목록 조회용 인덱스
+    __table_args__ = (
+        Index('ix_reports_status_created', 'status', 'created_at'),
+        # 대상별 신고 일괄 처리/복원용
+        Index('ix_reports_target_status', 'report_type', 'target_id', 'status'),
+        # 같은 대상에 대한 처리 대기 신고는 신고자당 하나 (부분 인덱스를 지원하지 않는 MySQL은 아래 생성 컬럼 인덱스 사용)
+        Index(
+            'uq_reports_pending_target', 'reporter_id', 'report_type', 'target_id', unique=True,
+            sqlite_where=text("status = 'PENDING'"), postgresql_where=text("status = 'PENDING'"),
+        ).ddl_if(dialect=('sqlite', 'postgresql')),
+    )
+
     def __repr__(self):
         return f"<Report(id={self.id}, report_type={self.report_type.value}, status={self.status.value})>"
 
+
+# MySQL: 처리 대기일 때만 1(그 외 NULL)인 생성 컬럼을 넣은 고유 인덱스로 같은 제약을 둠 (NULL끼리는 중복이 아님)
+# ORM에서는 읽고 쓰지 않으므로 매핑하지 않음
+MYSQL_REPORT_PENDING_KEY_DDL = (
+    "ALTER TABLE reports "
+    "ADD COLUMN pending_key TINYINT AS (IF(status = 'PENDING', 1, NULL)) VIRTUAL, "
+    "ADD UNIQUE INDEX uq_reports_pending_key (reporter_id, report_type, target_id, pending_key)"
+)
+event.listen(
+    Report.__table__, 'after_create', DDL(MYSQL_REPORT_PENDING_KEY_DDL).execute_if(dialect='mysql')
+)
+
+
+class ReportTarget(Base):
+    """신고 대상별 집계 모델 (관리자 신고 큐, 신고 작성/상태 변경 시 증분 유지)"""
+    __tablename__ = 'report_targets'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    target_type = Column(Enum(ReportType), nullable=False)
+    target_id = Column(Integer, nullable=False)
+    pending_count = Column(Integer, default=0, nullable=False)  # 처리 대기 신고 수
+    total_count = Column(Integer, default=0, nullable=False)  # 누적 신고 수
+    top_reasons = Column(Text, nullable=True)  # 자주 나온 신고 사유 JSON ([[사유, 횟수], ...])
+    first_reported_at = Column(DateTime, nullable=False)
+    last_reported_at = Column(DateTime, nullable=False)
+    hidden_at = Column(DateTime, nullable=True)  # 자동 숨김 시각
+
+    __table_args__ = (
+        UniqueConstraint('target_type', 'target_id', name='uq_report_targets_target'),
+        # 처리 대기 신고 수순 큐 조회용 인덱스
+        Index('ix_report_targets_pending', 'pending_count', 'id'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ReportTarget(target_type={self.target_type.value}, target_id={self.target_id}, "
+            f"pending_count={self.pending_count})>"
+        )
+
+
+class StatCounter(Base):
+    """집계 카운터 모델 (목록 전체 개수를 COUNT(*) 없이 조회)"""
+    __tablename__ = 'stat_counters'
+
+    key = Column(String(100), primary_key=True)  # 예: posts:published:3, users:active
+    value = Column(BigInteger, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<StatCounter(key={self.key}, value={self.value})>"
@@ -0,0 +1,26 @@
+"""
+게시글 검색 인덱스 재구축 스크립트
+SQLite는 FTS5 테이블이 없으면 생성 후 전체 게시글을 다시 색인
+"""
+from database import SessionLocal
+from utils import search as search_index
+
+
+def rebuild_search_index():
+    """검색 인덱스 재구축"""
+    db = SessionLocal()
+    try:
+        search_index.create_index(db)
+        backend = search_index.get_backend(db)
+        count = search_index.rebuild_index(db)
+        db.commit()
+        print(f"검색 인덱스를 재구축했습니다. (백엔드: {backend.name}, 게시글 {count}건)")
+    except Exception as e:
+        db.rollback()
+        print(f"오류 발생: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_search_index()
@@ -0,0 +1,35 @@
+"""
+집계 카운터 재계산 스크립트
+stat_counters 테이블을 게시글/회원/신고 원본 테이블 기준으로 다시 계산하고,
+게시글의 like_count/comment_count를 좋아요/댓글 테이블 기준으로 맞춤
+"""
+from database import SessionLocal
+from utils import counters, post_counters
+
+
+def reconcile_counters():
+    """집계 카운터 재계산"""
+    db = SessionLocal()
+    try:
+        changed = counters.rebuild(db)
+        db.commit()
+        print(f"집계 카운터를 재계산했습니다. (변경된 카운터 {changed}개)")
+
+        stats = post_counters.reconcile(db)
+        print(
+            f"게시글 카운터를 재계산했습니다. "
+            f"(게시글 {stats['posts']}개 중 {stats['changed']}개 수정, 동시 변경으로 {stats['skipped']}개 건너뜀)"
+        )
+        print(
+            f"  좋아요 수 오차 합계 {stats['like_drift']} (최대 {stats['max_like_drift']}), "
+            f"댓글 수 오차 합계 {stats['comment_drift']} (최대 {stats['max_comment_drift']})"
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"오류 발생: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    reconcile_counters()
@@ -0,0 +1,35 @@
+"""
+인기 점수 재감쇠 스크립트
+기준 시각을 현재로 옮기며 전체 hot_score를 축소 (cron 등으로 주기 실행, 예: 매일 1회)
+
+사용법: python redecay_hot_scores.py [--rebuild]
+  --rebuild: 작성/좋아요/댓글 시각으로 점수를 처음부터 다시 계산
+"""
+import sys
+
+from database import SessionLocal
+from utils import hot
+
+
+def redecay_hot_scores(rebuild=False):
+    """인기 점수 재감쇠"""
+    db = SessionLocal()
+    try:
+        if rebuild:
+            hot.rebase(db)
+            count = hot.rebuild(db)
+            db.commit()
+            print(f"인기 점수를 다시 계산했습니다. (게시글 {count}건)")
+        else:
+            count = hot.rebase(db)
+            db.commit()
+            print(f"인기 점수를 재감쇠했습니다. (게시글 {count}건)")
+    except Exception as e:
+        db.rollback()
+        print(f"오류 발생: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    redecay_hot_scores(rebuild='--rebuild' in sys.argv[1:])
@@ -2,10 +2,26 @@
 관리자 관련 API 라우트
 /admin/* 엔드포인트 포함
 """
-from flask import Blueprint, request, jsonify
+from datetime import datetime
+
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from database import SessionLocal
-from models import Report, ReportStatus, User, Post, Comment, UserRole, PostStatus
+from models import Report, ReportStatus, ReportTarget, ReportType, User, Post, Comment, UserRole, PostStatus
 from utils.auth import admin_required
+from utils import search as search_index
+from utils import counters
+from utils import export
+from utils import importer
+from utils import report_queue
+from utils.cache import invalidate_post_lists, invalidate_post_detail, cache_stats
+from utils.serializers import (
+    post_list_select, serialize_admin_post_row,
+    user_list_select, serialize_user_row,
+    report_list_select, serialize_report_row,
+    report_target_select, serialize_report_target_row,
+)
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
@@ -20,29 +36,53 @@ def get_reports():
     
     db = SessionLocal()
     try:
-        query = db.query(Report)
+        query = report_list_select()
+        report_status = ReportStatus[status.upper()] if status else None
+        
+        if report_status:
+            query = query.where(Report.status == report_status)
         
-        if status:
-            query = query.filter(Report.status == ReportStatus[status.upper()])
+        rows = db.execute(
+            query.order_by(Report.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
+        ).all()
+        total = counters.report_total(db, report_status)
         
-        reports = query.order_by(Report.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
-        total = query.count()
+        return jsonify({
+            'reports': [serialize_report_row(row, admin=True) for row in rows],
+            'total': total,
+            'page': page,
+            'per_page': per_page
+        }), 200
+    finally:
+        db.close()
+
+
+@admin_bp.route('/reports/queue', methods=['GET'])
+@admin_required
+def get_report_queue():
+    """
+    신고 큐 조회
+
+    대상(게시글/댓글)별로 묶어 처리 대기 신고 수가 많은 순으로 반환 (신고 대상별 집계 테이블만 조회)
+    """
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            report_target_select()
+            .where(ReportTarget.pending_count > 0)
+            .order_by(ReportTarget.pending_count.desc(), ReportTarget.id.desc())
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        ).all()
+        total = db.execute(
+            select(func.count()).select_from(ReportTarget).where(ReportTarget.pending_count > 0)
+        ).scalar()
         
         return jsonify({
-            'reports': [{
-                'id': report.id,
-                'report_type': report.report_type.value,
-                'post_id': report.post_id,
-                'comment_id': report.comment_id,
-                'reason': report.reason,
-                'status': report.status.value,
-                'reporter_id': report.reporter_id,
-                'reporter_nickname': report.reporter.nickname,
-                'admin_note': report.admin_note,
-                'processed_by': report.processed_by,
-                'processed_at': report.processed_at.isoformat() if report.processed_at else None,
-                'created_at': report.created_at.isoformat()
-            } for report in reports],
+            'targets': [serialize_report_target_row(row) for row in rows],
             'total': total,
             'page': page,
             'per_page': per_page
@@ -51,6 +91,43 @@ def get_reports():
         db.close()
 
 
+@admin_bp.route('/reports/queue/<target_type>/<int:target_id>/restore', methods=['POST'])
+@admin_required
+def restore_reported_target(target_type, target_id):
+    """
+    신고 누적으로 숨겨진 게시글/댓글 복구
+
+    대상을 되돌리고 처리 대기 신고는 모두 반려 처리 (처리 대기 신고 수가 0이 되어 바로 다시 숨겨지지 않음)
+    """
+    if target_type not in ('post', 'comment'):
+        return jsonify({'error': '잘못된 신고 유형입니다.'}), 400
+    report_type = ReportType[target_type.upper()]
+    data = request.get_json(silent=True) or {}
+    
+    db = SessionLocal()
+    try:
+        restore_args = {}
+        if data.get('admin_note'):
+            restore_args['note'] = data['admin_note']
+        restored = report_queue.restore(db, report_type, target_id, request.current_user_id, **restore_args)
+        if restored is None:
+            db.rollback()
+            if report_type == ReportType.POST:
+                return jsonify({'error': '숨겨진 게시글을 찾을 수 없습니다.'}), 404
+            return jsonify({'error': '숨겨진 댓글을 찾을 수 없습니다.'}), 404
+        db.commit()
+        report_queue.after_hide(restored)
+        
+        if report_type == ReportType.POST:
+            return jsonify({'message': '게시글이 다시 게시되었습니다.'}), 200
+        return jsonify({'message': '댓글이 복구되었습니다.'}), 200
+    except Exception as e:
+        db.rollback()
+        return jsonify({'error': f'신고 대상 복구 중 오류가 발생했습니다: {str(e)}'}), 500
+    finally:
+        db.close()
+
+
 @admin_bp.route('/reports/<int:report_id>', methods=['PUT'])
 @admin_required
 def update_report_status(report_id):
@@ -69,16 +146,24 @@ def update_report_status(report_id):
         if not report:
             return jsonify({'error': '신고를 찾을 수 없습니다.'}), 404
         
+        counters.report_status_changed(db, report.status, ReportStatus[status.upper()])
+        hidden = report_queue.status_changed(
+            db, report.report_type, report.target_id, report.status, ReportStatus[status.upper()]
+        )
         report.status = ReportStatus[status.upper()]
         report.admin_note = admin_note
         report.processed_by = request.current_user_id
         
-        from datetime import datetime
         report.processed_at = datetime.utcnow()
         
         db.commit()
+        report_queue.after_hide(hidden)
         
         return jsonify({'message': '신고 상태가 변경되었습니다.'}), 200
+    except IntegrityError:
+        # 대기 상태로 되돌리는데 같은 신고자의 같은 대상 처리 대기 신고가 이미 있는 경우
+        db.rollback()
+        return jsonify({'error': '같은 대상에 처리 대기 중인 신고가 이미 있습니다.'}), 409
     except Exception as e:
         db.rollback()
         return jsonify({'error': f'신고 상태 변경 중 오류가 발생했습니다: {str(e)}'}), 500
@@ -96,25 +181,23 @@ def get_users():
     
     db = SessionLocal()
     try:
-        query = db.query(User)
+        query = user_list_select()
         
         if search:
-            query = query.filter(
+            query = query.where(
                 User.email.contains(search) | User.nickname.contains(search)
             )
         
-        users = query.order_by(User.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
-        total = query.count()
+        rows = db.execute(
+            query.order_by(User.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
+        ).all()
+        if search:
+            total = db.execute(select(func.count()).select_from(query.subquery())).scalar()
+        else:
+            total = counters.get(db, counters.USERS_TOTAL)
         
         return jsonify({
-            'users': [{
-                'id': user.id,
-                'email': user.email,
-                'nickname': user.nickname,
-                'role': user.role.value,
-                'is_active': user.is_active,
-                'created_at': user.created_at.isoformat()
-            } for user in users],
+            'users': [serialize_user_row(row) for row in rows],
             'total': total,
             'page': page,
             'per_page': per_page
@@ -137,6 +220,7 @@ def update_user(user_id):
             return jsonify({'error': '회원을 찾을 수 없습니다.'}), 404
         
         if 'is_active' in data:
+            counters.user_active_changed(db, user.is_active, data['is_active'])
             user.is_active = data['is_active']
         if 'role' in data:
             user.role = UserRole[data['role'].upper()]
@@ -161,26 +245,19 @@ def get_all_posts():
     
     db = SessionLocal()
     try:
-        query = db.query(Post)
+        query = post_list_select()
+        post_status = PostStatus[status.upper()] if status else None
         
-        if status:
-            query = query.filter(Post.status == PostStatus[status.upper()])
+        if post_status:
+            query = query.where(Post.status == post_status)
         
-        posts = query.order_by(Post.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
-        total = query.count()
+        rows = db.execute(
+            query.order_by(Post.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
+        ).all()
+        total = counters.post_total(db, post_status)
         
         return jsonify({
-            'posts': [{
-                'id': post.id,
-                'title': post.title,
-                'author_id': post.author_id,
-                'author_nickname': post.author.nickname,
-                'status': post.status.value,
-                'view_count': post.view_count,
-                'like_count': post.like_count,
-                'comment_count': post.comment_count,
-                'created_at': post.created_at.isoformat()
-            } for post in posts],
+            'posts': [serialize_admin_post_row(row) for row in rows],
             'total': total,
             'page': page,
             'per_page': per_page
@@ -200,8 +277,12 @@ def delete_post_admin(post_id):
         if not post:
             return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
         
+        counters.post_changed(db, post.status, post.category_id, PostStatus.DELETED, post.category_id)
         post.status = PostStatus.DELETED
+        search_index.remove_post(db, post.id)
         db.commit()
+        invalidate_post_lists(post.category_id)
+        invalidate_post_detail(post.id)
         
         return jsonify({'message': '게시글이 삭제되었습니다.'}), 200
     except Exception as e:
@@ -210,3 +291,63 @@ def delete_post_admin(post_id):
     finally:
         db.close()
 
+
+@admin_bp.route('/cache/stats', methods=['GET'])
+@admin_required
+def get_cache_stats():
+    """캐시 적중/미스 통계 조회"""
+    return jsonify({'caches': cache_stats()}), 200
+
+
+@admin_bp.route('/export/<resource>', methods=['GET'])
+@admin_required
+def export_data(resource):
+    """게시글/회원/신고 전체 내보내기 (NDJSON 또는 CSV 스트리밍)"""
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in export.FORMATS:
+        return jsonify({'error': 'format은 ndjson 또는 csv여야 합니다.'}), 400
+    
+    query = export.build_query(
+        resource,
+        status=request.args.get('status'),
+        date_from=request.args.get('from'),
+        date_to=request.args.get('to'),
+    )
+    
+    @stream_with_context
+    def generate():
+        db = SessionLocal()
+        try:
+            yield from export.stream_rows(db, resource, query, fmt)
+        finally:
+            db.close()
+    
+    filename = f'{resource}-{datetime.utcnow():%Y%m%d%H%M%S}.{fmt}'
+    return Response(
+        generate(),
+        content_type=export.CONTENT_TYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+
+@admin_bp.route('/import/posts', methods=['POST'])
+@admin_required
+def import_posts():
+    """
+    게시글 일괄 가져오기 (요청 본문: NDJSON, 한 줄에 게시글 하나)
+    
+    본문을 줄 단위로 읽으며 batch_size건씩 INSERT/커밋하고, 잘못된 행은 오류 목록으로 반환
+    """
+    batch_size = request.args.get('batch_size', importer.DEFAULT_BATCH_SIZE, type=int)
+    
+    db = SessionLocal()
+    try:
+        report = importer.import_posts(db, request.stream, batch_size=batch_size)
+        if report.imported:
+            invalidate_post_lists(*report.category_ids)
+        return jsonify(report.to_dict()), 200
+    except Exception as e:
+        db.rollback()
+        return jsonify({'error': f'게시글 가져오기 중 오류가 발생했습니다: {str(e)}'}), 500
+    finally:
+        db.close()
@@ -14,6 +14,7 @@ from utils.oauth import (
 )
 from utils.validators import validate_request, LoginSchema, RegisterSchema
 from utils.errors import AuthenticationError, ValidationError, APIError
+from utils import counters
 import bcrypt
 import secrets
 
@@ -99,6 +100,7 @@ def register():
             is_active=True
         )
         db.add(user)
+        counters.user_created(db, is_active=True)
         db.commit()
         db.refresh(user)
 
@@ -214,6 +216,7 @@ def oauth_callback(provider):
             )
             db.add(user)
             db.flush()
+            counters.user_created(db, is_active=True)
             
             oauth_account = OAuthAccount(
                 user_id=user.id,
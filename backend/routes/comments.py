@@ -2,54 +2,203 @@
 댓글 관련 API 라우트
 /comments 엔드포인트 포함
 """
+from datetime import datetime
+
 from flask import Blueprint, request, jsonify
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from database import SessionLocal
 from models import Comment, Post
 from utils.auth import login_required
+from utils import comment_paths
+from utils import comment_tree
+from utils import comments
+from utils.cache import invalidate_post_lists
+from utils.http_cache import make_etag, not_modified, with_cache_headers
+from utils.pagination import keyset_paginate
+from utils.serializers import comment_select, replies_by_parent, serialize_comment_row
+
+# 페이지당 최대 항목 수
+MAX_PER_PAGE = 100
+# 최상위 댓글마다 함께 내려주는 답글 수 기본값
+DEFAULT_REPLIES = 3
 
 comments_bp = Blueprint('comments', __name__, url_prefix='/api/comments')
 
 
 @comments_bp.route('', methods=['GET'])
 def get_comments():
-    """댓글 목록 조회"""
+    """
+    댓글 목록 조회
+
+    최상위 댓글을 작성 순으로 커서 페이지네이션하고, 각 댓글에 답글 수와 처음 replies개 답글을 포함
+    """
+    post_id = request.args.get('post_id', type=int)
+    cursor = request.args.get('cursor')
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), MAX_PER_PAGE)
+    reply_limit = min(max(request.args.get('replies', DEFAULT_REPLIES, type=int), 0), MAX_PER_PAGE)
+    
+    if not post_id:
+        return jsonify({'error': 'post_id가 필요합니다.'}), 400
+    
+    db = SessionLocal()
+    try:
+        # 댓글 버전만 먼저 조회해 변경이 없으면 304
+        comment_version = db.execute(select(Post.comment_version).where(Post.id == post_id)).scalar()
+        etag = make_etag('comments', post_id, comment_version, cursor, per_page, reply_limit)
+        response = not_modified(etag)
+        if response:
+            return response
+        
+        rows, next_cursor, prev_cursor = keyset_paginate(
+            db,
+            comment_select().where(
+                Comment.post_id == post_id, Comment.parent_id.is_(None), Comment.is_deleted.is_(False)
+            ),
+            Comment.created_at, Comment.id, cursor, per_page, ascending=True
+        )
+        replies = replies_by_parent(db, [row.id for row in rows], reply_limit) if rows and reply_limit else {}
+        
+        return with_cache_headers(jsonify({
+            'comments': [serialize_comment_row(row, replies.get(row.id)) for row in rows],
+            'per_page': per_page,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        }), etag)
+    finally:
+        db.close()
+
+
+@comments_bp.route('/tree', methods=['GET'])
+def get_comment_tree():
+    """
+    게시글 댓글 트리 조회 (캐시된 스냅샷)
+
+    삭제되지 않은 댓글 전체를 경로 순서의 평면 목록으로 반환.
+    since_version을 주면 그 이후 변경분(changes)만 반환하고, 보관 범위를 벗어났으면 전체 목록을 반환
+    """
     post_id = request.args.get('post_id', type=int)
+    since_version = request.args.get('since_version', type=int)
     
     if not post_id:
         return jsonify({'error': 'post_id가 필요합니다.'}), 400
     
     db = SessionLocal()
     try:
-        comments = db.query(Comment).filter(
-            Comment.post_id == post_id,
-            Comment.is_deleted == False
-        ).order_by(Comment.created_at).all()
-        
-        # 댓글 트리 구조 생성
-        comment_dict = {}
-        root_comments = []
-        
-        for comment in comments:
-            comment_dict[comment.id] = {
-                'id': comment.id,
-                'post_id': comment.post_id,
-                'author_id': comment.author_id,
-                'author_nickname': comment.author.nickname,
-                'parent_id': comment.parent_id,
-                'content': comment.content,
-                'created_at': comment.created_at.isoformat(),
-                'updated_at': comment.updated_at.isoformat(),
-                'replies': []
-            }
-        
-        for comment in comments:
-            if comment.parent_id:
-                if comment.parent_id in comment_dict:
-                    comment_dict[comment.parent_id]['replies'].append(comment_dict[comment.id])
-            else:
-                root_comments.append(comment_dict[comment.id])
-        
-        return jsonify({'comments': root_comments}), 200
+        comment_version = db.execute(select(Post.comment_version).where(Post.id == post_id)).scalar()
+        if comment_version is None:
+            return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
+        
+        etag = make_etag('comment-tree', post_id, comment_version, since_version)
+        response = not_modified(etag)
+        if response:
+            return response
+        
+        snapshot = comment_tree.get_snapshot(db, post_id, comment_version)
+        changes = comment_tree.changes_since(snapshot, since_version) if since_version is not None else None
+        if changes is not None:
+            return with_cache_headers(jsonify({
+                'post_id': post_id,
+                'version': comment_version,
+                'since_version': since_version,
+                'changes': changes
+            }), etag)
+        
+        return with_cache_headers(jsonify({
+            'post_id': post_id,
+            'version': comment_version,
+            'comments': snapshot['comments']
+        }), etag)
+    finally:
+        db.close()
+
+
+@comments_bp.route('/<int:comment_id>/replies', methods=['GET'])
+def get_replies(comment_id):
+    """답글 목록 조회 (직속 답글을 작성 순으로 커서 페이지네이션)"""
+    cursor = request.args.get('cursor')
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), MAX_PER_PAGE)
+    
+    db = SessionLocal()
+    try:
+        parent = db.execute(
+            select(Comment.post_id, Comment.is_deleted, Post.comment_version)
+            .join(Post, Comment.post_id == Post.id)
+            .where(Comment.id == comment_id)
+        ).first()
+        if not parent or parent.is_deleted:
+            return jsonify({'error': '댓글을 찾을 수 없습니다.'}), 404
+        
+        etag = make_etag('replies', comment_id, parent.comment_version, cursor, per_page)
+        response = not_modified(etag)
+        if response:
+            return response
+        
+        rows, next_cursor, prev_cursor = keyset_paginate(
+            db,
+            comment_select().where(
+                Comment.post_id == parent.post_id, Comment.parent_id == comment_id, Comment.is_deleted.is_(False)
+            ),
+            Comment.created_at, Comment.id, cursor, per_page, ascending=True
+        )
+        
+        return with_cache_headers(jsonify({
+            'replies': [serialize_comment_row(row) for row in rows],
+            'per_page': per_page,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        }), etag)
+    finally:
+        db.close()
+
+
+@comments_bp.route('/<int:comment_id>/thread', methods=['GET'])
+def get_thread(comment_id):
+    """
+    댓글 스레드 조회 (댓글과 모든 하위 답글)
+
+    저장된 경로 순서(깊이 우선, 같은 부모 안에서는 작성 순)의 평면 목록을 반환하며 depth로 들여쓰기
+    """
+    cursor = request.args.get('cursor')
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), MAX_PER_PAGE)
+    max_depth = request.args.get('max_depth', type=int)
+    
+    if cursor is not None and not (cursor.isdigit() and len(cursor) % comment_paths.SEGMENT_WIDTH == 0):
+        return jsonify({'error': '유효하지 않은 커서입니다.'}), 400
+    
+    db = SessionLocal()
+    try:
+        root = db.execute(
+            select(Comment.post_id, Comment.path, Comment.depth, Comment.is_deleted, Post.comment_version)
+            .join(Post, Comment.post_id == Post.id)
+            .where(Comment.id == comment_id)
+        ).first()
+        if not root or root.is_deleted or root.path is None:
+            return jsonify({'error': '댓글을 찾을 수 없습니다.'}), 404
+        
+        etag = make_etag('thread', comment_id, root.comment_version, cursor, per_page, max_depth)
+        response = not_modified(etag)
+        if response:
+            return response
+        
+        # (post_id, path) 인덱스 범위 조회 한 번으로 표시 순서대로 읽음
+        query = comment_select().where(
+            Comment.post_id == root.post_id,
+            comment_paths.subtree_filter(root.path),
+            Comment.is_deleted.is_(False)
+        )
+        if cursor:
+            query = query.where(Comment.path > cursor)
+        if max_depth is not None:
+            query = query.where(Comment.depth <= root.depth + max(max_depth, 0))
+        rows = db.execute(query.order_by(Comment.path).limit(per_page + 1)).all()
+        next_cursor = rows[per_page - 1].path if len(rows) > per_page else None
+        
+        return with_cache_headers(jsonify({
+            'comments': [serialize_comment_row(row) for row in rows[:per_page]],
+            'per_page': per_page,
+            'next_cursor': next_cursor
+        }), etag)
     finally:
         db.close()
 
@@ -57,7 +206,12 @@ def get_comments():
 @comments_bp.route('', methods=['POST'])
 @login_required
 def create_comment():
-    """댓글 작성"""
+    """
+    댓글 작성
+
+    게시글 행은 읽지 않고 먼저 한 번의 UPDATE로 댓글 수/버전을 증가시키며(갱신된 행이 없으면 404),
+    부모 댓글은 그 뒤 한 번의 조회로 검증해 경로 계산과 댓글 트리 스냅샷 반영에 그대로 사용
+    """
     data = request.get_json()
     post_id = data.get('post_id')
     content = data.get('content')
@@ -68,28 +222,41 @@ def create_comment():
     
     db = SessionLocal()
     try:
-        # 게시글 존재 확인
-        post = db.query(Post).filter(Post.id == post_id).first()
+        now = datetime.utcnow()
+        # 게시글 댓글 수 증가 (게시글 존재 확인 겸, 같은 게시글의 댓글 쓰기는 이 행 잠금 순서대로 처리)
+        post = comments.change_post_comments(db, post_id, 1, now)
         if not post:
+            db.rollback()
             return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
         
-        comment = Comment(
-            post_id=post_id,
-            author_id=request.current_user_id,
-            parent_id=parent_id,
-            content=content
-        )
-        db.add(comment)
-        
-        # 게시글 댓글 수 증가
-        post.comment_count += 1
+        # 부모 댓글 확인 (같은 게시글의 삭제되지 않은 댓글인지 한 번에 조회, 최대 깊이 이내)
+        parent = None
+        if parent_id:
+            parent = db.execute(
+                comment_select()
+                .where(Comment.id == parent_id, Comment.post_id == post_id, Comment.is_deleted.is_(False))
+            ).first()
+            if not parent:
+                db.rollback()
+                return jsonify({'error': '답글을 달 댓글을 찾을 수 없습니다.'}), 404
+            if parent.depth >= comment_paths.MAX_DEPTH:
+                db.rollback()
+                return jsonify({'error': f'답글은 {comment_paths.MAX_DEPTH}단계까지만 달 수 있습니다.'}), 400
         
+        comment = comments.create(db, post_id, request.current_user_id, content, parent, now)
         db.commit()
+        invalidate_post_lists(post.category_id)
+        # 댓글 트리 스냅샷에 반영할 변경 (새 댓글, 답글 수가 바뀐 부모 댓글)
+        comment_tree.apply(post_id, post.comment_version, comment_tree.creation(post.comment_version, comment, parent))
         
         return jsonify({
             'id': comment.id,
             'message': '댓글이 작성되었습니다.'
         }), 201
+    except IntegrityError:
+        # 외래 키 검사가 켜진 DB에서 없는 게시글에 작성한 경우
+        db.rollback()
+        return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
     except Exception as e:
         db.rollback()
         return jsonify({'error': f'댓글 작성 중 오류가 발생했습니다: {str(e)}'}), 500
@@ -118,7 +285,12 @@ def update_comment(comment_id):
             return jsonify({'error': '수정 권한이 없습니다.'}), 403
         
         comment.content = content
+        db.flush()
+        post = comments.change_post_comments(db, comment.post_id)
+        changes = comment_tree.upserts(db, post.comment_version, [comment.id]) if post else []
         db.commit()
+        if post:
+            comment_tree.apply(comment.post_id, post.comment_version, changes)
         
         return jsonify({'message': '댓글이 수정되었습니다.'}), 200
     except Exception as e:
@@ -131,25 +303,24 @@ def update_comment(comment_id):
 @comments_bp.route('/<int:comment_id>', methods=['DELETE'])
 @login_required
 def delete_comment(comment_id):
-    """댓글 삭제 (소프트 삭제)"""
+    """
+    댓글 삭제 (소프트 삭제)
+
+    본인의 삭제되지 않은 댓글만 한 번의 UPDATE로 삭제하고, 실패한 경우에만 조회해 404/403 구분
+    """
     db = SessionLocal()
     try:
-        comment = db.query(Comment).filter(Comment.id == comment_id).first()
-        
-        if not comment:
-            return jsonify({'error': '댓글을 찾을 수 없습니다.'}), 404
-        
-        if comment.author_id != request.current_user_id:
+        deleted = comments.soft_delete(db, comment_id, author_id=request.current_user_id)
+        if not deleted:
+            author_id = db.execute(
+                select(Comment.author_id).where(Comment.id == comment_id, Comment.is_deleted.is_(False))
+            ).scalar()
+            if author_id is None:
+                return jsonify({'error': '댓글을 찾을 수 없습니다.'}), 404
             return jsonify({'error': '삭제 권한이 없습니다.'}), 403
         
-        comment.is_deleted = True
-        
-        # 게시글 댓글 수 감소
-        post = db.query(Post).filter(Post.id == comment.post_id).first()
-        if post:
-            post.comment_count = max(0, post.comment_count - 1)
-        
         db.commit()
+        comments.after_delete(deleted)
         
         return jsonify({'message': '댓글이 삭제되었습니다.'}), 200
     except Exception as e:
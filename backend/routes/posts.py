@@ -2,13 +2,38 @@
 게시글 관련 API 라우트
 /posts 엔드포인트 포함
 """
+import os
+
 from flask import Blueprint, request, jsonify
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
 from database import SessionLocal
-from models import Post, PostImage, PostLike, PostStatus, Category
+from models import Post, PostImage, PostStatus, Category, User
 from sqlalchemy import desc
 from utils.auth import login_required
+from utils.pagination import keyset_paginate
+from utils import search as search_index
+from utils import counters
+from utils import hot
+from utils import likes
+from utils import autosave
+from utils.cache import (
+    post_list_cache, post_list_key, invalidate_post_lists,
+    post_detail_cache, post_detail_key, invalidate_post_detail,
+)
+from utils.preview import apply_content
+from utils.serializers import (
+    post_list_select, serialize_post_row,
+    post_detail_select, post_images_by_post, serialize_post_detail_row,
+)
+from utils.uploads import image_metadata
+from utils.view_counts import record_view
+from utils.http_cache import conditional_json, data_etag, make_etag, not_modified, with_cache_headers
+
+# 페이지당 최대 항목 수
+MAX_PER_PAGE = 100
+# 상세 캐시 만료 후 다시 만드는 동안 이전 값을 제공할 수 있는 시간(초)
+POST_DETAIL_STALE_TTL = int(os.getenv('POST_DETAIL_CACHE_STALE_TTL', '30'))
 
 posts_bp = Blueprint('posts', __name__, url_prefix='/api/posts')
 
@@ -20,40 +45,146 @@ def get_posts():
     per_page = request.args.get('per_page', 20, type=int)
     category_id = request.args.get('category_id', type=int)
     search = request.args.get('search', '')
+    # 정렬: latest(최신순, 기본) / relevance(검색 관련도순, page 모드에서만)
+    sort = request.args.get('sort', 'latest')
+    # cursor 파라미터가 있으면 커서 모드 (빈 값이면 첫 페이지)
+    cursor = request.args.get('cursor')
+    include_total = request.args.get('include_total', 'false').lower() == 'true'
+    per_page = min(max(per_page, 1), MAX_PER_PAGE)
+    
+    # 커서는 (created_at, id) 기준이라 관련도순과 함께 쓸 수 없음
+    if sort == 'relevance' and cursor is not None:
+        return jsonify({'error': 'relevance 정렬은 커서 모드에서 사용할 수 없습니다.'}), 400
+    
+    # 비로그인 요청은 응답 캐시 사용 (게시글 변경 시 세대 번호로 무효화)
+    cache_key = None
+    if 'Authorization' not in request.headers:
+        cache_key = post_list_key(category_id, page, cursor, per_page, search, sort, include_total)
+        cached = post_list_cache().get(cache_key)
+        if cached is not None:
+            return conditional_json(cached['data'], cached['etag'])
     
     db = SessionLocal()
     try:
-        query = db.query(Post).filter(Post.status == PostStatus.PUBLISHED)
+        query = post_list_select().where(Post.status == PostStatus.PUBLISHED)
         
         if category_id:
-            query = query.filter(Post.category_id == category_id)
+            query = query.where(Post.category_id == category_id)
         
         if search:
-            query = query.filter(
-                Post.title.contains(search) | Post.content.contains(search)
+            query = search_index.apply_search(
+                db, query, search, by_relevance=(sort == 'relevance')
             )
         
-        posts = query.order_by(desc(Post.created_at)).offset((page - 1) * per_page).limit(per_page).all()
-        total = query.count()
+        if cursor is not None:
+            rows, next_cursor, prev_cursor = keyset_paginate(
+                db, query, Post.created_at, Post.id, cursor, per_page
+            )
+        else:
+            rows = db.execute(
+                query.order_by(desc(Post.created_at), desc(Post.id)).offset((page - 1) * per_page).limit(per_page)
+            ).all()
         
-        return jsonify({
-            'posts': [{
-                'id': post.id,
-                'title': post.title,
-                'content': post.content[:200],  # 미리보기
-                'author_id': post.author_id,
-                'author_nickname': post.author.nickname,
-                'category_id': post.category_id,
-                'category_name': post.category.name if post.category else None,
-                'view_count': post.view_count,
-                'like_count': post.like_count,
-                'comment_count': post.comment_count,
-                'created_at': post.created_at.isoformat(),
-                'updated_at': post.updated_at.isoformat()
-            } for post in posts],
+        # 검색이 없으면 집계 카운터에서 O(1)로 조회
+        if not search:
+            total = counters.post_total(db, PostStatus.PUBLISHED, category_id or None)
+        elif cursor is None or include_total:
+            total = db.execute(select(func.count()).select_from(query.order_by(None).subquery())).scalar()
+        else:
+            total = None
+        
+        result = {
+            'posts': [serialize_post_row(row) for row in rows],
             'total': total,
+            'per_page': per_page
+        }
+        if cursor is not None:
+            result['next_cursor'] = next_cursor
+            result['prev_cursor'] = prev_cursor
+        else:
+            result['page'] = page
+        
+        etag = data_etag(result)
+        if cache_key:
+            post_list_cache().set(cache_key, {'etag': etag, 'data': result})
+        
+        return conditional_json(result, etag)
+    finally:
+        db.close()
+
+
+@posts_bp.route('/hot', methods=['GET'])
+def get_hot_posts():
+    """인기 게시글 목록 조회 (시간 감쇠 점수순, 카테고리별 가능)"""
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    category_id = request.args.get('category_id', type=int)
+    per_page = min(max(per_page, 1), MAX_PER_PAGE)
+    
+    cache_key = None
+    if 'Authorization' not in request.headers:
+        cache_key = post_list_key(category_id, 'hot', page, per_page)
+        cached = post_list_cache().get(cache_key)
+        if cached is not None:
+            return conditional_json(cached['data'], cached['etag'])
+    
+    db = SessionLocal()
+    try:
+        # (status[, category_id], hot_score, id) 인덱스 범위만 읽음
+        query = post_list_select().where(Post.status == PostStatus.PUBLISHED)
+        if category_id:
+            query = query.where(Post.category_id == category_id)
+        rows = db.execute(
+            query.order_by(desc(Post.hot_score), desc(Post.id)).offset((page - 1) * per_page).limit(per_page)
+        ).all()
+        
+        result = {
+            'posts': [serialize_post_row(row) for row in rows],
+            'total': counters.post_total(db, PostStatus.PUBLISHED, category_id or None),
             'page': page,
             'per_page': per_page
+        }
+        
+        etag = data_etag(result)
+        if cache_key:
+            post_list_cache().set(cache_key, {'etag': etag, 'data': result})
+        
+        return conditional_json(result, etag)
+    finally:
+        db.close()
+
+
+@posts_bp.route('/batch', methods=['GET'])
+def get_posts_batch():
+    """
+    여러 게시글 한 번에 조회 (ids=1,2,3)
+    
+    요청한 순서대로 반환하며, 없거나 공개되지 않은 게시글 ID는 missing으로 알려줌.
+    조회수는 증가시키지 않음
+    """
+    raw_ids = [value.strip() for value in request.args.get('ids', '').split(',') if value.strip()]
+    if not raw_ids:
+        return jsonify({'error': 'ids를 입력해주세요.'}), 400
+    if not all(value.isdigit() for value in raw_ids):
+        return jsonify({'error': 'ids는 쉼표로 구분한 게시글 ID여야 합니다.'}), 400
+    post_ids = list(dict.fromkeys(int(value) for value in raw_ids))
+    if len(post_ids) > MAX_PER_PAGE:
+        return jsonify({'error': f'한 번에 최대 {MAX_PER_PAGE}개까지 조회할 수 있습니다.'}), 400
+    
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            post_detail_select().where(Post.id.in_(post_ids), Post.status == PostStatus.PUBLISHED)
+        ).all()
+        found = {row.id: row for row in rows}
+        images = post_images_by_post(db, list(found)) if found else {}
+        
+        return jsonify({
+            'posts': [
+                serialize_post_detail_row(found[post_id], images.get(post_id, []))
+                for post_id in post_ids if post_id in found
+            ],
+            'missing': [post_id for post_id in post_ids if post_id not in found]
         }), 200
     finally:
         db.close()
@@ -64,37 +195,59 @@ def get_post(post_id):
     """게시글 상세 조회"""
     db = SessionLocal()
     try:
-        post = db.query(Post).filter(
-            Post.id == post_id,
-            Post.status == PostStatus.PUBLISHED
+        # 본문/이미지를 읽기 전에 버전 값과 카운터만 조회해 ETag 비교
+        # (조회수는 수시로 바뀌므로 ETag에 포함하지 않음, 썸네일 반영은 이미지 버전으로 구분)
+        version = db.execute(
+            select(
+                Post.updated_at, Post.like_count, Post.comment_count,
+                User.updated_at.label('author_updated_at'), Post.image_version, Post.view_count
+            )
+            .join(User, Post.author_id == User.id)
+            .where(Post.id == post_id, Post.status == PostStatus.PUBLISHED)
         ).first()
         
-        if not post:
+        if not version:
             return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
         
-        # 조회수 증가
-        post.view_count += 1
-        db.commit()
+        # 조회수는 버퍼에 모았다가 일괄 반영 (상세 조회는 쓰기 트랜잭션 없이 처리, 304 응답도 조회로 집계)
+        pending_views = record_view(post_id)
         
-        return jsonify({
-            'id': post.id,
-            'title': post.title,
-            'content': post.content,
-            'author_id': post.author_id,
-            'author_nickname': post.author.nickname,
-            'category_id': post.category_id,
-            'category_name': post.category.name if post.category else None,
-            'view_count': post.view_count,
-            'like_count': post.like_count,
-            'comment_count': post.comment_count,
-            'images': [img.image_url for img in sorted(post.images, key=lambda x: x.order)],
-            'created_at': post.created_at.isoformat(),
-            'updated_at': post.updated_at.isoformat()
-        }), 200
+        etag = make_etag('post', post_id, *version[:5])
+        response = not_modified(etag)
+        if response:
+            return response
+        
+        # 본문은 캐시 (동시 미스는 한 요청만 DB 조회), 카운터는 위에서 읽은 최신 값으로 덮어씀
+        body = post_detail_cache().get_or_build(
+            post_detail_key(post_id),
+            lambda: _load_post_body(db, post_id),
+            version=make_etag(version.updated_at, version.author_updated_at, version.image_version),
+            stale_ttl=POST_DETAIL_STALE_TTL,
+        )
+        if body is None:
+            return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
+        
+        return with_cache_headers(jsonify(dict(
+            body,
+            view_count=version.view_count + pending_views,
+            like_count=version.like_count,
+            comment_count=version.comment_count
+        )), etag)
     finally:
         db.close()
 
 
+def _load_post_body(db, post_id):
+    """상세 캐시에 저장할 게시글 본문 (작성자/카테고리/이미지 포함, 카운터 제외)"""
+    row = db.execute(post_detail_select().where(Post.id == post_id)).first()
+    if row is None:
+        return None
+    body = serialize_post_detail_row(row, post_images_by_post(db, [post_id]).get(post_id, []))
+    for key in ('view_count', 'like_count', 'comment_count'):
+        body.pop(key)
+    return body
+
+
 @posts_bp.route('', methods=['POST'])
 @login_required
 def create_post():
@@ -117,22 +270,28 @@ def create_post():
             author_id=request.current_user_id,
             category_id=category_id,
             title=title,
-            content=content,
             status=post_status
         )
+        apply_content(post, content)
         db.add(post)
         db.flush()
+        counters.post_changed(db, None, None, post.status, post.category_id)
+        if post.status == PostStatus.PUBLISHED:
+            hot.add(db, post.id, hot.POST_WEIGHT)
         
         # 이미지 추가
         for idx, image_url in enumerate(images):
             post_image = PostImage(
                 post_id=post.id,
                 image_url=image_url,
-                order=idx
+                order=idx,
+                **image_metadata(image_url)
             )
             db.add(post_image)
         
+        search_index.index_post(db, post)
         db.commit()
+        invalidate_post_lists(category_id)
         
         return jsonify({
             'id': post.id,
@@ -161,16 +320,34 @@ def update_post(post_id):
         if post.author_id != request.current_user_id:
             return jsonify({'error': '수정 권한이 없습니다.'}), 403
         
+        if 'status' in data and post.status == PostStatus.HIDDEN:
+            return jsonify({'error': '신고 누적으로 숨겨진 게시글은 다시 게시할 수 없습니다.'}), 403
+        
+        # 반영 대기 중인 자동 저장은 이번 수정에 합침 (요청에 없는 항목만)
+        pending = autosave.take(post_id)
+        if pending is not None and post.status == PostStatus.DRAFT:
+            data = dict({'title': pending.title, 'content': pending.content}, **data)
+        
+        old_status, old_category_id = post.status, post.category_id
         if 'title' in data:
             post.title = data['title']
         if 'content' in data:
-            post.content = data['content']
+            apply_content(post, data['content'])
         if 'category_id' in data:
             post.category_id = data['category_id']
         if 'status' in data:
             post.status = PostStatus.PUBLISHED if data['status'] == 'published' else PostStatus.DRAFT
         
+        if 'title' in data or 'content' in data:
+            search_index.index_post(db, post)
+        counters.post_changed(db, old_status, old_category_id, post.status, post.category_id)
+        if old_status != PostStatus.PUBLISHED and post.status == PostStatus.PUBLISHED:
+            db.flush()
+            hot.add(db, post.id, hot.POST_WEIGHT)
+        
         db.commit()
+        invalidate_post_lists(old_category_id, post.category_id)
+        invalidate_post_detail(post.id)
         
         return jsonify({'message': '게시글이 수정되었습니다.'}), 200
     except Exception as e:
@@ -194,8 +371,13 @@ def delete_post(post_id):
         if post.author_id != request.current_user_id:
             return jsonify({'error': '삭제 권한이 없습니다.'}), 403
         
+        autosave.take(post_id)
+        counters.post_changed(db, post.status, post.category_id, PostStatus.DELETED, post.category_id)
         post.status = PostStatus.DELETED
+        search_index.remove_post(db, post.id)
         db.commit()
+        invalidate_post_lists(post.category_id)
+        invalidate_post_detail(post.id)
         
         return jsonify({'message': '게시글이 삭제되었습니다.'}), 200
     except Exception as e:
@@ -205,43 +387,164 @@ def delete_post(post_id):
         db.close()
 
 
+@posts_bp.route('/<int:post_id>/draft', methods=['GET'])
+@login_required
+def get_draft(post_id):
+    """임시저장 게시글 조회 (반영 대기 중인 자동 저장 포함)"""
+    db = SessionLocal()
+    try:
+        buffer = autosave.get_autosave_buffer()
+        state = buffer.current(post_id, lambda: _load_draft_state(db, post_id))
+        error = _check_draft_state(state)
+        if error:
+            return error
+        
+        return jsonify({
+            'id': post_id,
+            'title': state.title,
+            'content': state.content,
+            'content_hash': autosave.draft_hash(state.title, state.content),
+            'pending': buffer.is_pending(post_id)
+        }), 200
+    finally:
+        db.close()
+
+
+@posts_bp.route('/<int:post_id>/draft', methods=['PATCH'])
+@login_required
+def autosave_draft(post_id):
+    """
+    임시저장 자동 저장
+
+    전체 본문(content) 또는 base_hash 기준 부분 변경(patches)을 받아 메모리에 모았다가
+    DRAFT_AUTOSAVE_WINDOW초마다 게시글별 마지막 상태만 DB에 반영
+    """
+    data = request.get_json() or {}
+    base_hash = data.get('base_hash')
+    patches = data.get('patches')
+    
+    if 'content' in data and patches is not None:
+        return jsonify({'error': 'content와 patches는 함께 보낼 수 없습니다.'}), 400
+    if patches is not None and (not base_hash or not isinstance(patches, list)):
+        return jsonify({'error': 'patches는 base_hash와 함께 목록으로 보내야 합니다.'}), 400
+    for key in ('title', 'content'):
+        if key in data and not isinstance(data[key], str):
+            return jsonify({'error': f'{key}는 문자열이어야 합니다.'}), 400
+    
+    def change(state):
+        error = _check_draft_state(state)
+        if error:
+            return None, (error, None, False)
+        
+        current_hash = autosave.draft_hash(state.title, state.content)
+        if base_hash and base_hash != current_hash:
+            return None, (_draft_conflict(current_hash), None, False)
+        
+        title = data.get('title', state.title)
+        content = data.get('content', state.content)
+        if patches:
+            try:
+                content = autosave.apply_patches(content, patches)
+            except ValueError as e:
+                return None, ((jsonify({'error': str(e)}), 400), None, False)
+        
+        content_hash = autosave.draft_hash(title, content)
+        # 내용이 같으면 저장하지 않음
+        if content_hash == current_hash:
+            return None, (None, content_hash, False)
+        draft = autosave.Draft(post_id, state.author_id, title, content, state.updated_at)
+        return draft, (None, content_hash, True)
+    
+    db = SessionLocal()
+    try:
+        buffer = autosave.get_autosave_buffer()
+        # 버퍼 상태 확인과 저장을 반영과 같은 잠금 안에서 처리 (반영 중 들어온 자동 저장 유실 방지)
+        error, content_hash, saved = buffer.update(post_id, lambda: _load_draft_state(db, post_id), change)
+        if error:
+            return error
+        
+        return jsonify({
+            'content_hash': content_hash,
+            'saved': saved,
+            'pending': buffer.is_pending(post_id)
+        }), 200
+    finally:
+        db.close()
+
+
+def _load_draft_state(db, post_id):
+    return db.execute(
+        select(Post.author_id, Post.status, Post.title, Post.content, Post.updated_at)
+        .where(Post.id == post_id)
+    ).first()
+
+
+def _check_draft_state(state):
+    """자동 저장 대상 확인 (작성자 본인의 임시저장 게시글), 문제가 있으면 오류 응답"""
+    if state is None or state.status == PostStatus.DELETED:
+        return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
+    if state.author_id != request.current_user_id:
+        return jsonify({'error': '수정 권한이 없습니다.'}), 403
+    if state.status != PostStatus.DRAFT:
+        return jsonify({'error': '임시저장 게시글만 자동 저장할 수 있습니다.'}), 409
+    return None
+
+
+def _draft_conflict(content_hash):
+    return jsonify({
+        'error': '다른 곳에서 변경된 임시저장입니다. 전체 내용을 다시 보내주세요.',
+        'content_hash': content_hash
+    }), 409
+
+
 @posts_bp.route('/<int:post_id>/like', methods=['POST'])
 @login_required
 def like_post(post_id):
-    """게시글 좋아요"""
+    """게시글 좋아요 (토글)"""
+    return _change_like(post_id, 'toggle')
+
+
+@posts_bp.route('/<int:post_id>/like', methods=['PUT'])
+@login_required
+def put_like(post_id):
+    """게시글 좋아요 (이미 좋아요 상태면 변화 없음)"""
+    return _change_like(post_id, 'like')
+
+
+@posts_bp.route('/<int:post_id>/like', methods=['DELETE'])
+@login_required
+def delete_like(post_id):
+    """게시글 좋아요 취소 (좋아요 상태가 아니면 변화 없음)"""
+    return _change_like(post_id, 'unlike')
+
+
+def _change_like(post_id, mode):
+    """좋아요 변경 공통 처리 (유니크 키와 SQL 측 증감으로 동시 요청에도 카운터 유지)"""
     db = SessionLocal()
     try:
-        post = db.query(Post).filter(Post.id == post_id).first()
+        post = db.execute(select(Post.category_id).where(Post.id == post_id)).first()
         
         if not post:
             return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
         
-        # 이미 좋아요 했는지 확인
-        existing_like = db.query(PostLike).filter(
-            PostLike.user_id == request.current_user_id,
-            PostLike.post_id == post_id
-        ).first()
-        
-        if existing_like:
-            # 좋아요 취소
-            db.delete(existing_like)
-            post.like_count = max(0, post.like_count - 1)
-            message = '좋아요가 취소되었습니다.'
+        user_id = request.current_user_id
+        if mode == 'toggle':
+            liked, like_count = likes.toggle_like(db, user_id, post_id)
+            changed = True
+        elif mode == 'like':
+            liked = True
+            changed, like_count = likes.add_like(db, user_id, post_id)
         else:
-            # 좋아요 추가
-            new_like = PostLike(
-                user_id=request.current_user_id,
-                post_id=post_id
-            )
-            db.add(new_like)
-            post.like_count += 1
-            message = '좋아요가 추가되었습니다.'
-        
+            liked = False
+            changed, like_count = likes.remove_like(db, user_id, post_id)
         db.commit()
+        if changed:
+            invalidate_post_lists(post.category_id)
         
         return jsonify({
-            'message': message,
-            'like_count': post.like_count
+            'message': '좋아요가 추가되었습니다.' if liked else '좋아요가 취소되었습니다.',
+            'liked': liked,
+            'like_count': like_count
         }), 200
     except Exception as e:
         db.rollback()
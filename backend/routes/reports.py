@@ -3,9 +3,16 @@
 /reports 엔드포인트 포함
 """
 from flask import Blueprint, request, jsonify
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from database import SessionLocal
-from models import Report, ReportType, ReportStatus, Post, Comment
+from models import Report, ReportType, ReportStatus
 from utils.auth import login_required
+from utils.errors import NotFoundError
+from utils import counters
+from utils import report_queue
+from utils.serializers import report_list_select, serialize_report_row
+from utils.sql import dialect_insert
 
 reports_bp = Blueprint('reports', __name__, url_prefix='/api/reports')
 
@@ -32,46 +39,39 @@ def create_report():
     if report_type == 'comment' and not comment_id:
         return jsonify({'error': 'comment_id가 필요합니다.'}), 400
     
+    report_type = ReportType[report_type.upper()]
+    target_id = comment_id if report_type == ReportType.COMMENT else post_id
+    
     db = SessionLocal()
     try:
-        # 중복 신고 확인
-        existing_report = db.query(Report).filter(
-            Report.reporter_id == request.current_user_id,
-            Report.report_type == ReportType[report_type.upper()],
-            Report.post_id == post_id if report_type == 'post' else None,
-            Report.comment_id == comment_id if report_type == 'comment' else None,
-            Report.status == ReportStatus.PENDING
-        ).first()
-        
-        if existing_report:
+        # 중복 신고(같은 대상의 처리 대기 신고)는 고유 인덱스로 걸러지고, 대상이 없으면 외래 키 오류
+        report_id = _insert_pending_report(db, {
+            'reporter_id': request.current_user_id,
+            'report_type': report_type,
+            'post_id': post_id,
+            'comment_id': comment_id,
+            'target_id': target_id,
+            'reason': reason,
+            'status': ReportStatus.PENDING,
+        })
+        if report_id is None:
+            db.rollback()
             return jsonify({'error': '이미 신고한 항목입니다.'}), 400
         
-        # 대상 존재 확인
-        if report_type == 'post':
-            post = db.query(Post).filter(Post.id == post_id).first()
-            if not post:
-                return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
-        
-        if report_type == 'comment':
-            comment = db.query(Comment).filter(Comment.id == comment_id).first()
-            if not comment:
-                return jsonify({'error': '댓글을 찾을 수 없습니다.'}), 404
-        
-        report = Report(
-            reporter_id=request.current_user_id,
-            report_type=ReportType[report_type.upper()],
-            post_id=post_id,
-            comment_id=comment_id,
-            reason=reason,
-            status=ReportStatus.PENDING
-        )
-        db.add(report)
+        counters.report_status_changed(db, None, ReportStatus.PENDING)
+        hidden = report_queue.reported(db, report_type, target_id, reason)
         db.commit()
+        report_queue.after_hide(hidden)
         
         return jsonify({
-            'id': report.id,
+            'id': report_id,
             'message': '신고가 접수되었습니다.'
         }), 201
+    except (IntegrityError, NotFoundError):
+        db.rollback()
+        if report_type == ReportType.POST:
+            return jsonify({'error': '게시글을 찾을 수 없습니다.'}), 404
+        return jsonify({'error': '댓글을 찾을 수 없습니다.'}), 404
     except Exception as e:
         db.rollback()
         return jsonify({'error': f'신고 처리 중 오류가 발생했습니다: {str(e)}'}), 500
@@ -79,6 +79,36 @@ def create_report():
         db.close()
 
 
+def _insert_pending_report(db, values):
+    """
+    처리 대기 신고 추가, 같은 신고자의 같은 대상 처리 대기 신고가 이미 있으면 추가하지 않고 None 반환
+
+    SQLite/PostgreSQL은 부분 고유 인덱스(uq_reports_pending_target)에 대한 INSERT ... ON CONFLICT DO NOTHING,
+    MySQL은 생성 컬럼 고유 인덱스(uq_reports_pending_key)에 대한 INSERT IGNORE로 한 문장에 처리
+    """
+    table = Report.__table__
+    if db.get_bind().dialect.name == 'mysql':
+        result = db.execute(dialect_insert(db, table).values(**values).prefix_with('IGNORE'))
+        if result.rowcount == 1:
+            return result.lastrowid
+        # IGNORE는 외래 키 오류도 경고로 바꾸므로, 처리 대기 신고가 없는데 추가되지 않았으면 대상이 없는 것
+        duplicate = select(table.c.id).where(
+            table.c.reporter_id == values['reporter_id'],
+            table.c.report_type == values['report_type'],
+            table.c.target_id == values['target_id'],
+            table.c.status == ReportStatus.PENDING,
+        )
+        if db.execute(duplicate.exists().select()).scalar():
+            return None
+        raise NotFoundError()
+    
+    stmt = dialect_insert(db, table).values(**values).on_conflict_do_nothing()
+    if db.get_bind().dialect.insert_returning:
+        return db.execute(stmt.returning(table.c.id)).scalar()
+    result = db.execute(stmt)
+    return result.inserted_primary_key[0] if result.rowcount == 1 else None
+
+
 @reports_bp.route('', methods=['GET'])
 @login_required
 def get_reports():
@@ -90,27 +120,19 @@ def get_reports():
     
     db = SessionLocal()
     try:
-        query = db.query(Report)
+        query = report_list_select()
+        report_status = ReportStatus[status.upper()] if status else None
         
-        if status:
-            query = query.filter(Report.status == ReportStatus[status.upper()])
+        if report_status:
+            query = query.where(Report.status == report_status)
         
-        reports = query.order_by(Report.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
-        total = query.count()
+        rows = db.execute(
+            query.order_by(Report.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
+        ).all()
+        total = counters.report_total(db, report_status)
         
         return jsonify({
-            'reports': [{
-                'id': report.id,
-                'report_type': report.report_type.value,
-                'post_id': report.post_id,
-                'comment_id': report.comment_id,
-                'reason': report.reason,
-                'status': report.status.value,
-                'reporter_id': report.reporter_id,
-                'reporter_nickname': report.reporter.nickname,
-                'admin_note': report.admin_note,
-                'created_at': report.created_at.isoformat()
-            } for report in reports],
+            'reports': [serialize_report_row(row) for row in rows],
             'total': total,
             'page': page,
             'per_page': per_page
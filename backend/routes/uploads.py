@@ -0,0 +1,25 @@
+"""
+업로드 관련 API 라우트
+/uploads 엔드포인트 포함
+"""
+from flask import Blueprint, request, jsonify
+from utils.auth import login_required
+from utils import uploads
+
+uploads_bp = Blueprint('uploads', __name__, url_prefix='/api/uploads')
+
+
+@uploads_bp.route('/images', methods=['POST'])
+@login_required
+def upload_image():
+    """
+    이미지 업로드 (multipart/form-data, file 필드)
+
+    저장 후 바로 응답하며, 썸네일은 백그라운드에서 생성되어 게시글 이미지에 반영됨
+    """
+    file = request.files.get('file')
+    if file is None or not file.filename:
+        return jsonify({'error': '업로드할 파일을 선택해주세요.'}), 400
+
+    result = uploads.save_upload(file.stream)
+    return jsonify(result), 201 if result['created'] else 200
@@ -0,0 +1,107 @@
+"""
+pytest 공통 설정
+임시 SQLite 데이터베이스와 테스트용 Flask 앱/사용자 픽스처
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# database 모듈 import 전에 테스트용 DB와 설정 지정
+_TEST_DB_DIR = tempfile.mkdtemp(prefix='community-test-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_TEST_DB_DIR, 'test.db')}"
+os.environ['RATELIMIT_ENABLED'] = 'False'
+os.environ['FLASK_DEBUG'] = 'False'
+# 조회수는 백그라운드 스레드 없이 테스트에서 직접 반영
+os.environ['VIEW_COUNT_FLUSH_INTERVAL'] = '0'
+# 자동 저장은 모으지 않고 바로 반영 (병합은 테스트에서 버퍼를 바꿔 확인)
+os.environ['DRAFT_AUTOSAVE_WINDOW'] = '0'
+# 인기 점수 기준 시각은 캐시하지 않음 (재감쇠가 기다리지 않도록, 캐시는 테스트에서 바꿔 확인)
+os.environ['HOT_STATE_TTL'] = '0'
+
+from sqlalchemy import event  # noqa: E402
+
+from app import create_app  # noqa: E402
+from database import engine, SessionLocal  # noqa: E402
+from models import Base, Post, PostStatus, User, UserRole  # noqa: E402
+from utils.auth import generate_token  # noqa: E402
+from utils import cache, hot, view_counts  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    flask_app = create_app()
+    flask_app.config['TESTING'] = True
+    return flask_app
+
+
+@pytest.fixture(autouse=True)
+def reset_db():
+    """테스트마다 테이블과 캐시 초기화"""
+    SessionLocal.remove()
+    cache._caches.clear()
+    hot._cached.clear()
+    if view_counts._buffer is not None:
+        view_counts._buffer.pending.drain()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    SessionLocal.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def db():
+    """라우트가 사용하는 scoped session과 분리된 테스트용 세션"""
+    session = SessionLocal.session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_user(db):
+    """사용자 생성 후 (user, 인증 헤더) 반환"""
+    def _make_user(nickname, role=UserRole.USER):
+        user = User(nickname=nickname, email=f'{nickname}@example.com', role=role)
+        db.add(user)
+        db.commit()
+        headers = {'Authorization': f'Bearer {generate_token(user.id, role)}'}
+        return user, headers
+    return _make_user
+
+
+@pytest.fixture
+def make_post(db):
+    """게시글 생성 후 ID 반환 (기본은 공개 상태)"""
+    def _make_post(author, title='제목', **fields):
+        fields.setdefault('content', '내용')
+        fields.setdefault('status', PostStatus.PUBLISHED)
+        post = Post(title=title, author_id=author.id, **fields)
+        db.add(post)
+        db.commit()
+        return post.id
+    return _make_post
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 문 수 집계"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
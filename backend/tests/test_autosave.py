@@ -0,0 +1,191 @@
+"""
+임시저장 자동 저장 테스트
+같은 게시글의 자동 저장이 한 번의 UPDATE로 합쳐지고, 변경 없는 저장/버전 불일치는 쓰지 않는지 확인
+"""
+import threading
+
+import pytest
+from sqlalchemy import update
+
+from database import engine
+from models import Post, PostStatus
+from utils import autosave
+from utils.autosave import AutosaveBuffer
+
+from conftest import count_queries
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    """모았다가 flush() 때만 반영하는 버퍼"""
+    buffer = AutosaveBuffer(engine, window=3600)
+    monkeypatch.setattr(autosave, '_buffer', buffer)
+    yield buffer
+    buffer.close()
+
+
+def _make_draft(db, author, content='안녕하세요'):
+    post = Post(title='임시 제목', content=content, author_id=author.id, status=PostStatus.DRAFT)
+    db.add(post)
+    db.commit()
+    return post.id
+
+
+def _saved_post(db, post_id):
+    db.expire_all()
+    return db.get(Post, post_id)
+
+
+def test_autosaves_are_coalesced_into_one_write(client, db, make_user, buffer):
+    author, headers = make_user('writer')
+    post_id = _make_draft(db, author)
+    content_hash = client.get(f'/api/posts/{post_id}/draft', headers=headers).get_json()['content_hash']
+
+    with count_queries() as statements:
+        for patch in (
+            {'offset': 5, 'insert': ' 여러분'},
+            {'offset': 9, 'insert': '!'},
+            {'offset': 9, 'delete': 1, 'insert': '?'},
+        ):
+            response = client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={
+                'base_hash': content_hash, 'patches': [patch],
+            })
+            assert response.status_code == 200
+            body = response.get_json()
+            assert body['saved'] is True and body['pending'] is True
+            content_hash = body['content_hash']
+    assert not [s for s in statements if s.lstrip().upper().startswith('UPDATE')]
+
+    draft = client.get(f'/api/posts/{post_id}/draft', headers=headers).get_json()
+    assert draft['content'] == '안녕하세요 여러분?'
+    assert draft['pending'] is True
+    assert _saved_post(db, post_id).content == '안녕하세요'
+
+    with count_queries() as statements:
+        assert buffer.flush() == 1
+    assert len([s for s in statements if s.lstrip().upper().startswith('UPDATE')]) == 1
+    post = _saved_post(db, post_id)
+    assert post.content == '안녕하세요 여러분?'
+    assert post.preview == '안녕하세요 여러분?'
+
+
+def test_unchanged_autosave_is_skipped(client, db, make_user, buffer):
+    author, headers = make_user('writer')
+    post_id = _make_draft(db, author)
+
+    response = client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={
+        'title': '임시 제목', 'content': '안녕하세요',
+    })
+    assert response.get_json()['saved'] is False
+    assert not buffer.is_pending(post_id)
+
+
+def test_stale_base_hash_is_rejected(client, db, make_user, buffer):
+    author, headers = make_user('writer')
+    post_id = _make_draft(db, author)
+    base_hash = client.get(f'/api/posts/{post_id}/draft', headers=headers).get_json()['content_hash']
+    client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={'content': '다른 탭에서 수정'})
+
+    response = client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={
+        'base_hash': base_hash, 'patches': [{'offset': 0, 'insert': '!'}],
+    })
+    assert response.status_code == 409
+    assert response.get_json()['content_hash'] == autosave.draft_hash('임시 제목', '다른 탭에서 수정')
+
+
+def test_autosave_requires_own_draft(client, db, make_user):
+    author, headers = make_user('writer')
+    _, other_headers = make_user('other')
+    post_id = _make_draft(db, author)
+
+    assert client.patch(f'/api/posts/{post_id}/draft', headers=other_headers,
+                        json={'content': '남의 글'}).status_code == 403
+
+    client.put(f'/api/posts/{post_id}', headers=headers, json={'status': 'published'})
+    assert client.patch(f'/api/posts/{post_id}/draft', headers=headers,
+                        json={'content': '발행 후'}).status_code == 409
+
+
+def test_publish_includes_pending_autosave(client, db, make_user, buffer):
+    author, headers = make_user('writer')
+    post_id = _make_draft(db, author)
+    client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={'content': '자동 저장된 본문'})
+
+    client.put(f'/api/posts/{post_id}', headers=headers, json={'status': 'published'})
+
+    assert not buffer.is_pending(post_id)
+    post = _saved_post(db, post_id)
+    assert post.status == PostStatus.PUBLISHED
+    assert post.content == '자동 저장된 본문'
+
+
+def test_flush_skips_drafts_changed_elsewhere(client, db, make_user, buffer):
+    author, headers = make_user('writer')
+    post_id = _make_draft(db, author)
+    client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={'content': '이 워커의 자동 저장'})
+
+    # 다른 워커가 먼저 반영한 경우
+    db.execute(update(Post).where(Post.id == post_id).values(content='다른 워커의 자동 저장'))
+    db.commit()
+
+    assert buffer.flush() == 0
+    assert _saved_post(db, post_id).content == '다른 워커의 자동 저장'
+
+
+def test_autosave_during_flush_is_not_lost(client, db, make_user, buffer):
+    author, headers = make_user('writer')
+    post_id = _make_draft(db, author)
+    client.patch(f'/api/posts/{post_id}/draft', headers=headers, json={'content': '첫 번째'})
+
+    entered, release = threading.Event(), threading.Event()
+
+    def change(state):
+        # 반영 대기 중인 상태를 읽은 직후 반영이 시작되는 경우
+        entered.set()
+        release.wait(5)
+        return autosave.Draft(post_id, state.author_id, state.title, '두 번째', state.updated_at), None
+
+    saver = threading.Thread(target=buffer.update, args=(post_id, lambda: None, change))
+    saver.start()
+    entered.wait(5)
+    flusher = threading.Thread(target=buffer.flush)
+    flusher.start()
+    release.set()
+    saver.join()
+    flusher.join()
+
+    buffer.flush()
+    assert not buffer.is_pending(post_id)
+    assert _saved_post(db, post_id).content == '두 번째'
+
+
+def test_flush_does_not_block_autosave_of_other_posts(client, db, make_user, buffer, monkeypatch):
+    author, headers = make_user('writer')
+    flushing_id = _make_draft(db, author)
+    other_id = _make_draft(db, author)
+    client.patch(f'/api/posts/{flushing_id}/draft', headers=headers, json={'content': '반영 중'})
+
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_preview(content):
+        # 반영 트랜잭션 안에서 멈춤
+        entered.set()
+        release.wait(5)
+        return content
+
+    monkeypatch.setattr(autosave, 'make_preview', slow_preview)
+    flusher = threading.Thread(target=buffer.flush)
+    flusher.start()
+    try:
+        assert entered.wait(5)
+        response = client.patch(f'/api/posts/{other_id}/draft', headers=headers, json={'content': '다른 글'})
+        assert response.status_code == 200
+        assert response.get_json()['pending'] is True
+        assert flusher.is_alive()
+    finally:
+        release.set()
+        flusher.join()
+
+    assert _saved_post(db, flushing_id).content == '반영 중'
+    buffer.flush()
+    assert _saved_post(db, other_id).content == '다른 글'
@@ -0,0 +1,105 @@
+"""
+댓글 경로 테스트
+작성 시 path/depth 유지, 스레드 조회 순서, 깊이 제한, 기존 댓글 백필 확인
+"""
+from models import Comment
+from utils import comment_paths
+
+from conftest import count_queries
+
+
+def _comment(client, headers, post_id, content, parent_id=None):
+    response = client.post('/api/comments', headers=headers, json={
+        'post_id': post_id, 'content': content, 'parent_id': parent_id,
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['id']
+
+
+def test_thread_is_returned_in_display_order(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    root = _comment(client, headers, post_id, 'root')
+    a = _comment(client, headers, post_id, 'a', root)
+    b = _comment(client, headers, post_id, 'b', root)
+    a1 = _comment(client, headers, post_id, 'a1', a)
+    b1 = _comment(client, headers, post_id, 'b1', b)
+    a2 = _comment(client, headers, post_id, 'a2', a)
+    a1x = _comment(client, headers, post_id, 'a1x', a1)
+    _comment(client, headers, post_id, 'other root')
+
+    stored = db.get(Comment, a1x)
+    assert stored.depth == 3
+    assert stored.path == ''.join(comment_paths.segment(i) for i in (root, a, a1, a1x))
+
+    with count_queries() as statements:
+        comments = client.get(f'/api/comments/{root}/thread').get_json()['comments']
+    assert len(statements) == 2
+    assert [(c['id'], c['depth']) for c in comments] == [
+        (root, 0), (a, 1), (a1, 2), (a1x, 3), (a2, 2), (b, 1), (b1, 2),
+    ]
+
+    subtree = client.get(f'/api/comments/{a}/thread?max_depth=1').get_json()['comments']
+    assert [c['id'] for c in subtree] == [a, a1, a2]
+
+
+def test_thread_pagination(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    root = _comment(client, headers, post_id, 'root')
+    ids = [root] + [_comment(client, headers, post_id, f'reply {i}', root) for i in range(4)]
+
+    seen = []
+    url = f'/api/comments/{root}/thread?per_page=2'
+    response = client.get(url).get_json()
+    seen += [c['id'] for c in response['comments']]
+    while response['next_cursor']:
+        response = client.get(f"{url}&cursor={response['next_cursor']}").get_json()
+        seen += [c['id'] for c in response['comments']]
+    assert seen == ids
+
+    assert client.get(f'{url}&cursor=abc').status_code == 400
+
+
+def test_reply_depth_and_parent_are_validated(client, db, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(comment_paths, 'MAX_DEPTH', 1)
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    other_post_id = make_post(author)
+    root = _comment(client, headers, post_id, 'root')
+    reply = _comment(client, headers, post_id, 'reply', root)
+
+    response = client.post('/api/comments', headers=headers, json={
+        'post_id': post_id, 'content': 'too deep', 'parent_id': reply,
+    })
+    assert response.status_code == 400
+
+    response = client.post('/api/comments', headers=headers, json={
+        'post_id': other_post_id, 'content': 'wrong post', 'parent_id': root,
+    })
+    assert response.status_code == 404
+
+
+def test_backfill_fills_existing_comments(db, make_user, make_post):
+    author, _ = make_user('writer')
+    post_id = make_post(author)
+    root = Comment(post_id=post_id, author_id=author.id, content='root')
+    db.add(root)
+    db.flush()
+    reply = Comment(post_id=post_id, author_id=author.id, content='reply', parent_id=root.id)
+    db.add(reply)
+    db.flush()
+    nested = Comment(post_id=post_id, author_id=author.id, content='nested', parent_id=reply.id)
+    db.add(nested)
+    db.commit()
+    updated_at = nested.updated_at
+
+    assert comment_paths.backfill(db, batch_size=1) == 3
+
+    db.expire_all()
+    assert db.get(Comment, nested.id).path == ''.join(
+        comment_paths.segment(i) for i in (root.id, reply.id, nested.id)
+    )
+    assert db.get(Comment, nested.id).depth == 2
+    assert db.get(Comment, nested.id).updated_at == updated_at
+    assert comment_paths.backfill(db) == 0
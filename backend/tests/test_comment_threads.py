@@ -0,0 +1,79 @@
+"""
+댓글 페이지네이션 테스트
+최상위 댓글 커서 페이지, 답글 수/답글 미리보기, 답글 목록 엔드포인트 확인
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from models import Comment, Post, PostStatus
+
+
+@pytest.fixture
+def thread(db, make_user):
+    """최상위 댓글 5개, 첫 댓글에 답글 4개(하나는 삭제, 하나에는 답글 1개)"""
+    author, _ = make_user('writer')
+    post = Post(title='제목', content='내용', author_id=author.id, status=PostStatus.PUBLISHED)
+    db.add(post)
+    db.flush()
+    base = datetime(2026, 1, 1)
+
+    def add(content, minutes, parent=None, is_deleted=False):
+        comment = Comment(
+            post_id=post.id, author_id=author.id, content=content, is_deleted=is_deleted,
+            parent_id=parent.id if parent else None, created_at=base + timedelta(minutes=minutes),
+        )
+        db.add(comment)
+        db.flush()
+        return comment
+
+    roots = [add(f'댓글 {i}', i * 10) for i in range(5)]
+    replies = [add(f'답글 {i}', i + 1, parent=roots[0], is_deleted=(i == 1)) for i in range(4)]
+    add('답글의 답글', 30, parent=replies[0])
+    db.commit()
+    return {'post_id': post.id, 'root_ids': [c.id for c in roots], 'reply_ids': [c.id for c in replies]}
+
+
+def test_root_comments_are_paginated_with_cursor(client, thread):
+    url = f"/api/comments?post_id={thread['post_id']}&per_page=2"
+    pages = []
+    response = client.get(url).get_json()
+    pages.append(response)
+    while response['next_cursor']:
+        response = client.get(f"{url}&cursor={response['next_cursor']}").get_json()
+        pages.append(response)
+
+    ids = [comment['id'] for page in pages for comment in page['comments']]
+    assert ids == thread['root_ids']
+    assert [len(page['comments']) for page in pages] == [2, 2, 1]
+    assert all(comment['parent_id'] is None for page in pages for comment in page['comments'])
+
+    previous = client.get(f"{url}&cursor={pages[-1]['prev_cursor']}").get_json()
+    assert [c['id'] for c in previous['comments']] == thread['root_ids'][2:4]
+
+
+def test_roots_carry_reply_count_and_first_replies(client, thread):
+    comments = client.get(f"/api/comments?post_id={thread['post_id']}&replies=2").get_json()['comments']
+
+    first = comments[0]
+    assert first['reply_count'] == 3
+    assert [reply['id'] for reply in first['replies']] == [thread['reply_ids'][0], thread['reply_ids'][2]]
+    assert first['replies'][0]['reply_count'] == 1
+    assert all(comment['reply_count'] == 0 and comment['replies'] == [] for comment in comments[1:])
+
+    no_preview = client.get(f"/api/comments?post_id={thread['post_id']}&replies=0").get_json()['comments']
+    assert no_preview[0]['replies'] == []
+    assert no_preview[0]['reply_count'] == 3
+
+
+def test_replies_endpoint_pages_through_thread(client, thread):
+    root_id = thread['root_ids'][0]
+    first = client.get(f'/api/comments/{root_id}/replies?per_page=2').get_json()
+    assert [reply['id'] for reply in first['replies']] == [thread['reply_ids'][0], thread['reply_ids'][2]]
+
+    second = client.get(f"/api/comments/{root_id}/replies?per_page=2&cursor={first['next_cursor']}").get_json()
+    assert [reply['id'] for reply in second['replies']] == [thread['reply_ids'][3]]
+    assert second['next_cursor'] is None
+
+    assert client.get(f"/api/comments/{thread['reply_ids'][1]}/replies").status_code == 404
+    assert client.get('/api/comments/999999/replies').status_code == 404
@@ -0,0 +1,114 @@
+"""
+댓글 트리 스냅샷 테스트
+조회가 캐시 한 번으로 끝나고, 작성/수정/삭제가 스냅샷에 바로 반영되며, since_version 변경분 조회 확인
+"""
+from models import Post
+from utils import comment_tree
+
+from conftest import count_queries
+
+
+def _comment(client, headers, post_id, content, parent_id=None):
+    response = client.post('/api/comments', headers=headers, json={
+        'post_id': post_id, 'content': content, 'parent_id': parent_id,
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['id']
+
+
+def _tree(client, post_id, **params):
+    query = ''.join(f'&{key}={value}' for key, value in params.items())
+    response = client.get(f'/api/comments/tree?post_id={post_id}{query}')
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_tree_is_served_from_snapshot(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    root = _comment(client, headers, post_id, 'root')
+    reply = _comment(client, headers, post_id, 'reply', root)
+    other = _comment(client, headers, post_id, 'other root')
+
+    with count_queries() as statements:
+        tree = _tree(client, post_id)
+    assert len(statements) == 2
+    assert tree['version'] == 3
+    assert [(c['id'], c['depth']) for c in tree['comments']] == [(root, 0), (reply, 1), (other, 0)]
+    assert tree['comments'][0]['reply_count'] == 1
+
+    # 스냅샷이 있으면 버전 조회 한 번
+    with count_queries() as statements:
+        assert _tree(client, post_id) == tree
+    assert len(statements) == 1
+
+
+def test_writes_update_snapshot_in_place(client, db, make_user, make_post, monkeypatch):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    root = _comment(client, headers, post_id, 'root')
+    _tree(client, post_id)
+
+    def fail(*args):
+        raise AssertionError('스냅샷을 다시 만들면 안 됩니다.')
+
+    monkeypatch.setattr(comment_tree, 'build', fail)
+
+    reply = _comment(client, headers, post_id, 'reply', root)
+    later = _comment(client, headers, post_id, 'later root')
+    nested = _comment(client, headers, post_id, 'nested', reply)
+    client.put(f'/api/comments/{reply}', headers=headers, json={'content': 'edited'})
+    client.delete(f'/api/comments/{later}', headers=headers)
+
+    tree = _tree(client, post_id)
+    assert tree['version'] == 6
+    assert [c['id'] for c in tree['comments']] == [root, reply, nested]
+    assert tree['comments'][0]['reply_count'] == 1
+    assert tree['comments'][1]['content'] == 'edited'
+    assert tree['comments'][1]['reply_count'] == 1
+
+
+def test_since_version_returns_changes_only(client, db, make_user, make_post, monkeypatch):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    root = _comment(client, headers, post_id, 'root')
+    version = _tree(client, post_id)['version']
+
+    reply = _comment(client, headers, post_id, 'reply', root)
+    client.delete(f'/api/comments/{reply}', headers=headers)
+
+    delta = _tree(client, post_id, since_version=version)
+    assert delta['version'] == version + 2
+    assert 'comments' not in delta
+    assert [(c['version'], c['op']) for c in delta['changes']] == [
+        (version + 1, 'upsert'), (version + 1, 'upsert'), (version + 2, 'delete'), (version + 2, 'upsert'),
+    ]
+    assert delta['changes'][2]['id'] == reply
+    assert delta['changes'][3]['comment']['reply_count'] == 0
+
+    assert _tree(client, post_id, since_version=version + 2)['changes'] == []
+
+    # 보관 범위 밖이면 전체 목록
+    monkeypatch.setattr(comment_tree, 'MAX_CHANGES', 1)
+    _comment(client, headers, post_id, 'another root')
+    _comment(client, headers, post_id, 'last root')
+    full = _tree(client, post_id, since_version=version)
+    assert 'changes' not in full
+    assert len(full['comments']) == 3
+
+
+def test_unseen_write_rebuilds_snapshot(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    _comment(client, headers, post_id, 'root')
+    _tree(client, post_id)
+
+    # 스냅샷에 반영되지 않은 변경 (다른 워커 등)
+    post = db.get(Post, post_id)
+    post.comment_version += 1
+    db.commit()
+
+    tree = _tree(client, post_id)
+    assert tree['version'] == 2
+    assert len(tree['comments']) == 1
+    assert client.get('/api/comments/tree?post_id=999999').status_code == 404
@@ -0,0 +1,86 @@
+"""
+댓글 작성/삭제 쓰기 경로 테스트
+게시글 행을 읽지 않고 한 번의 UPDATE로 댓글 수를 증감하며, 존재/권한/부모 검증이 유지되는지 확인
+"""
+from models import Comment, Post
+from utils import comment_paths, hot
+
+from conftest import count_queries
+
+
+def _post_statements(statements):
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT') and 'FROM posts' in s]
+    updates = [s for s in statements if s.lstrip().upper().startswith('UPDATE POSTS')]
+    return selects, updates
+
+
+def _counts(db, post_id):
+    db.expire_all()
+    post = db.get(Post, post_id)
+    return post.comment_count, post.comment_version
+
+
+def test_create_and_delete_update_post_once(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+
+    with count_queries() as statements:
+        response = client.post('/api/comments', headers=headers, json={'post_id': post_id, 'content': '댓글'})
+    assert response.status_code == 201
+    comment_id = response.get_json()['id']
+    selects, updates = _post_statements(statements)
+    assert not selects
+    assert len(updates) == 1
+    assert _counts(db, post_id) == (1, 1)
+
+    with count_queries() as statements:
+        assert client.delete(f'/api/comments/{comment_id}', headers=headers).status_code == 200
+    selects, updates = _post_statements(statements)
+    assert not selects
+    assert len(updates) == 1
+    assert _counts(db, post_id) == (0, 2)
+
+    # 이미 삭제된 댓글은 다시 줄이지 않음
+    assert client.delete(f'/api/comments/{comment_id}', headers=headers).status_code == 404
+    assert _counts(db, post_id) == (0, 2)
+
+
+def test_write_validation(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    _, other_headers = make_user('other')
+    post_id = make_post(author)
+    other_post_id = make_post(author)
+    comment_id = client.post('/api/comments', headers=headers, json={
+        'post_id': post_id, 'content': '댓글',
+    }).get_json()['id']
+
+    response = client.post('/api/comments', headers=headers, json={'post_id': 999999, 'content': '댓글'})
+    assert response.status_code == 404
+
+    response = client.post('/api/comments', headers=headers, json={
+        'post_id': other_post_id, 'content': '답글', 'parent_id': comment_id,
+    })
+    assert response.status_code == 404
+    assert _counts(db, other_post_id) == (0, 0)
+
+    assert client.delete(f'/api/comments/{comment_id}', headers=other_headers).status_code == 403
+    assert client.delete('/api/comments/999999', headers=headers).status_code == 404
+    assert _counts(db, post_id) == (1, 1)
+
+
+def test_reply_costs_four_statements(client, db, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(hot, 'STATE_TTL', 60)
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    root = client.post('/api/comments', headers=headers, json={'post_id': post_id, 'content': '댓글'}).get_json()['id']
+
+    # 게시글 UPDATE, 부모 댓글 조회, INSERT, 경로 UPDATE (커밋 후 다시 읽지 않음)
+    with count_queries() as statements:
+        response = client.post('/api/comments', headers=headers, json={
+            'post_id': post_id, 'content': '답글', 'parent_id': root,
+        })
+    assert response.status_code == 201
+    assert len(statements) == 4
+    reply = db.get(Comment, response.get_json()['id'])
+    assert (reply.path, reply.depth) == (comment_paths.segment(root) + comment_paths.segment(reply.id), 1)
+    assert _counts(db, post_id) == (2, 2)
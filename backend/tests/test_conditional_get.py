@@ -0,0 +1,78 @@
+"""
+조건부 GET 테스트
+If-None-Match가 일치하면 무거운 조회 없이 304를 반환하고, 변경 후에는 새 ETag를 주는지 확인
+"""
+from conftest import count_queries
+from utils import view_counts
+
+
+def _get(client, url, etag=None, headers=None):
+    headers = dict(headers or {})
+    if etag:
+        headers['If-None-Match'] = etag
+    return client.get(url, headers=headers)
+
+
+def test_post_detail_etag(client, make_user):
+    _, headers = make_user('writer')
+    post_id = client.post('/api/posts', json={'title': '제목', 'content': '내용'}, headers=headers).get_json()['id']
+    url = f'/api/posts/{post_id}'
+
+    response = _get(client, url)
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+    assert response.headers['Cache-Control'].startswith('public')
+    assert 'Authorization' in response.headers['Vary']
+
+    # 304는 버전 조회 한 번으로 끝나며 조회수는 그대로 셈
+    with count_queries() as statements:
+        response = _get(client, url, etag)
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert view_counts.get_view_buffer().pending_count(post_id) == 2
+
+    # 조회수 반영만으로는 ETag가 바뀌지 않음
+    view_counts.flush()
+    assert _get(client, url, etag).status_code == 304
+
+    client.put(f'/api/posts/{post_id}/like', headers=headers)
+    response = _get(client, url, etag, headers)
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+
+
+def test_comment_list_etag_follows_comment_version(client, make_user):
+    _, headers = make_user('writer')
+    post_id = client.post('/api/posts', json={'title': '제목', 'content': '내용'}, headers=headers).get_json()['id']
+    url = f'/api/comments?post_id={post_id}'
+
+    etag = _get(client, url).headers['ETag']
+    assert _get(client, url, etag).status_code == 304
+
+    comment_id = client.post('/api/comments', json={'post_id': post_id, 'content': '댓글'},
+                             headers=headers).get_json()['id']
+    response = _get(client, url, etag)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+
+    client.put(f'/api/comments/{comment_id}', json={'content': '수정'}, headers=headers)
+    response = _get(client, url, etag)
+    assert response.status_code == 200
+    assert response.get_json()['comments'][0]['content'] == '수정'
+    assert _get(client, url, response.headers['ETag']).status_code == 304
+
+
+def test_post_list_etag(client, make_user):
+    _, headers = make_user('writer')
+    client.post('/api/posts', json={'title': '제목', 'content': '내용'}, headers=headers)
+
+    etag = _get(client, '/api/posts').headers['ETag']
+    # 캐시 적중 시 쿼리 없이 304
+    with count_queries() as statements:
+        assert _get(client, '/api/posts', etag).status_code == 304
+    assert statements == []
+    assert _get(client, '/api/posts', etag, headers).status_code == 304
+
+    client.post('/api/posts', json={'title': '새 글', 'content': '내용'}, headers=headers)
+    assert _get(client, '/api/posts', etag).status_code == 200
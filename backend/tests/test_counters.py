@@ -0,0 +1,54 @@
+"""
+집계 카운터 테스트
+쓰기 API 이후 카운터가 원본 테이블 재계산 결과와 일치하는지 확인
+"""
+from models import Category, UserRole
+from utils import counters
+
+
+def test_counters_follow_write_paths(client, db, make_user):
+    admin, admin_headers = make_user('admin', UserRole.ADMIN)
+    author, headers = make_user('writer')
+    categories = [Category(name='일반'), Category(name='질문')]
+    db.add_all(categories)
+    # 픽스처로 직접 만든 회원을 카운터에 반영
+    counters.rebuild(db)
+    db.commit()
+    general, question = (c.id for c in categories)
+
+    response = client.post('/api/auth/register', json={
+        'email': 'new@example.com', 'password': 'password123', 'nickname': '신규회원'
+    })
+    assert response.status_code == 201
+
+    post_ids = []
+    for i in range(4):
+        response = client.post('/api/posts', json={
+            'title': f'제목 {i}', 'content': '내용', 'category_id': general
+        }, headers=headers)
+        post_ids.append(response.get_json()['id'])
+    client.post('/api/posts', json={'title': '임시', 'content': '내용', 'status': 'draft'}, headers=headers)
+
+    client.put(f'/api/posts/{post_ids[0]}', json={'category_id': question}, headers=headers)
+    client.delete(f'/api/posts/{post_ids[1]}', headers=headers)
+    client.delete(f'/api/admin/posts/{post_ids[2]}', headers=admin_headers)
+    client.put(f'/api/admin/users/{author.id}', json={'is_active': False}, headers=admin_headers)
+
+    response = client.post('/api/reports', json={
+        'report_type': 'post', 'post_id': post_ids[3], 'reason': '광고성 게시글입니다'
+    }, headers=headers)
+    report_id = response.get_json()['id']
+    client.put(f'/api/admin/reports/{report_id}', json={'status': 'resolved'}, headers=admin_headers)
+
+    assert client.get('/api/posts').get_json()['total'] == 2
+    assert client.get(f'/api/posts?category_id={general}').get_json()['total'] == 1
+    assert client.get(f'/api/posts?cursor=&category_id={question}').get_json()['total'] == 1
+    assert client.get('/api/admin/posts', headers=admin_headers).get_json()['total'] == 5
+    assert client.get('/api/admin/posts?status=deleted', headers=admin_headers).get_json()['total'] == 2
+    assert client.get('/api/admin/users', headers=admin_headers).get_json()['total'] == 3
+    assert client.get('/api/admin/reports', headers=admin_headers).get_json()['total'] == 0
+    assert client.get('/api/admin/reports?status=resolved', headers=admin_headers).get_json()['total'] == 1
+    assert counters.get(db, counters.USERS_ACTIVE) == 2
+
+    db.expire_all()
+    assert counters.rebuild(db) == 0
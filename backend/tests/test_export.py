@@ -0,0 +1,82 @@
+"""
+관리자 내보내기 테스트
+NDJSON/CSV 스트리밍 응답과 상태/기간 필터 확인
+"""
+import csv
+import io
+import json
+from datetime import datetime
+
+from models import Post, PostStatus, UserRole
+
+
+def _seed(db, author):
+    posts = [
+        Post(title=f'제목 {i}', content='내용', author_id=author.id,
+             status=PostStatus.DELETED if i % 3 == 0 else PostStatus.PUBLISHED,
+             created_at=datetime(2024, 1, 1 + i))
+        for i in range(9)
+    ]
+    db.add_all(posts)
+    db.commit()
+
+
+def test_export_posts_ndjson_with_filters(client, db, make_user):
+    admin, headers = make_user('admin', UserRole.ADMIN)
+    _seed(db, admin)
+
+    response = client.get('/api/admin/export/posts', headers=headers)
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.headers['Content-Type'].startswith('application/x-ndjson')
+    assert 'attachment' in response.headers['Content-Disposition']
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['title'] for row in rows] == [f'제목 {i}' for i in range(9)]
+
+    response = client.get('/api/admin/export/posts?status=published&from=2024-01-03&to=2024-01-08',
+                          headers=headers)
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['title'] for row in rows] == ['제목 2', '제목 4', '제목 5']
+    assert {row['status'] for row in rows} == {'published'}
+
+
+def test_export_users_csv(client, db, make_user):
+    admin, headers = make_user('admin', UserRole.ADMIN)
+    make_user('reader')
+
+    response = client.get('/api/admin/export/users?format=csv&status=active', headers=headers)
+    assert response.headers['Content-Type'].startswith('text/csv')
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True).lstrip('﻿'))))
+    assert [row['nickname'] for row in rows] == ['admin', 'reader']
+    assert rows[0]['role'] == 'admin'
+
+
+def test_export_csv_neutralizes_formulas(client, db, make_user):
+    admin, headers = make_user('admin', UserRole.ADMIN)
+    make_user('@cmd')
+    db.add_all([
+        Post(title='=HYPERLINK("http://example.com")', content='내용', author_id=admin.id),
+        Post(title='-2+3', content='내용', author_id=admin.id),
+        Post(title='보통 제목', content='내용', author_id=admin.id),
+    ])
+    db.commit()
+
+    response = client.get('/api/admin/export/posts?format=csv', headers=headers)
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True).lstrip('﻿'))))
+    assert [row['title'] for row in rows] == ["'=HYPERLINK(\"http://example.com\")", "'-2+3", '보통 제목']
+    assert rows[0]['view_count'] == '0'
+
+    response = client.get('/api/admin/export/users?format=csv', headers=headers)
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True).lstrip('﻿'))))
+    assert [row['nickname'] for row in rows] == ['admin', "'@cmd"]
+
+
+def test_export_rejects_invalid_parameters(client, make_user):
+    _, headers = make_user('admin', UserRole.ADMIN)
+    _, user_headers = make_user('reader')
+
+    assert client.get('/api/admin/export/comments', headers=headers).status_code == 400
+    assert client.get('/api/admin/export/posts?format=xml', headers=headers).status_code == 400
+    assert client.get('/api/admin/export/reports?status=unknown', headers=headers).status_code == 400
+    assert client.get('/api/admin/export/posts?from=yesterday', headers=headers).status_code == 400
+    assert client.get('/api/admin/export/posts', headers=user_headers).status_code == 403
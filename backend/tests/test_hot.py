@@ -0,0 +1,157 @@
+"""
+인기 점수 테스트
+좋아요/댓글/조회가 점수에 반영되고, 재감쇠 후에도 순서가 유지되는지 확인
+"""
+import time
+from datetime import datetime, timedelta
+
+from models import Category, Post, PostStatus
+from utils import hot, view_counts
+
+from conftest import count_queries
+
+
+def _scores(db, *post_ids):
+    db.expire_all()
+    return [db.get(Post, post_id).hot_score for post_id in post_ids]
+
+
+def test_hot_ranking_follows_activity(client, db, make_user):
+    author, headers = make_user('writer')
+    _, other_headers = make_user('reader')
+    category = Category(name='일반')
+    db.add(category)
+    db.commit()
+
+    post_ids = []
+    for i in range(3):
+        response = client.post('/api/posts', json={
+            'title': f'제목 {i}', 'content': '내용', 'category_id': category.id if i else None
+        }, headers=headers)
+        post_ids.append(response.get_json()['id'])
+    first, second, third = post_ids
+
+    client.put(f'/api/posts/{first}/like', headers=headers)
+    client.put(f'/api/posts/{first}/like', headers=other_headers)
+    client.post('/api/comments', json={'post_id': second, 'content': '댓글'}, headers=headers)
+    for _ in range(10):
+        client.get(f'/api/posts/{third}')
+    view_counts.flush()
+
+    ids = [post['id'] for post in client.get('/api/posts/hot').get_json()['posts']]
+    assert ids == [second, first, third]
+    response = client.get(f'/api/posts/hot?category_id={category.id}').get_json()
+    assert [post['id'] for post in response['posts']] == [second, third]
+    assert response['total'] == 2
+
+    # 좋아요 취소 후 순서 변화
+    client.delete(f'/api/posts/{first}/like', headers=other_headers)
+    client.delete(f'/api/posts/{first}/like', headers=headers)
+    ids = [post['id'] for post in client.get('/api/posts/hot', headers=headers).get_json()['posts']]
+    assert ids == [second, third, first]
+
+
+def test_undo_after_some_time_restores_previous_score(client, db, make_user, make_post, monkeypatch):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    client.put(f'/api/posts/{post_id}/like', headers=headers)
+    comment_id = client.post('/api/comments', json={'post_id': post_id, 'content': '댓글'},
+                             headers=headers).get_json()['id']
+    assert _scores(db, post_id)[0] > 0
+
+    # 3일 뒤 취소해도 좋아요/댓글 시각의 가중치만큼만 빠짐
+    timestamp = hot._timestamp
+    later = time.time() + 3 * 24 * 3600
+    monkeypatch.setattr(hot, '_timestamp', lambda value=None: timestamp(value) if value is not None else later)
+    client.delete(f'/api/posts/{post_id}/like', headers=headers)
+    client.delete(f'/api/comments/{comment_id}', headers=headers)
+    assert abs(_scores(db, post_id)[0]) < 1e-9
+
+
+def test_rebase_keeps_order_and_rebuild_matches(db, make_user):
+    author, _ = make_user('writer')
+    now = datetime.utcnow()
+    posts = [
+        Post(title=f'제목 {i}', content='내용', author_id=author.id, status=PostStatus.PUBLISHED,
+             created_at=now - timedelta(hours=12 * i), view_count=i * 20)
+        for i in range(4)
+    ]
+    db.add_all(posts)
+    db.flush()
+    hot.rebuild(db)
+    db.commit()
+    post_ids = [post.id for post in posts]
+    before = _scores(db, *post_ids)
+
+    epoch = hot.get_epoch(db)
+    hot.rebase(db, now=epoch + hot.HALF_LIFE * 3)
+    db.commit()
+    after = _scores(db, *post_ids)
+    assert sorted(post_ids, key=lambda i: before[post_ids.index(i)]) == \
+        sorted(post_ids, key=lambda i: after[post_ids.index(i)])
+    for old, new in zip(before, after):
+        assert abs(new - old / 8) < 1e-9
+
+
+def test_interrupted_rebase_keeps_increments_consistent(db, make_user, monkeypatch):
+    author, _ = make_user('writer')
+    posts = [Post(title=f'제목 {i}', content='내용', author_id=author.id, status=PostStatus.PUBLISHED,
+                  hot_score=1.0) for i in range(4)]
+    db.add_all(posts)
+    db.commit()
+    post_ids = [post.id for post in posts]
+    epoch = hot.get_epoch(db)
+    db.commit()
+    new_epoch = int(epoch + hot.HALF_LIFE)
+
+    # 새 기준 시각을 알린 뒤 첫 배치를 커밋하고 중단된 경우
+    commit = db.commit
+    commits = []
+
+    def interrupted_commit():
+        commit()
+        commits.append(True)
+        if len(commits) == 2:
+            raise RuntimeError('중단')
+
+    monkeypatch.setattr(db, 'commit', interrupted_commit)
+    try:
+        hot.rebase(db, now=new_epoch, batch_size=2)
+    except RuntimeError:
+        pass
+    monkeypatch.setattr(db, 'commit', commit)
+    assert _scores(db, *post_ids) == [0.5, 0.5, 1.0, 1.0]
+
+    # 옮긴 게시글과 아직 옮기지 않은 게시글 모두 각자의 기준 시각으로 증가
+    when = datetime.utcfromtimestamp(new_epoch)
+    hot.add(db, post_ids[0], hot.LIKE_WEIGHT, when)
+    hot.add(db, post_ids[3], hot.LIKE_WEIGHT, when)
+    db.commit()
+
+    assert hot.rebase(db, now=new_epoch + 100) == 2
+    assert hot.get_epoch(db) == new_epoch
+    for score, expected in zip(_scores(db, *post_ids), [1.5, 0.5, 0.5, 1.5]):
+        assert abs(score - expected) < 1e-9
+
+
+def test_events_use_cached_epoch_until_rebase(client, db, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(hot, 'STATE_TTL', 60)
+    author, headers = make_user('writer')
+    _, other_headers = make_user('reader')
+    post_id = make_post(author)
+    client.put(f'/api/posts/{post_id}/like', headers=headers)
+
+    # 캐시된 기준 시각으로 더하므로 이벤트마다 stat_counters를 읽거나 잠그지 않음
+    with count_queries() as statements:
+        client.put(f'/api/posts/{post_id}/like', headers=other_headers)
+    assert not [s for s in statements if 'stat_counters' in s]
+
+    # 재감쇠는 새 기준 시각을 알린 뒤 캐시가 만료될 때까지 기다렸다가 점수를 옮김
+    sleeps = []
+    monkeypatch.setattr(hot.time, 'sleep', sleeps.append)
+    epoch = hot.get_epoch(db)
+    db.commit()
+    before = _scores(db, post_id)[0]
+    hot.rebase(db, now=epoch + hot.HALF_LIFE)
+    assert sleeps == [60]
+    assert abs(_scores(db, post_id)[0] - before / 2) < 1e-9
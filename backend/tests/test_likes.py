@@ -0,0 +1,76 @@
+"""
+좋아요 동시성 테스트
+동시에 들어온 좋아요/취소 요청 후에도 like_count와 post_likes 행 수가 일치하는지 확인
+"""
+import random
+import threading
+
+from sqlalchemy import func, select
+
+from models import Post, PostLike
+
+
+def _counts(db, post_id):
+    db.expire_all()
+    like_count = db.get(Post, post_id).like_count
+    rows = db.execute(select(func.count()).select_from(PostLike).where(PostLike.post_id == post_id)).scalar()
+    return like_count, rows
+
+
+def _run_concurrently(targets):
+    errors = []
+
+    def wrap(target):
+        try:
+            target()
+        except Exception as e:  # 스레드 예외를 메인 스레드에서 확인
+            errors.append(e)
+
+    threads = [threading.Thread(target=wrap, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+def test_put_and_delete_are_idempotent(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+
+    for _ in range(3):
+        response = client.put(f'/api/posts/{post_id}/like', headers=headers)
+        assert response.status_code == 200
+        assert response.get_json()['liked'] is True
+        assert response.get_json()['like_count'] == 1
+    assert _counts(db, post_id) == (1, 1)
+
+    for _ in range(3):
+        response = client.delete(f'/api/posts/{post_id}/like', headers=headers)
+        assert response.get_json() == {'message': '좋아요가 취소되었습니다.', 'liked': False, 'like_count': 0}
+    assert _counts(db, post_id) == (0, 0)
+
+    assert client.put('/api/posts/999/like', headers=headers).status_code == 404
+
+
+def test_concurrent_likes_keep_counter_exact(client, db, make_user, make_post):
+    author, _ = make_user('writer')
+    post_id = make_post(author)
+    users = [make_user(f'user{i}')[1] for i in range(8)]
+    url = f'/api/posts/{post_id}/like'
+
+    # 같은 사용자의 중복 클릭: 동시에 PUT 해도 좋아요는 1개
+    _run_concurrently([
+        lambda headers=headers: client.put(url, headers=headers) for headers in users for _ in range(3)
+    ])
+    assert _counts(db, post_id) == (8, 8)
+
+    def clicks(headers, seed):
+        rnd = random.Random(seed)
+        for _ in range(10):
+            method = rnd.choice([client.post, client.put, client.delete])
+            assert method(url, headers=headers).status_code == 200
+
+    _run_concurrently([lambda headers=headers, i=i: clicks(headers, i) for i, headers in enumerate(users)])
+    like_count, rows = _counts(db, post_id)
+    assert like_count == rows
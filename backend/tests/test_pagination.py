@@ -0,0 +1,71 @@
+"""
+커서 페이지네이션 테스트
+(created_at, id) 커서로 앞뒤 이동 시 같은 작성 시각의 게시글도 빠지거나 겹치지 않는지 확인
+"""
+from datetime import datetime, timedelta
+
+from models import Post, PostStatus
+
+
+def _make_posts(db, author, created_times):
+    posts = [
+        Post(title=f'게시글 {i}', content='내용', author_id=author.id,
+             status=PostStatus.PUBLISHED, created_at=created_at)
+        for i, created_at in enumerate(created_times)
+    ]
+    db.add_all(posts)
+    db.commit()
+    return [post.id for post in posts]
+
+
+def _page(client, **params):
+    response = client.get('/api/posts', query_string=params)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_cursor_walk_with_created_at_ties(client, db, make_user):
+    author, _ = make_user('writer')
+    base = datetime(2026, 1, 1)
+    # 같은 작성 시각 게시글이 페이지 경계에 걸치도록 구성
+    times = [base] * 3 + [base + timedelta(minutes=1)] * 3 + [base + timedelta(minutes=2)]
+    ids = _make_posts(db, author, times)
+    expected = [post_id for _, post_id in sorted(zip(times, ids), reverse=True)]
+
+    pages = []
+    body = _page(client, cursor='', per_page=2)
+    assert body['prev_cursor'] is None
+    while True:
+        pages.append([post['id'] for post in body['posts']])
+        if body['next_cursor'] is None:
+            break
+        body = _page(client, cursor=body['next_cursor'], per_page=2)
+
+    assert [post_id for page in pages for post_id in page] == expected
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+
+    # 마지막 페이지에서 prev_cursor로 되돌아가면 직전 페이지와 같아야 함
+    for index in range(len(pages) - 1, 0, -1):
+        body = _page(client, cursor=body['prev_cursor'], per_page=2)
+        assert [post['id'] for post in body['posts']] == pages[index - 1]
+        assert body['next_cursor'] is not None
+    assert body['prev_cursor'] is None
+
+
+def test_cursor_total_only_when_requested(client, make_user):
+    _, headers = make_user('writer')
+    for title in ('공지 하나', '공지 둘', '공지 셋'):
+        response = client.post('/api/posts', json={'title': title, 'content': '내용'}, headers=headers)
+        assert response.status_code == 201
+
+    body = _page(client, cursor='', per_page=2, search='공지')
+    assert body['total'] is None
+    assert len(body['posts']) == 2
+
+    body = _page(client, cursor='', per_page=2, search='공지', include_total='true')
+    assert body['total'] == 3
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get('/api/posts', query_string={'cursor': 'not-a-cursor'}).status_code == 400
+    assert client.get('/api/posts', query_string={'cursor': '!!!'}).status_code == 400
@@ -0,0 +1,59 @@
+"""
+게시글 일괄 조회 테스트
+요청 순서 유지, 누락 ID 보고, 조회수 미증가, 쿼리 수 일정 여부 확인
+"""
+from conftest import count_queries
+from models import Category, Post, PostImage, PostStatus
+
+
+def _seed(db, author, count):
+    category = Category(name='일반')
+    db.add(category)
+    db.flush()
+    posts = [
+        Post(title=f'제목 {i}', content=f'내용 {i}', author_id=author.id,
+             category_id=category.id if i % 2 else None, status=PostStatus.PUBLISHED)
+        for i in range(count)
+    ]
+    db.add_all(posts)
+    db.flush()
+    for post in posts:
+        db.add_all([PostImage(post_id=post.id, image_url=f'/img/{post.id}/{i}.jpg', order=i) for i in (1, 0)])
+    db.commit()
+    return [post.id for post in posts]
+
+
+def test_batch_keeps_order_and_reports_missing(client, db, make_user):
+    author, _ = make_user('writer')
+    post_ids = _seed(db, author, 4)
+    draft = Post(title='임시', content='내용', author_id=author.id, status=PostStatus.DRAFT)
+    db.add(draft)
+    db.commit()
+
+    ids = [post_ids[2], 9999, post_ids[0], draft.id, post_ids[2]]
+    response = client.get('/api/posts/batch?ids=' + ','.join(map(str, ids)))
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [post['id'] for post in data['posts']] == [post_ids[2], post_ids[0]]
+    assert data['missing'] == [9999, draft.id]
+    first = data['posts'][0]
+    assert first['content'] == '내용 2'
+    assert first['author_nickname'] == 'writer'
+    assert first['images'] == [f'/img/{post_ids[2]}/0.jpg', f'/img/{post_ids[2]}/1.jpg']
+    assert first['view_count'] == 0
+
+    assert client.get('/api/posts/batch').status_code == 400
+    assert client.get('/api/posts/batch?ids=1,abc').status_code == 400
+    assert client.get('/api/posts/batch?ids=' + ','.join(map(str, range(1, 102)))).status_code == 400
+
+
+def test_batch_query_count_is_constant(client, db, make_user):
+    author, _ = make_user('writer')
+    post_ids = _seed(db, author, 30)
+    counts = []
+    for n in (2, 30):
+        with count_queries() as statements:
+            response = client.get('/api/posts/batch?ids=' + ','.join(map(str, post_ids[:n])))
+        assert len(response.get_json()['posts']) == n
+        counts.append(len(statements))
+    assert counts[0] == counts[1] == 2
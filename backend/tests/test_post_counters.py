@@ -0,0 +1,78 @@
+"""
+게시글 카운터 재계산 테스트
+어긋난 like_count/comment_count만 고쳐 쓰고 오차 통계를 보고하는지 확인
+"""
+from sqlalchemy import update
+
+from models import Comment, Post, PostLike, PostStatus
+from utils import post_counters
+
+from conftest import count_queries
+
+
+def _make_posts(db, author, count):
+    posts = [
+        Post(title=f'제목 {i}', content='내용', author_id=author.id, status=PostStatus.PUBLISHED)
+        for i in range(count)
+    ]
+    db.add_all(posts)
+    db.commit()
+    return [post.id for post in posts]
+
+
+def test_reconcile_fixes_drifted_counters(db, make_user):
+    author, _ = make_user('writer')
+    reader, _ = make_user('reader')
+    post_ids = _make_posts(db, author, 5)
+
+    db.add_all([PostLike(user_id=user.id, post_id=post_ids[0]) for user in (author, reader)])
+    parent = Comment(post_id=post_ids[1], author_id=author.id, content='삭제된 댓글', is_deleted=True)
+    db.add(parent)
+    db.flush()
+    db.add_all([
+        Comment(post_id=post_ids[1], author_id=reader.id, content='답글', parent_id=parent.id),
+        Comment(post_id=post_ids[2], author_id=reader.id, content='댓글'),
+    ])
+    # post 0: 좋아요 누락, post 1: 삭제된 부모 아래 답글 1개인데 0, post 3: 음수 방지로 남은 값
+    db.execute(update(Post).where(Post.id == post_ids[2]).values(comment_count=1))
+    db.execute(update(Post).where(Post.id == post_ids[3]).values(like_count=3, comment_count=2))
+    db.commit()
+    updated_at = db.get(Post, post_ids[3]).updated_at
+
+    stats = post_counters.reconcile(db, batch_size=2)
+
+    assert stats == {
+        'posts': 5, 'changed': 3, 'skipped': 0,
+        'like_drift': 5, 'comment_drift': 3, 'max_like_drift': 3, 'max_comment_drift': 2,
+    }
+    db.expire_all()
+    counts = [(db.get(Post, post_id).like_count, db.get(Post, post_id).comment_count) for post_id in post_ids]
+    assert counts == [(2, 0), (0, 1), (0, 1), (0, 0), (0, 0)]
+    assert db.get(Post, post_ids[3]).updated_at == updated_at
+
+    # 맞춰진 뒤에는 읽기만 함 (배치마다 게시글/좋아요/댓글 조회)
+    with count_queries() as statements:
+        assert post_counters.reconcile(db, batch_size=2)['changed'] == 0
+    assert not [s for s in statements if s.lstrip().upper().startswith('UPDATE')]
+
+
+def test_reconcile_skips_rows_changed_concurrently(db, make_user, monkeypatch):
+    author, _ = make_user('writer')
+    post_id = _make_posts(db, author, 1)[0]
+    db.execute(update(Post).where(Post.id == post_id).values(like_count=4))
+    db.commit()
+
+    counts = post_counters._counts
+
+    def counts_then_like(db, column, *args):
+        # 집계 직후 다른 요청이 like_count를 바꾼 경우
+        if column is PostLike.post_id:
+            db.execute(update(Post).where(Post.id == post_id).values(like_count=Post.like_count + 1))
+        return counts(db, column, *args)
+
+    monkeypatch.setattr(post_counters, '_counts', counts_then_like)
+    stats = post_counters.reconcile(db)
+
+    assert (stats['changed'], stats['skipped']) == (0, 1)
+    db.expire_all()
+    assert db.get(Post, post_id).like_count == 5
@@ -0,0 +1,81 @@
+"""
+게시글 상세 캐시 테스트
+캐시 적중 시 카운터만 조회하는지, 수정/삭제 시 무효화되는지, 동시 미스가 한 번만 재생성되는지 확인
+"""
+import threading
+import time
+
+from conftest import count_queries
+from models import UserRole
+from utils.cache import Cache
+
+
+def test_detail_is_cached_and_invalidated(client, make_user):
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    _, headers = make_user('writer')
+    post_id = client.post('/api/posts', json={
+        'title': '제목', 'content': '내용', 'images': ['/a.jpg']
+    }, headers=headers).get_json()['id']
+    url = f'/api/posts/{post_id}'
+
+    assert client.get(url).get_json()['view_count'] == 1
+    # 캐시 적중: 버전/카운터 조회 한 번, 조회수와 좋아요 수는 최신 값
+    client.put(f'{url}/like', headers=headers)
+    with count_queries() as statements:
+        data = client.get(url).get_json()
+    assert len(statements) == 1
+    assert (data['view_count'], data['like_count'], data['images']) == (2, 1, ['/a.jpg'])
+
+    client.put(url, json={'title': '수정한 제목'}, headers=headers)
+    assert client.get(url).get_json()['title'] == '수정한 제목'
+
+    client.delete(f'/api/admin/posts/{post_id}', headers=admin_headers)
+    assert client.get(url).status_code == 404
+
+
+def test_get_or_build_coalesces_concurrent_misses():
+    cache = Cache('test', ttl=60)
+    calls = []
+
+    def builder():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'value': len(calls)}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_build('key', builder)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'value': 1}] * 8
+    assert cache.stats()['coalesced'] == 7
+
+
+def test_get_or_build_serves_stale_while_rebuilding():
+    cache = Cache('test', ttl=0.05)
+    assert cache.get_or_build('key', lambda: 'old', stale_ttl=60) == 'old'
+    time.sleep(0.1)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_builder():
+        started.set()
+        release.wait(5)
+        return 'new'
+
+    leader = threading.Thread(target=lambda: cache.get_or_build('key', slow_builder, stale_ttl=60))
+    leader.start()
+    started.wait(5)
+    # 다시 만드는 동안에는 이전 값을 바로 반환하고 builder는 실행하지 않음
+    assert cache.get_or_build('key', lambda: 'unexpected', stale_ttl=60) == 'old'
+    release.set()
+    leader.join()
+    assert cache.get_or_build('key', lambda: 'unexpected', stale_ttl=60) == 'new'
+    assert cache.stats()['stale_hits'] == 1
@@ -0,0 +1,47 @@
+"""
+게시글 목록 응답 캐시 테스트
+비로그인 요청 캐시 적중과 게시글/댓글/관리자 변경 시 무효화 확인
+"""
+from conftest import count_queries
+from models import Category, UserRole
+
+
+def _titles(client, url, headers=None):
+    return [post['title'] for post in client.get(url, headers=headers).get_json()['posts']]
+
+
+def test_anonymous_list_is_cached_and_invalidated(client, db, make_user):
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    _, headers = make_user('writer')
+    category = Category(name='일반')
+    db.add(category)
+    db.commit()
+
+    post_id = client.post('/api/posts', json={
+        'title': '첫 글', 'content': '내용', 'category_id': category.id
+    }, headers=headers).get_json()['id']
+    url = f'/api/posts?category_id={category.id}'
+
+    assert _titles(client, url) == ['첫 글']
+    with count_queries() as statements:
+        assert _titles(client, url) == ['첫 글']
+    assert statements == []
+
+    # 로그인 요청은 캐시를 사용하지 않음
+    with count_queries() as statements:
+        client.get(url, headers=headers)
+    assert statements
+
+    client.put(f'/api/posts/{post_id}', json={'title': '수정한 글'}, headers=headers)
+    assert _titles(client, url) == ['수정한 글']
+    assert _titles(client, '/api/posts') == ['수정한 글']
+
+    client.post('/api/comments', json={'post_id': post_id, 'content': '댓글'}, headers=headers)
+    assert client.get(url).get_json()['posts'][0]['comment_count'] == 1
+
+    client.delete(f'/api/admin/posts/{post_id}', headers=admin_headers)
+    assert _titles(client, url) == []
+
+    stats = client.get('/api/admin/cache/stats', headers=admin_headers).get_json()['caches']['post_list']
+    assert stats['hits'] == 1
+    assert stats['invalidations'] >= 4
@@ -0,0 +1,25 @@
+"""
+미리보기 백필 테스트
+비어 있는 미리보기만 채우고 게시글 수정 시각은 바꾸지 않는지 확인
+"""
+from datetime import datetime
+
+from models import Post
+from utils import preview
+
+
+def test_backfill_keeps_updated_at(db, make_user):
+    author, _ = make_user('writer')
+    edited_at = datetime(2024, 1, 1)
+    post = Post(title='제목', content='긴 본문 ' * 100, author_id=author.id, updated_at=edited_at)
+    db.add(post)
+    db.commit()
+    db.query(Post).update({'preview': None, 'content_length': 0, 'updated_at': edited_at})
+    db.commit()
+
+    assert preview.backfill(db, batch_size=1) == 1
+    db.expire_all()
+    post = db.get(Post, post.id)
+    assert post.preview == preview.make_preview(post.content)
+    assert post.content_length == len(post.content)
+    assert post.updated_at == edited_at
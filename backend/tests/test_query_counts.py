@@ -0,0 +1,81 @@
+"""
+목록 엔드포인트 쿼리 수 테스트
+페이지 크기와 관계없이 일정한 수의 쿼리만 실행되는지 확인 (N+1 방지)
+"""
+import re
+
+import pytest
+
+from conftest import count_queries
+from models import Category, Comment, Post, Report, ReportType, UserRole
+
+
+@pytest.fixture
+def seeded(db, make_user):
+    """작성자/카테고리가 서로 다른 게시글, 댓글, 신고 데이터 생성"""
+    admin, admin_headers = make_user('admin', UserRole.ADMIN)
+    authors = [make_user(f'author{i}')[0] for i in range(5)]
+    categories = [Category(name=f'category{i}') for i in range(3)]
+    db.add_all(categories)
+    db.flush()
+
+    posts = []
+    for i in range(30):
+        post = Post(
+            author_id=authors[i % len(authors)].id,
+            category_id=categories[i % len(categories)].id,
+            title=f'게시글 {i}',
+            content='내용 ' * 100,
+        )
+        posts.append(post)
+    db.add_all(posts)
+    db.flush()
+
+    target = posts[-1]
+    for i in range(30):
+        db.add(Comment(post_id=target.id, author_id=authors[i % len(authors)].id, content=f'댓글 {i}'))
+    for i, post in enumerate(posts):
+        db.add(Report(
+            reporter_id=authors[i % len(authors)].id,
+            report_type=ReportType.POST,
+            post_id=post.id,
+            reason='부적절한 게시글입니다',
+        ))
+    db.commit()
+    return {'admin_headers': admin_headers, 'post_id': target.id}
+
+
+def _query_count(client, url, headers=None):
+    with count_queries() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    return len(statements)
+
+
+@pytest.mark.parametrize('url, admin', [
+    ('/api/posts?per_page={n}', False),
+    ('/api/posts?cursor=&per_page={n}', False),
+    ('/api/admin/posts?per_page={n}', True),
+    ('/api/admin/reports?per_page={n}', True),
+    ('/api/admin/users?per_page={n}', True),
+    ('/api/reports?per_page={n}', True),
+])
+def test_list_endpoints_query_count_is_constant(client, seeded, url, admin):
+    headers = seeded['admin_headers'] if admin else None
+    small = _query_count(client, url.format(n=2), headers)
+    large = _query_count(client, url.format(n=20), headers)
+    assert small == large
+    assert large <= 3
+
+
+def test_comment_list_query_count(client, seeded):
+    url = f"/api/comments?post_id={seeded['post_id']}&per_page={{n}}"
+    # ETag 비교용 댓글 버전 조회 + 최상위 댓글 페이지 조회 + 답글 미리보기 조회
+    assert _query_count(client, url.format(n=2)) == _query_count(client, url.format(n=20)) == 3
+
+
+def test_post_lists_do_not_load_content(client, seeded):
+    for url, headers in (('/api/posts', None), ('/api/admin/posts', seeded['admin_headers'])):
+        with count_queries() as statements:
+            client.get(url, headers=headers)
+        assert not any(re.search(r'posts\.content(?!_)', statement) for statement in statements)
@@ -0,0 +1,164 @@
+"""
+신고 큐 테스트
+대상별 집계가 신고 접수/상태 변경 시 증분 유지되고, 기준 이상이면 reports 조회 없이 자동 숨김되는지 확인
+"""
+import json
+
+from models import Comment, Post, PostStatus, ReportStatus, ReportTarget, ReportType, UserRole
+from utils import counters, report_queue
+
+from conftest import count_queries
+
+
+def _report(client, headers, reason='광고성 게시글입니다', **body):
+    response = client.post('/api/reports', headers=headers, json={'reason': reason, **body})
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['id']
+
+
+def _target(db, target_type, target_id):
+    db.expire_all()
+    return db.query(ReportTarget).filter_by(target_type=target_type, target_id=target_id).one()
+
+
+def test_queue_groups_reports_by_target(client, db, make_user, make_post):
+    author, _ = make_user('writer')
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    reporters = [make_user(f'reporter{i}')[1] for i in range(3)]
+    busy, quiet = make_post(author, '신고 대상'), make_post(author, '신고 대상')
+
+    report_ids = [_report(client, headers, post_id=busy, report_type='post') for headers in reporters]
+    _report(client, reporters[0], reason='  욕설이  있습니다 ', post_id=quiet, report_type='post')
+    _report(client, reporters[1], reason='욕설이 있습니다', post_id=quiet, report_type='post')
+
+    with count_queries() as statements:
+        response = client.get('/api/admin/reports/queue', headers=admin_headers)
+    assert not [s for s in statements if 'FROM reports' in s]
+    body = response.get_json()
+    assert body['total'] == 2
+    assert [(t['target_id'], t['pending_count']) for t in body['targets']] == [(busy, 3), (quiet, 2)]
+    assert body['targets'][0]['target'] == {'post_id': busy, 'title': '신고 대상', 'status': 'published'}
+    assert body['targets'][1]['top_reasons'] == [{'reason': '욕설이 있습니다', 'count': 2}]
+
+    client.put(f'/api/admin/reports/{report_ids[0]}', headers=admin_headers, json={'status': 'processing'})
+    client.put(f'/api/admin/reports/{report_ids[1]}', headers=admin_headers, json={'status': 'rejected'})
+    target = _target(db, ReportType.POST, busy)
+    assert (target.pending_count, target.total_count) == (1, 3)
+
+    client.put(f'/api/admin/reports/{report_ids[0]}', headers=admin_headers, json={'status': 'pending'})
+    assert _target(db, ReportType.POST, busy).pending_count == 2
+
+
+def test_threshold_hides_post_and_comment(client, db, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(report_queue, 'AUTO_HIDE_THRESHOLD', 2)
+    author, _ = make_user('writer')
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    reporters = [make_user(f'reporter{i}')[1] for i in range(3)]
+    post_id = make_post(author)
+    comment = Comment(post_id=post_id, author_id=author.id, content='댓글')
+    db.add(comment)
+    db.get(Post, post_id).comment_count = 1
+    db.commit()
+
+    _report(client, reporters[0], post_id=post_id, report_type='post')
+    assert client.get(f'/api/posts/{post_id}').status_code == 200
+    _report(client, reporters[1], post_id=post_id, report_type='post')
+
+    db.expire_all()
+    assert db.get(Post, post_id).status == PostStatus.HIDDEN
+    assert client.get(f'/api/posts/{post_id}').status_code == 404
+    assert counters.get(db, counters.post_key(PostStatus.HIDDEN)) == 1
+    assert _target(db, ReportType.POST, post_id).hidden_at is not None
+    # 이미 숨겨진 대상은 다시 처리하지 않음
+    _report(client, reporters[2], post_id=post_id, report_type='post')
+    assert _target(db, ReportType.POST, post_id).pending_count == 3
+
+    for headers in reporters[:2]:
+        _report(client, headers, comment_id=comment.id, report_type='comment')
+    db.expire_all()
+    assert db.get(Comment, comment.id).is_deleted is True
+    assert db.get(Post, post_id).comment_count == 0
+
+
+def test_restore_rejects_pending_reports(client, db, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(report_queue, 'AUTO_HIDE_THRESHOLD', 2)
+    author, _ = make_user('writer')
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    reporters = [make_user(f'reporter{i}')[1] for i in range(3)]
+    post_id = make_post(author)
+    comment = Comment(post_id=post_id, author_id=author.id, content='댓글')
+    db.add(comment)
+    db.get(Post, post_id).comment_count = 1
+    db.commit()
+    for headers in reporters[:2]:
+        _report(client, headers, post_id=post_id, report_type='post')
+        _report(client, headers, comment_id=comment.id, report_type='comment')
+
+    response = client.post(f'/api/admin/reports/queue/post/{post_id}/restore', headers=admin_headers)
+    assert response.status_code == 200
+    db.expire_all()
+    assert db.get(Post, post_id).status == PostStatus.PUBLISHED
+    target = _target(db, ReportType.POST, post_id)
+    assert (target.hidden_at, target.pending_count, target.total_count) == (None, 0, 2)
+    assert client.post(f'/api/admin/reports/queue/post/{post_id}/restore', headers=admin_headers).status_code == 404
+
+    # 반려된 뒤라 새 신고 하나로는 다시 숨겨지지 않음
+    _report(client, reporters[2], post_id=post_id, report_type='post')
+    db.expire_all()
+    assert db.get(Post, post_id).status == PostStatus.PUBLISHED
+    assert client.get(f'/api/posts/{post_id}').status_code == 200
+
+    response = client.post(f'/api/admin/reports/queue/comment/{comment.id}/restore', headers=admin_headers)
+    assert response.status_code == 200
+    db.expire_all()
+    assert db.get(Comment, comment.id).is_deleted is False
+    assert db.get(Post, post_id).comment_count == 1
+    assert [c['id'] for c in client.get(f'/api/comments?post_id={post_id}').get_json()['comments']] == [comment.id]
+
+    assert counters.get(db, counters.report_key(ReportStatus.PENDING)) == 1
+    assert counters.get(db, counters.report_key(ReportStatus.REJECTED)) == 4
+    assert counters.get(db, counters.post_key(PostStatus.HIDDEN)) == 0
+
+
+def test_author_deleted_comment_is_not_restorable(client, db, make_user, make_post, monkeypatch):
+    monkeypatch.setattr(report_queue, 'AUTO_HIDE_THRESHOLD', 1)
+    author, author_headers = make_user('writer')
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    _, headers = make_user('reporter')
+    post_id = make_post(author)
+    comment_id = client.post('/api/comments', headers=author_headers,
+                             json={'post_id': post_id, 'content': '댓글'}).get_json()['id']
+    client.delete(f'/api/comments/{comment_id}', headers=author_headers)
+
+    response = client.post('/api/reports', headers=headers,
+                           json={'reason': '욕설', 'comment_id': comment_id, 'report_type': 'comment'})
+    assert response.status_code == 201
+    assert _target(db, ReportType.COMMENT, comment_id).hidden_at is None
+    response = client.post(f'/api/admin/reports/queue/comment/{comment_id}/restore', headers=admin_headers)
+    assert response.status_code == 404
+    db.expire_all()
+    assert db.get(Comment, comment_id).is_deleted is True
+
+
+def test_hidden_post_cannot_be_republished_by_author(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    db.get(Post, post_id).status = PostStatus.HIDDEN
+    db.commit()
+
+    response = client.put(f'/api/posts/{post_id}', headers=headers, json={'status': 'published'})
+    assert response.status_code == 403
+
+
+def test_top_reasons_are_bounded(monkeypatch):
+    monkeypatch.setattr(report_queue, 'MAX_REASONS', 2)
+    reasons = None
+    for reason in ('광고', '광고', '욕설', '도배'):
+        reasons = report_queue.add_reason(reasons, reason)
+    assert json.loads(reasons) == [['광고', 2], ['도배', 2]]
+
+
+def test_status_change_without_aggregate_is_ignored(db):
+    assert report_queue.status_changed(
+        db, ReportType.POST, 999999, ReportStatus.PENDING, ReportStatus.RESOLVED
+    ) is None
@@ -0,0 +1,72 @@
+"""
+신고 중복 방지 테스트
+처리 대기 신고는 대상마다 신고자당 하나만 한 문장으로 추가되고, 없는 대상은 외래 키로 거절되는지 확인
+"""
+import threading
+
+from sqlalchemy import func, select
+
+from models import Comment, Report, ReportStatus, UserRole
+from utils import counters
+
+from conftest import count_queries
+
+
+def _report(client, headers, **body):
+    return client.post('/api/reports', headers=headers, json={'reason': '부적절한 내용입니다', **body})
+
+
+def test_duplicate_pending_report_is_rejected(client, db, make_user, make_post):
+    author, headers = make_user('writer')
+    _, admin_headers = make_user('admin', UserRole.ADMIN)
+    post_id = make_post(author)
+    comment = Comment(post_id=post_id, author_id=author.id, content='댓글')
+    db.add(comment)
+    db.commit()
+
+    with count_queries() as statements:
+        response = _report(client, headers, report_type='post', post_id=post_id)
+    assert response.status_code == 201
+    assert not [s for s in statements if s.lstrip().upper().startswith('SELECT') and 'FROM posts' in s]
+    assert len([s for s in statements if s.lstrip().upper().startswith('INSERT INTO REPORTS')]) == 1
+
+    assert _report(client, headers, report_type='post', post_id=post_id).status_code == 400
+    # 같은 ID라도 대상 유형이 다르면 별도 신고
+    assert _report(client, headers, report_type='comment', comment_id=comment.id, post_id=post_id).status_code == 201
+
+    # 처리된 뒤에는 다시 신고 가능, 대기 신고가 있으면 대기로 되돌릴 수 없음
+    first_id = db.execute(select(func.min(Report.id))).scalar()
+    client.put(f'/api/admin/reports/{first_id}', headers=admin_headers, json={'status': 'resolved'})
+    assert _report(client, headers, report_type='post', post_id=post_id).status_code == 201
+    response = client.put(f'/api/admin/reports/{first_id}', headers=admin_headers, json={'status': 'pending'})
+    assert response.status_code == 409
+
+    assert counters.get(db, counters.report_key(ReportStatus.PENDING)) == 2
+
+
+def test_missing_target_is_rejected_by_foreign_key(client, db, make_user):
+    _, headers = make_user('writer')
+
+    assert _report(client, headers, report_type='post', post_id=999999).status_code == 404
+    assert _report(client, headers, report_type='comment', comment_id=999999).status_code == 404
+    assert db.execute(select(func.count()).select_from(Report)).scalar() == 0
+    assert counters.get(db, counters.report_key(ReportStatus.PENDING)) == 0
+
+
+def test_concurrent_duplicate_reports_insert_once(client, app, db, make_user, make_post):
+    author, headers = make_user('writer')
+    post_id = make_post(author)
+    statuses = []
+
+    def submit():
+        with app.test_client() as thread_client:
+            statuses.append(_report(thread_client, headers, report_type='post', post_id=post_id).status_code)
+
+    threads = [threading.Thread(target=submit) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(statuses) == [201] + [400] * 4
+    assert db.execute(select(func.count()).select_from(Report)).scalar() == 1
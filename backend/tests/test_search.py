@@ -0,0 +1,109 @@
+"""
+게시글 검색 테스트
+bigram 토큰화와 인덱스 갱신(작성/수정/삭제), 관련도 정렬 확인
+"""
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+
+from models import Post
+from utils import search as search_index
+
+
+def test_tokenize_korean_bigrams_and_words():
+    assert search_index.tokenize('게시판 Flask3 검') == ['게시', '시판', 'flask3', '검']
+
+
+def _create(client, headers, title, content):
+    response = client.post('/api/posts', json={'title': title, 'content': content}, headers=headers)
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def _search(client, query, **params):
+    params['search'] = query
+    data = client.get('/api/posts', query_string=params).get_json()
+    return [post['id'] for post in data['posts']]
+
+
+def test_search_index_follows_post_writes(client, make_user):
+    _, headers = make_user('writer')
+    first = _create(client, headers, '커뮤니티 공지사항', '게시판 이용 규칙을 안내합니다.')
+    second = _create(client, headers, 'Flask 질문', '블루프린트 등록 방법이 궁금합니다.')
+
+    assert _search(client, '이용 규칙') == [first]
+    assert _search(client, '공지') == [first]
+    assert _search(client, 'flas') == [second]
+
+    client.put(f'/api/posts/{second}', json={'content': '공지 내용을 참고했습니다.'}, headers=headers)
+    assert _search(client, '블루프린트') == []
+    assert sorted(_search(client, '공지')) == sorted([first, second])
+
+    client.delete(f'/api/posts/{first}', headers=headers)
+    assert _search(client, '공지') == [second]
+
+
+def test_search_relevance_sort(client, make_user):
+    _, headers = make_user('writer')
+    weak = _create(client, headers, '일상', '오늘 점심은 비빔밥')
+    strong = _create(client, headers, '비빔밥 맛집', '비빔밥 비빔밥 비빔밥 추천')
+
+    assert _search(client, '비빔밥') == [strong, weak]
+    assert _search(client, '비빔밥', sort='relevance')[0] == strong
+
+
+def test_inverted_index_backend(db, make_user):
+    author, _ = make_user('writer')
+    posts = [Post(author_id=author.id, title='한국어 검색', content='형태소 분석 없이 bigram'),
+             Post(author_id=author.id, title='영어 검색', content='English search')]
+    db.add_all(posts)
+    db.commit()
+
+    backend = search_index.InvertedIndexBackend()
+    backend.ensure(db)
+    query = backend.apply(db, db.query(Post), '검색 bigram', by_relevance=True)
+    assert [post.id for post in query.all()] == [posts[0].id]
+
+    # 인덱스 변경은 커밋 후 반영, 롤백하면 버림
+    backend.remove_post(db, posts[0].id)
+    db.rollback()
+    assert backend.apply(db, db.query(Post), '한국어', by_relevance=False).count() == 1
+    backend.remove_post(db, posts[0].id)
+    db.commit()
+    assert backend.apply(db, db.query(Post), '한국어', by_relevance=False).all() == []
+
+
+def test_inverted_index_ignores_rolled_back_writes(db, make_user, monkeypatch):
+    monkeypatch.setattr(search_index, 'MAX_CANDIDATES', 1)
+    author, _ = make_user('writer')
+    posts = [Post(author_id=author.id, title='공지', content=f'내용 {i}') for i in range(3)]
+    db.add_all(posts)
+    db.commit()
+    backend = search_index.InvertedIndexBackend()
+    backend.ensure(db)
+
+    phantom = Post(author_id=author.id, title='공지', content='롤백될 글')
+    db.add(phantom)
+    db.flush()
+    backend.index_post(db, phantom.id, phantom.title, phantom.content)
+    db.rollback()
+
+    # 최신순 검색은 후보 수 제한 없이 모든 일치 게시글 대상
+    assert backend.apply(db, db.query(Post), '공지', by_relevance=False).count() == 3
+    assert backend.apply(db, db.query(Post), '공지', by_relevance=True).count() == 1
+
+
+def test_relevance_sort_is_rejected_in_cursor_mode(client):
+    response = client.get('/api/posts', query_string={'search': '비빔밥', 'sort': 'relevance', 'cursor': ''})
+    assert response.status_code == 400
+
+
+def test_mysql_backend_uses_like_for_terms_shorter_than_ngram(db):
+    def compiled(search):
+        query = search_index.MySQLFulltextBackend().apply(db, select(Post.id), search, by_relevance=True)
+        return str(query.compile(dialect=mysql.dialect()))
+
+    sql = compiled('밥')
+    assert 'LIKE' in sql and 'MATCH' not in sql
+    sql = compiled('밥 비빔밥')
+    assert 'LIKE' in sql and 'MATCH' in sql and 'ORDER BY' in sql
+    assert 'LIKE' not in compiled('비빔밥')
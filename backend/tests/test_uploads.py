@@ -0,0 +1,158 @@
+"""
+이미지 업로드 테스트
+내용 해시 중복 제거, 형식/크기 검증, 썸네일 결과의 게시글 이미지 반영
+"""
+import hashlib
+import io
+import struct
+import zlib
+
+import pytest
+
+from models import Post, PostImage, UserRole
+from utils import uploads
+
+
+def _png(width=640, height=480):
+    """단색 RGB PNG"""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    raw = b''.join(b'\x00' + b'\x80\x40\x20' * width for _ in range(height))
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(raw))
+        + chunk(b'IEND', b'')
+    )
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, 'UPLOAD_DIR', str(tmp_path))
+    monkeypatch.setattr(uploads, 'THUMBNAIL_WORKERS', 0)
+    return tmp_path
+
+
+def _upload(client, headers, data, filename='image.png'):
+    return client.post(
+        '/api/uploads/images', headers=headers,
+        data={'file': (io.BytesIO(data), filename)}, content_type='multipart/form-data',
+    )
+
+
+def test_same_content_is_stored_once(client, make_user, upload_dir):
+    _, headers = make_user('uploader')
+    data = _png()
+
+    first = _upload(client, headers, data)
+    assert first.status_code == 201
+    assert first.json['content_hash'] == hashlib.sha256(data).hexdigest()
+    assert first.json['url'].startswith('/uploads/originals/')
+    assert first.json['size'] == len(data)
+
+    second = _upload(client, headers, data, filename='other-name.png')
+    assert second.status_code == 200
+    assert second.json['created'] is False
+    assert second.json['url'] == first.json['url']
+
+    originals = [path for path in (upload_dir / 'originals').rglob('*') if path.is_file()]
+    assert len(originals) == 1
+    assert not list((upload_dir / 'tmp').iterdir())
+
+    served = client.get(first.json['url'])
+    assert served.status_code == 200
+    assert served.data == data
+
+
+def test_rejects_non_image_and_oversized_files(client, make_user, upload_dir, monkeypatch):
+    _, headers = make_user('uploader')
+
+    response = _upload(client, headers, b'<?php echo 1; ?>', filename='image.png')
+    assert response.status_code == 400
+
+    monkeypatch.setattr(uploads, 'MAX_UPLOAD_SIZE', 1024)
+    response = _upload(client, headers, _png())
+    assert response.status_code == 413
+
+    assert not list((upload_dir / 'tmp').iterdir())
+    assert not (upload_dir / 'originals').exists()
+
+
+def test_oversized_request_body_is_rejected_before_reading(app, client, make_user, monkeypatch):
+    _, headers = make_user('admin', UserRole.ADMIN)
+    monkeypatch.setitem(app.config, 'MAX_CONTENT_LENGTH', 1024)
+    monkeypatch.setattr(uploads, 'save_upload', lambda stream: pytest.fail('본문을 읽으면 안 됨'))
+
+    response = _upload(client, headers, _png())
+    assert response.status_code == 413
+    assert 'error' in response.json
+
+    # 일괄 가져오기는 본문을 나눠 읽으므로 제한하지 않음
+    response = client.post('/api/admin/import/posts', headers=headers, data='\n' * 2048)
+    assert response.status_code == 200
+
+
+def test_thumbnail_result_is_applied_to_post_images(client, make_user, db, monkeypatch):
+    # 썸네일 생성이 끝나기 전에 게시글을 작성한 경우
+    monkeypatch.setattr(uploads, 'Image', None)
+    _, headers = make_user('uploader')
+    upload = _upload(client, headers, _png()).json
+    post_id = client.post('/api/posts', headers=headers, json={
+        'title': '이미지 게시글', 'content': '본문',
+        'images': [upload['url'], 'https://example.com/external.png'],
+    }).json['id']
+
+    image = db.query(PostImage).filter_by(post_id=post_id, order=0).one()
+    assert image.content_hash == upload['content_hash']
+    assert db.query(PostImage).filter_by(post_id=post_id, order=1).one().content_hash is None
+
+    # 썸네일 생성 전에는 원본 URL을 대표 이미지로 사용
+    assert client.get('/api/posts').json['posts'][0]['thumbnail_url'] == upload['url']
+    client.get(f'/api/posts/{post_id}')
+
+    updated_at = db.get(Post, post_id).updated_at
+    meta = {'width': 640, 'height': 480, 'thumbnail_url': '/uploads/thumbnails/ab/thumb.jpg'}
+    assert uploads.apply_thumbnail(upload['content_hash'], meta) == 1
+    db.expire_all()
+    post = db.get(Post, post_id)
+    assert (post.image_version, post.updated_at) == (1, updated_at)
+
+    # 목록/상세 캐시가 무효화되어 썸네일이 바로 보임
+    assert client.get('/api/posts').json['posts'][0]['thumbnail_url'] == meta['thumbnail_url']
+    detail = client.get(f'/api/posts/{post_id}').json
+    assert detail['images'] == [upload['url'], 'https://example.com/external.png']
+    assert detail['image_variants'][0] == {
+        'url': upload['url'], 'thumbnail_url': meta['thumbnail_url'], 'width': 640, 'height': 480,
+    }
+    assert detail['image_variants'][1]['thumbnail_url'] is None
+
+
+def test_thumbnail_is_generated_with_pillow(client, make_user, upload_dir):
+    pytest.importorskip('PIL')
+    _, headers = make_user('uploader')
+    upload = _upload(client, headers, _png(1200, 600)).json
+
+    assert upload['width'] == 1200
+    assert upload['height'] == 600
+    meta = uploads.read_meta(upload['content_hash'])
+    assert (meta['thumbnail_width'], meta['thumbnail_height']) == (uploads.THUMBNAIL_SIZE, uploads.THUMBNAIL_SIZE // 2)
+    assert client.get(meta['thumbnail_url']).status_code == 200
+
+
+def test_thumbnail_result_changes_post_detail_etag(client, make_user, monkeypatch):
+    monkeypatch.setattr(uploads, 'Image', None)
+    _, headers = make_user('uploader')
+    upload = _upload(client, headers, _png()).json
+    post_id = client.post('/api/posts', headers=headers, json={
+        'title': '이미지 게시글', 'content': '본문', 'images': [upload['url']],
+    }).json['id']
+    etag = client.get(f'/api/posts/{post_id}').headers['ETag']
+    assert client.get(f'/api/posts/{post_id}', headers={'If-None-Match': etag}).status_code == 304
+
+    meta = {'width': 640, 'height': 480, 'thumbnail_url': '/uploads/thumbnails/ab/thumb.jpg'}
+    uploads.apply_thumbnail(upload['content_hash'], meta)
+
+    response = client.get(f'/api/posts/{post_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.json['image_variants'][0]['thumbnail_url'] == meta['thumbnail_url']
@@ -0,0 +1,58 @@
+"""
+조회수 버퍼 테스트
+상세 조회가 쓰기 없이 처리되고, 반영 시 게시글별 한 번의 UPDATE로 누적되는지 확인
+"""
+from database import engine
+from models import Post, PostStatus
+from utils import view_counts
+from utils.view_counts import ViewCountBuffer
+
+from conftest import count_queries
+
+
+def _make_posts(db, author, count):
+    posts = [
+        Post(title=f'제목 {i}', content='내용', author_id=author.id, status=PostStatus.PUBLISHED)
+        for i in range(count)
+    ]
+    db.add_all(posts)
+    db.commit()
+    return [post.id for post in posts]
+
+
+def _view_count(db, post_id):
+    db.expire_all()
+    return db.get(Post, post_id).view_count
+
+
+def test_detail_reads_buffer_views(client, db, make_user):
+    author, _ = make_user('writer')
+    post_id, = _make_posts(db, author, 1)
+
+    with count_queries() as statements:
+        counts = [client.get(f'/api/posts/{post_id}').get_json()['view_count'] for _ in range(3)]
+    assert counts == [1, 2, 3]
+    assert not [s for s in statements if s.lstrip().upper().startswith('UPDATE')]
+    assert _view_count(db, post_id) == 0
+
+    assert view_counts.flush() == 1
+    assert _view_count(db, post_id) == 3
+    assert client.get(f'/api/posts/{post_id}').get_json()['view_count'] == 4
+
+
+def test_buffer_flushes_by_size_and_on_close(db, make_user):
+    author, _ = make_user('writer')
+    first, second = _make_posts(db, author, 2)
+    buffer = ViewCountBuffer(engine, flush_size=5, flush_interval=0)
+
+    with count_queries() as statements:
+        for post_id in [first, second, first, first, second, first, second]:
+            buffer.record(post_id)
+    # 5건째에서 한 번 반영 (게시글별 UPDATE를 executemany 한 번으로)
+    assert len([s for s in statements if s.lstrip().upper().startswith('UPDATE')]) == 1
+    assert (_view_count(db, first), _view_count(db, second)) == (3, 2)
+    assert buffer.pending_count(first) == 1
+
+    buffer.close()
+    assert (_view_count(db, first), _view_count(db, second)) == (4, 3)
+    assert buffer.pending_count(first) == 0
@@ -0,0 +1,250 @@
+"""
+임시저장(draft) 자동 저장 버퍼
+에디터의 잦은 자동 저장을 게시글별로 메모리에 모았다가 window초마다 마지막 상태만 한 번 UPDATE
+
+반영 시 버퍼가 읽었던 updated_at이 그대로일 때만 쓰므로, 그 사이 게시글 수정/발행/삭제나
+다른 워커의 자동 저장이 있었다면 덮어쓰지 않고 버림 (다음 자동 저장이 base_hash 불일치로 409를 받아 전체 본문을 다시 보냄)
+"""
+import atexit
+import hashlib
+import os
+import threading
+from datetime import datetime
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from database import engine
+from models import Post, PostStatus
+from utils import search as search_index
+from utils.preview import make_preview
+
+# 게시글별 잠금 분할 수
+LOCK_STRIPES = 64
+
+
+def draft_hash(title, content):
+    """임시저장 내용 버전 (제목 + 본문)"""
+    return hashlib.sha1(f'{title}\0{content}'.encode('utf-8')).hexdigest()
+
+
+def apply_patches(content, patches):
+    """
+    본문에 부분 변경 적용
+
+    patches: [{'offset': 시작 위치, 'delete': 지울 글자 수, 'insert': 넣을 문자열}, ...] (앞에서부터 차례로 적용)
+    범위를 벗어나면 ValueError
+    """
+    for patch in patches:
+        offset = patch.get('offset')
+        delete = patch.get('delete', 0)
+        insert = patch.get('insert', '')
+        if (not isinstance(offset, int) or not isinstance(delete, int) or not isinstance(insert, str)
+                or offset < 0 or delete < 0 or offset + delete > len(content)):
+            raise ValueError(f'잘못된 변경 범위입니다: {patch}')
+        content = content[:offset] + insert + content[offset + delete:]
+    return content
+
+
+class Draft:
+    """반영 대기 중인 임시저장 상태 (DB에서 읽은 행과 같은 속성 이름 사용)"""
+
+    __slots__ = ('post_id', 'author_id', 'title', 'content', 'updated_at')
+
+    status = PostStatus.DRAFT
+
+    def __init__(self, post_id, author_id, title, content, updated_at):
+        self.post_id = post_id
+        self.author_id = author_id
+        self.title = title
+        self.content = content
+        # 이 상태의 기준이 된 DB 행의 updated_at (반영 시 충돌 확인용)
+        self.updated_at = updated_at
+
+
+class AutosaveBuffer:
+    """
+    게시글별 자동 저장 병합 버퍼
+
+    window > 0 이면 백그라운드 스레드가 window초마다 모인 상태를 반영하고,
+    0 이하이면 update()를 호출한 쪽에서 바로 반영
+    """
+
+    def __init__(self, engine, window=5.0):
+        self.engine = engine
+        self.window = window
+        self._drafts = {}
+        self._lock = threading.Lock()
+        # 게시글별 읽기-확인-저장/반영 직렬화용 분할 잠금 (다른 게시글끼리는 서로 막지 않음)
+        self._post_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def current(self, post_id, load):
+        """
+        반영 대기 중인 상태, 없으면 load()로 DB에서 읽은 상태
+
+        반영 중인 게시글을 반영 전 값으로 읽지 않도록 그 게시글의 반영이 끝난 뒤 읽음
+        """
+        with self._post_lock(post_id):
+            with self._lock:
+                draft = self._drafts.get(post_id)
+            if draft is not None:
+                return draft
+            return load()
+
+    def update(self, post_id, load, change):
+        """
+        현재 상태에 change를 적용해 저장하고 change의 결과를 반환
+
+        change(state)는 (저장할 Draft 또는 None, 결과)를 반환.
+        읽기-확인-저장 전체를 반영(flush)과 같은 게시글별 잠금 안에서 수행하므로,
+        그 사이 반영이 이전 상태를 꺼내 써서 새 상태의 기준(updated_at)이 어긋나는 일이 없음
+        """
+        with self._post_lock(post_id):
+            with self._lock:
+                state = self._drafts.get(post_id)
+            if state is None:
+                state = load()
+            draft, result = change(state)
+            if draft is not None:
+                with self._lock:
+                    self._drafts[post_id] = draft
+        if draft is not None:
+            if self.window > 0:
+                self._start()
+            else:
+                self.flush()
+        return result
+
+    def is_pending(self, post_id):
+        with self._lock:
+            return post_id in self._drafts
+
+    def take(self, post_id):
+        """반영 대기 중인 상태를 꺼냄 (게시글 수정 요청에 합쳐 반영할 때 사용)"""
+        with self._lock:
+            return self._drafts.pop(post_id, None)
+
+    def flush(self):
+        """
+        모인 상태를 DB에 반영, 반영한 게시글 수 반환 (충돌한 상태는 버림)
+
+        반영할 게시글의 잠금만 잡고 쓰므로 반영 중에도 다른 게시글의 자동 저장은 기다리지 않음
+        """
+        with self._lock:
+            post_ids = sorted(self._drafts)
+        if not post_ids:
+            return 0
+        # 잠금 순서 통일 (update()는 잠금을 하나만 잡으므로 교착 없음)
+        locks = [self._post_locks[i] for i in sorted({self._stripe(post_id) for post_id in post_ids})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            with self._lock:
+                drafts = {post_id: self._drafts.pop(post_id) for post_id in post_ids if post_id in self._drafts}
+            if not drafts:
+                return 0
+            return self._write(drafts)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _write(self, drafts):
+        table = Post.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.id == bindparam('post_id'),
+                table.c.status == PostStatus.DRAFT,
+                table.c.updated_at == bindparam('base_updated_at'),
+            )
+            .values(
+                title=bindparam('title'), content=bindparam('content'),
+                preview=bindparam('preview'), content_length=bindparam('content_length'),
+                updated_at=bindparam('now'),
+            )
+        )
+        written = 0
+        try:
+            with Session(self.engine) as session, session.begin():
+                now = datetime.utcnow()
+                # 행마다 충돌 여부를 알아야 하므로 executemany 대신 게시글별 실행 (ID 순으로 잠금 순서 통일)
+                for post_id, draft in sorted(drafts.items()):
+                    result = session.execute(stmt, {
+                        'post_id': post_id, 'base_updated_at': draft.updated_at,
+                        'title': draft.title, 'content': draft.content,
+                        'preview': make_preview(draft.content), 'content_length': len(draft.content),
+                        'now': now,
+                    })
+                    if result.rowcount:
+                        search_index.get_backend(session).index_post(session, post_id, draft.title, draft.content)
+                        written += 1
+        except Exception:
+            # 실패한 상태는 그 사이 새 상태가 들어오지 않았다면 다음 반영 때 다시 시도
+            with self._lock:
+                for post_id, draft in drafts.items():
+                    self._drafts.setdefault(post_id, draft)
+            raise
+        return written
+
+    def close(self):
+        """백그라운드 스레드 종료 후 남은 상태 반영 (프로세스 종료 시 호출)"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.window + 5)
+        self.flush()
+
+    def _stripe(self, post_id):
+        return post_id % len(self._post_locks)
+
+    def _post_lock(self, post_id):
+        return self._post_locks[self._stripe(post_id)]
+
+    def _start(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._stopped.is_set():
+                    self._thread = threading.Thread(target=self._run, name='draft-autosave-flusher', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.window)
+            if self._stopped.is_set():
+                return
+            try:
+                self.flush()
+            except Exception:
+                pass  # 상태는 버퍼에 복구되어 다음 주기에 재시도
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_autosave_buffer():
+    """프로세스 공용 자동 저장 버퍼 반환"""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = AutosaveBuffer(engine, window=float(os.getenv('DRAFT_AUTOSAVE_WINDOW', '5')))
+                atexit.register(_buffer.close)
+    return _buffer
+
+
+def take(post_id):
+    """반영 대기 중인 자동 저장 상태를 꺼냄 (없으면 None)"""
+    if _buffer is None:
+        return None
+    return _buffer.take(post_id)
+
+
+def flush():
+    """모인 자동 저장 즉시 반영"""
+    if _buffer is None:
+        return 0
+    return _buffer.flush()
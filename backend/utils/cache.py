@@ -0,0 +1,302 @@
+"""
+캐시 유틸리티
+프로세스 내 LRU(TTL) 캐시와 선택적 공유 캐시(Redis), 세대(generation) 기반 무효화,
+single-flight 재생성 및 적중률 집계
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # 공유 캐시는 선택 기능
+    redis = None
+
+
+class LocalCache:
+    """프로세스 내 LRU 캐시 (항목별 만료 시간)"""
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key):
+        # 세대 번호는 LRU 제거 대상이 아니므로 별도 보관
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counter(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class RedisCache:
+    """여러 워커가 공유하는 Redis 캐시 (값은 JSON 직렬화)"""
+
+    def __init__(self, url, prefix='community:'):
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        raw = self._client.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl):
+        self._client.set(self._prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+
+    def delete(self, key):
+        self._client.delete(self._prefix + key)
+
+    def incr(self, key):
+        return int(self._client.incr(self._prefix + key))
+
+    def add(self, key, ttl):
+        """키가 없을 때만 저장 (워커 간 잠금용), 저장했으면 True"""
+        return bool(self._client.set(self._prefix + key, 1, nx=True, ex=max(1, int(ttl))))
+
+    def get_counter(self, key):
+        return int(self._client.get(self._prefix + key) or 0)
+
+
+class _Flight:
+    """같은 키를 다시 만드는 중인 요청 (single-flight)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+class Cache:
+    """
+    2단계 캐시 (로컬 LRU → 공유 캐시)
+
+    세대 번호는 공유 캐시가 있으면 공유 캐시에 두어 모든 워커가 같은 값을 보며,
+    키에 세대 번호를 포함시키는 방식으로 무효화
+    """
+
+    def __init__(self, name, ttl, max_size=1024, shared=None):
+        self.name = name
+        self.ttl = ttl
+        self.local = LocalCache(max_size)
+        self.shared = shared
+        self._stats = {
+            'hits': 0, 'shared_hits': 0, 'misses': 0, 'sets': 0, 'invalidations': 0,
+            'stale_hits': 0, 'coalesced': 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+
+    def _count(self, stat):
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+    def get(self, key):
+        value = self.local.get(key)
+        if value is not None:
+            self._count('hits')
+            return value
+        if self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self._count('shared_hits')
+                self.local.set(key, value, self.ttl)
+                return value
+        self._count('misses')
+        return None
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl or self.ttl
+        self._count('sets')
+        self.local.set(key, value, ttl)
+        if self.shared is not None:
+            self.shared.set(key, value, ttl)
+
+    def delete(self, key):
+        self.local.delete(key)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def get_or_build(self, key, builder, version=None, stale_ttl=0, wait=5.0):
+        """
+        캐시 값 반환, 없거나 만료(또는 version 불일치)되었으면 builder()로 다시 만들어 저장
+
+        같은 키를 동시에 다시 만들 때는 한 요청만 builder를 실행하고(single-flight),
+        나머지는 stale_ttl 이내의 이전 값을 받거나 완료를 기다림.
+        공유 캐시가 있으면 워커 간에도 잠금을 잡아 한 워커만 다시 만듦.
+        builder가 None을 반환하면 저장하지 않음
+        """
+        entry = self.get(key)
+        if entry is not None and entry['version'] == version and entry['fresh_until'] > time.time():
+            return entry['value']
+        stale = entry['value'] if entry is not None else None
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if stale is not None:
+                self._count('stale_hits')
+                return stale
+            self._count('coalesced')
+            if flight.done.wait(wait) and flight.value is not None:
+                return flight.value
+            return builder()
+
+        lock_key = f'{self.name}:lock:{key}'
+        locked = False
+        try:
+            if self.shared is not None:
+                locked = self.shared.add(lock_key, wait)
+                if not locked and stale is not None:
+                    # 다른 워커가 다시 만드는 중
+                    self._count('stale_hits')
+                    return stale
+            value = builder()
+            if value is not None:
+                self.set(
+                    key,
+                    {'version': version, 'fresh_until': time.time() + self.ttl, 'value': value},
+                    self.ttl + stale_ttl
+                )
+            flight.value = value
+            return value
+        finally:
+            if locked:
+                self.shared.delete(lock_key)
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def generation(self, name):
+        store = self.shared if self.shared is not None else self.local
+        return store.get_counter(f'{self.name}:gen:{name}')
+
+    def bump(self, name):
+        """세대 번호 증가 (해당 세대를 키에 포함한 항목 전체 무효화)"""
+        self._count('invalidations')
+        store = self.shared if self.shared is not None else self.local
+        return store.incr(f'{self.name}:gen:{name}')
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['shared_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['shared_hits']) / lookups, 4) if lookups else 0.0
+        stats['size'] = len(self.local)
+        stats['backend'] = 'local+redis' if self.shared is not None else 'local'
+        return stats
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name, ttl=30, max_size=1024):
+    """이름별 캐시 인스턴스 반환 (CACHE_REDIS_URL 설정 시 공유 캐시 사용)"""
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                redis_url = os.getenv('CACHE_REDIS_URL', '')
+                shared = RedisCache(redis_url) if redis_url and redis is not None else None
+                cache = Cache(name, ttl=ttl, max_size=max_size, shared=shared)
+                _caches[name] = cache
+    return cache
+
+
+def cache_stats():
+    """모든 캐시의 적중/미스 통계"""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+# ---------------------------------------------------------------------- #
+# 게시글 목록 캐시
+# ---------------------------------------------------------------------- #
+POST_LIST_CACHE = 'post_list'
+
+
+def post_list_cache():
+    return get_cache(
+        POST_LIST_CACHE,
+        ttl=int(os.getenv('POST_LIST_CACHE_TTL', '30')),
+        max_size=int(os.getenv('POST_LIST_CACHE_SIZE', '1024')),
+    )
+
+
+def post_list_key(category_id, *params):
+    """
+    게시글 목록 캐시 키
+
+    카테고리 필터가 있으면 해당 카테고리 세대, 없으면 전체 세대를 키에 포함
+    """
+    cache = post_list_cache()
+    scope = f'category:{category_id}' if category_id else 'all'
+    return f'{POST_LIST_CACHE}:{scope}:{cache.generation(scope)}:' + json.dumps(params, ensure_ascii=False)
+
+
+def invalidate_post_lists(*category_ids):
+    """게시글 변경 후(커밋 뒤) 관련 카테고리 목록과 전체 목록 캐시 무효화"""
+    cache = post_list_cache()
+    cache.bump('all')
+    for category_id in set(category_ids):
+        if category_id:
+            cache.bump(f'category:{category_id}')
+
+
+# ---------------------------------------------------------------------- #
+# 게시글 상세 캐시
+# ---------------------------------------------------------------------- #
+POST_DETAIL_CACHE = 'post_detail'
+
+
+def post_detail_cache():
+    return get_cache(
+        POST_DETAIL_CACHE,
+        ttl=int(os.getenv('POST_DETAIL_CACHE_TTL', '60')),
+        max_size=int(os.getenv('POST_DETAIL_CACHE_SIZE', '1024')),
+    )
+
+
+def post_detail_key(post_id):
+    return f'{POST_DETAIL_CACHE}:{post_id}'
+
+
+def invalidate_post_detail(post_id):
+    """게시글 수정/삭제/이미지 변경 후(커밋 뒤) 상세 캐시 제거"""
+    post_detail_cache().delete(post_detail_key(post_id))
@@ -0,0 +1,93 @@
+"""
+댓글 경로(materialized path) 유틸리티
+댓글마다 조상 ID를 고정 폭으로 이어 붙인 path와 depth를 저장해,
+서브트리를 (post_id, path) 인덱스 범위 조회 한 번으로 표시 순서(깊이 우선, 같은 부모 안에서는 작성 순)대로 읽음
+
+예) 1번 댓글의 답글 7번: path = '0000000001' + '0000000007'
+"""
+import os
+
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.orm import aliased
+
+from models import Comment
+
+# 경로 한 단계의 폭 (ID를 0으로 채운 10자리 숫자)
+SEGMENT_WIDTH = 10
+
+# 최상위 댓글의 depth는 0, 답글을 달 수 있는 최대 depth
+MAX_DEPTH = int(os.getenv('COMMENT_MAX_DEPTH', '10'))
+
+# 숫자보다 큰 문자 (서브트리 범위의 상한)
+_UPPER = ':'
+
+
+def segment(comment_id):
+    return str(comment_id).zfill(SEGMENT_WIDTH)
+
+
+def child_path(parent_path, comment_id):
+    """부모 경로 아래 댓글 경로 (최상위 댓글은 parent_path=None)"""
+    return (parent_path or '') + segment(comment_id)
+
+
+def subtree_filter(path, include_self=True):
+    """경로 아래 댓글(서브트리) 범위 조건"""
+    lower = Comment.path >= path if include_self else Comment.path > path
+    return and_(lower, Comment.path < path + _UPPER)
+
+
+def assign(comment, parent=None):
+    """
+    새 댓글의 path/depth 설정 (ID가 필요하므로 flush 후 호출)
+
+    parent는 같은 게시글의 부모 댓글 (최상위 댓글은 None)
+    """
+    comment.path = child_path(parent.path if parent else None, comment.id)
+    comment.depth = parent.depth + 1 if parent else 0
+
+
+def backfill(db, post_ids=None, batch_size=500, commit=True):
+    """
+    path가 비어 있는 댓글을 부모가 채워진 것부터 배치 단위로 채움 (최상위 → 답글 순)
+
+    post_ids를 지정하면 해당 게시글 댓글만 처리. 배치마다 커밋하며(commit=False면 호출한 트랜잭션에 포함),
+    채운 댓글 수를 반환
+    """
+    table = Comment.__table__
+    parent = aliased(Comment)
+    # 경로는 표시용 파생 값이므로 updated_at은 그대로 유지
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam('comment_id'))
+        .values(path=bindparam('path'), depth=bindparam('depth'), updated_at=table.c.updated_at)
+    )
+    total = 0
+    while True:
+        query = (
+            select(Comment.id, parent.path.label('parent_path'), parent.depth.label('parent_depth'))
+            .outerjoin(parent, Comment.parent_id == parent.id)
+            .where(
+                Comment.path.is_(None),
+                # 최상위 댓글이거나 부모 경로가 이미 채워진 답글
+                (Comment.parent_id.is_(None)) | (parent.path.isnot(None)),
+            )
+            .order_by(Comment.id)
+            .limit(batch_size)
+        )
+        if post_ids is not None:
+            query = query.where(Comment.post_id.in_(post_ids))
+        rows = db.execute(query).all()
+        if not rows:
+            return total
+        db.execute(stmt, [
+            {
+                'comment_id': row.id,
+                'path': child_path(row.parent_path, row.id),
+                'depth': row.parent_depth + 1 if row.parent_path is not None else 0,
+            }
+            for row in rows
+        ])
+        if commit:
+            db.commit()
+        total += len(rows)
@@ -0,0 +1,143 @@
+"""
+게시글별 댓글 트리 스냅샷
+삭제되지 않은 댓글 전체를 경로(path) 순서의 평면 목록으로 직렬화해 캐시에 두고,
+댓글 작성/수정/삭제 시 다시 만들지 않고 변경분만 반영(write-through)
+
+스냅샷은 게시글의 comment_version을 버전으로 가지며, 최근 변경 기록을 함께 보관해
+클라이언트가 since_version 이후 변경분만 받을 수 있게 함
+"""
+import bisect
+import os
+import time
+from types import SimpleNamespace
+
+from models import Comment
+from utils.cache import get_cache
+from utils.serializers import comment_select, serialize_comment_row
+
+COMMENT_TREE_CACHE = 'comment_tree'
+
+# 스냅샷에 보관하는 최근 변경 기록 수
+MAX_CHANGES = int(os.getenv('COMMENT_TREE_MAX_CHANGES', '200'))
+
+
+def comment_tree_cache():
+    return get_cache(
+        COMMENT_TREE_CACHE,
+        ttl=int(os.getenv('COMMENT_TREE_CACHE_TTL', '600')),
+        max_size=int(os.getenv('COMMENT_TREE_CACHE_SIZE', '512')),
+    )
+
+
+def tree_key(post_id):
+    return f'{COMMENT_TREE_CACHE}:{post_id}'
+
+
+def _node(row):
+    """스냅샷 항목 (답글은 path/depth로 표현하므로 replies 제외)"""
+    data = serialize_comment_row(row)
+    del data['replies']
+    data['path'] = row.path
+    return data
+
+
+def build(db, post_id, version):
+    """게시글 댓글 전체로 스냅샷 생성 (한 번의 쿼리), 변경 기록은 version 이후부터 보관"""
+    rows = db.execute(
+        comment_select()
+        .where(Comment.post_id == post_id, Comment.is_deleted.is_(False))
+        .order_by(Comment.path)
+    ).all()
+    return {'comments': [_node(row) for row in rows], 'changes': [], 'changes_from': version}
+
+
+def get_snapshot(db, post_id, version):
+    """현재 댓글 버전의 스냅샷 (없거나 버전이 다르면 다시 만듦)"""
+    return comment_tree_cache().get_or_build(
+        tree_key(post_id), lambda: build(db, post_id, version), version=version
+    )
+
+
+def changes_since(snapshot, since_version):
+    """since_version 이후 변경 기록, 보관 범위를 벗어났으면 None"""
+    if since_version < snapshot['changes_from']:
+        return None
+    return [change for change in snapshot['changes'] if change['version'] > since_version]
+
+
+# ---------------------------------------------------------------------- #
+# 변경 기록 (댓글 쓰기 트랜잭션 안에서 만들고 커밋 후 apply로 반영)
+# ---------------------------------------------------------------------- #
+def upserts(db, version, comment_ids):
+    """작성/수정된 댓글(과 답글 수가 바뀐 부모 댓글)의 변경 기록"""
+    ids = [comment_id for comment_id in comment_ids if comment_id]
+    if not ids:
+        return []
+    rows = db.execute(comment_select().where(Comment.id.in_(ids), Comment.is_deleted.is_(False))).all()
+    return [{'version': version, 'op': 'upsert', 'comment': _node(row)} for row in rows]
+
+
+def creation(version, comment, parent=None):
+    """
+    새 댓글(과 답글 수가 하나 늘어난 부모 댓글)의 변경 기록
+
+    작성 트랜잭션에서 이미 읽은 행으로 만들어 다시 조회하지 않음 (parent는 답글 추가 전 comment_select() 행)
+    """
+    changes = [{'version': version, 'op': 'upsert', 'comment': _node(comment)}]
+    if parent is not None:
+        parent = SimpleNamespace(**dict(parent._mapping, reply_count=parent.reply_count + 1))
+        changes.append({'version': version, 'op': 'upsert', 'comment': _node(parent)})
+    return changes
+
+
+def deletion(version, comment_id):
+    return {'version': version, 'op': 'delete', 'id': comment_id}
+
+
+def apply(post_id, version, changes):
+    """
+    커밋된 변경을 스냅샷에 반영
+
+    스냅샷이 바로 이전 버전일 때만 변경분을 적용하고, 그 외에는 (다른 요청의 변경이 끼어든 경우 등) 스냅샷을 지워
+    다음 조회에서 다시 만들게 함
+    """
+    cache = comment_tree_cache()
+    key = tree_key(post_id)
+    entry = cache.get(key)
+    if entry is None:
+        return False
+    if entry['version'] != version - 1:
+        cache.delete(key)
+        return False
+
+    snapshot = entry['value']
+    # 다른 요청이 읽고 있을 수 있으므로 복사본을 고쳐 교체
+    comments = list(snapshot['comments'])
+    for change in changes:
+        if change['op'] == 'delete':
+            comments = [comment for comment in comments if comment['id'] != change['id']]
+        else:
+            _upsert(comments, change['comment'])
+
+    history = snapshot['changes'] + changes
+    changes_from = snapshot['changes_from']
+    if len(history) > MAX_CHANGES:
+        changes_from = history[-MAX_CHANGES - 1]['version']
+        history = history[-MAX_CHANGES:]
+
+    cache.set(key, {
+        'version': version,
+        'fresh_until': time.time() + cache.ttl,
+        'value': {'comments': comments, 'changes': history, 'changes_from': changes_from},
+    })
+    return True
+
+
+def _upsert(comments, node):
+    """경로 순서를 유지하며 항목 추가/교체"""
+    paths = [comment['path'] or '' for comment in comments]
+    index = bisect.bisect_left(paths, node['path'] or '')
+    if index < len(comments) and comments[index]['id'] == node['id']:
+        comments[index] = node
+    else:
+        comments.insert(index, node)
@@ -0,0 +1,118 @@
+"""
+댓글 쓰기 유틸리티
+게시글 댓글 수/버전의 SQL 측 증감과 소프트 삭제/복구 (작성자 삭제, 신고 누적 숨김과 복구에서 공용)
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import case, insert, select, update
+
+from models import Comment, Post, User
+from utils import comment_paths
+from utils import comment_tree
+from utils import hot
+from utils.cache import invalidate_post_lists
+from utils.sql import insert_returning, update_returning
+
+
+def change_post_comments(db, post_id, delta=0, commented_at=None):
+    """
+    게시글 댓글 버전 증가와 댓글 수/인기 점수 증감을 한 번의 UPDATE로 반영 (게시글 수정 시각은 유지)
+
+    인기 점수는 댓글 작성 시각(commented_at, 없으면 현재) 기준 가중치로 증감 (삭제/복구가 작성 때 더한 값을 그대로 되돌림).
+    (comment_version, category_id) 반환, 게시글이 없으면 None
+    """
+    values = {'comment_version': Post.comment_version + 1, 'updated_at': Post.updated_at}
+    if delta:
+        comment_count = Post.comment_count + delta
+        values['comment_count'] = case((comment_count < 0, 0), else_=comment_count)
+        values['hot_score'] = Post.hot_score + hot.increment(db, hot.COMMENT_WEIGHT * delta, commented_at)
+    return update_returning(
+        db,
+        update(Post).where(Post.id == post_id).values(**values),
+        [Post.comment_version, Post.category_id],
+        Post.id == post_id
+    )
+
+
+def create(db, post_id, author_id, content, parent=None, now=None):
+    """
+    댓글 추가 (호출한 트랜잭션에 포함), 댓글 트리 스냅샷 항목을 만들 수 있는 행 반환
+
+    parent는 comment_select()로 읽은 같은 게시글의 부모 댓글 행 (최상위 댓글은 None).
+    경로에는 자신의 ID가 들어가므로 INSERT로 ID(와 작성자 닉네임)를 받은 뒤 경로만 채움
+    """
+    now = now or datetime.utcnow()
+    depth = parent.depth + 1 if parent else 0
+    inserted = insert_returning(
+        db,
+        insert(Comment).values(
+            post_id=post_id, author_id=author_id, parent_id=parent.id if parent else None,
+            content=content, depth=depth, created_at=now, updated_at=now,
+        ),
+        [Comment.id, select(User.nickname).where(User.id == author_id).scalar_subquery().label('author_nickname')]
+    )
+    path = comment_paths.child_path(parent.path if parent else None, inserted.id)
+    db.execute(update(Comment).where(Comment.id == inserted.id).values(path=path, updated_at=Comment.updated_at))
+    return SimpleNamespace(
+        id=inserted.id, post_id=post_id, author_id=author_id, author_nickname=inserted.author_nickname,
+        parent_id=parent.id if parent else None, depth=depth, path=path, content=content,
+        created_at=now, updated_at=now, reply_count=0,
+    )
+
+
+def soft_delete(db, comment_id, author_id=None):
+    """
+    삭제되지 않은 댓글을 한 번의 UPDATE로 소프트 삭제하고 게시글 댓글 수 감소 (호출한 트랜잭션에 포함)
+
+    author_id를 주면 해당 작성자의 댓글만 삭제. 삭제하지 않았으면 None,
+    삭제했으면 (post_id, 게시글 갱신 결과 또는 None, 댓글 트리 변경 목록) 반환 (커밋 후 after_delete에 전달)
+    """
+    criteria = [Comment.id == comment_id, Comment.is_deleted.is_(False)]
+    if author_id is not None:
+        criteria.append(Comment.author_id == author_id)
+    deleted = update_returning(
+        db,
+        update(Comment).where(*criteria).values(is_deleted=True),
+        [Comment.post_id, Comment.parent_id, Comment.created_at],
+        Comment.id == comment_id
+    )
+    if not deleted:
+        return None
+
+    post = change_post_comments(db, deleted.post_id, -1, deleted.created_at)
+    changes = []
+    if post:
+        changes = [comment_tree.deletion(post.comment_version, comment_id)]
+        changes += comment_tree.upserts(db, post.comment_version, [deleted.parent_id])
+    return deleted.post_id, post, changes
+
+
+def restore(db, comment_id):
+    """
+    소프트 삭제된 댓글을 되살리고 게시글 댓글 수 증가 (호출한 트랜잭션에 포함)
+
+    되살리지 않았으면 None, 되살렸으면 soft_delete와 같은 형태의 값 반환 (커밋 후 after_delete에 전달)
+    """
+    restored = update_returning(
+        db,
+        update(Comment).where(Comment.id == comment_id, Comment.is_deleted.is_(True)).values(is_deleted=False),
+        [Comment.post_id, Comment.parent_id, Comment.created_at],
+        Comment.id == comment_id
+    )
+    if not restored:
+        return None
+
+    post = change_post_comments(db, restored.post_id, 1, restored.created_at)
+    changes = []
+    if post:
+        changes = comment_tree.upserts(db, post.comment_version, [comment_id, restored.parent_id])
+    return restored.post_id, post, changes
+
+
+def after_delete(deleted):
+    """soft_delete/restore 커밋 후 게시글 목록 캐시 무효화와 댓글 트리 스냅샷 반영"""
+    post_id, post, changes = deleted
+    if post:
+        invalidate_post_lists(post.category_id)
+        comment_tree.apply(post_id, post.comment_version, changes)
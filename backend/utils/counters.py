@@ -0,0 +1,145 @@
+"""
+집계 카운터 유틸리티
+게시글(카테고리×상태), 회원(전체/활성), 신고(상태별) 개수를 stat_counters 테이블에 유지
+"""
+from sqlalchemy import case, delete, func, or_, select
+
+from models import StatCounter, Post, PostStatus, User, Report, ReportStatus
+from utils.sql import upsert_add
+
+# rebuild()가 다시 계산하는 키 접두어 (그 외 키는 다른 모듈이 관리)
+_MANAGED_PREFIXES = ('posts:', 'users:', 'reports:')
+
+USERS_TOTAL = 'users:total'
+USERS_ACTIVE = 'users:active'
+
+
+def post_key(status, category_id=None):
+    """게시글 카운터 키 (category_id가 None이면 해당 상태 전체)"""
+    return f'posts:{status.value}:{"all" if category_id is None else category_id}'
+
+
+def report_key(status):
+    """신고 카운터 키"""
+    return f'reports:{status.value}'
+
+
+def _uncategorized_key(status):
+    return f'posts:{status.value}:none'
+
+
+def increment(db, key, delta=1):
+    """카운터 증감 (호출한 트랜잭션에 포함)"""
+    if delta:
+        upsert_add(db, StatCounter.__table__, StatCounter.key, key, StatCounter.value, delta)
+
+
+def get(db, key):
+    """카운터 값 조회 (없으면 0)"""
+    value = db.execute(select(StatCounter.value).where(StatCounter.key == key)).scalar()
+    return int(value or 0)
+
+
+def get_sum(db, keys):
+    """여러 카운터 합계 조회"""
+    value = db.execute(select(func.sum(StatCounter.value)).where(StatCounter.key.in_(list(keys)))).scalar()
+    return int(value or 0)
+
+
+def post_changed(db, old_status, old_category_id, new_status, new_category_id):
+    """게시글 생성/상태 변경/카테고리 변경 시 카운터 반영 (생성은 old_status=None)"""
+    if (old_status, old_category_id) == (new_status, new_category_id):
+        return
+    if old_status is not None:
+        increment(db, _category_key(old_status, old_category_id), -1)
+        if old_status != new_status:
+            increment(db, post_key(old_status), -1)
+    if new_status is not None:
+        increment(db, _category_key(new_status, new_category_id), 1)
+        if old_status != new_status:
+            increment(db, post_key(new_status), 1)
+
+
+def posts_created(db, posts):
+    """게시글 여러 건 생성 시 카운터 일괄 반영 ((status, category_id) 목록)"""
+    deltas = {}
+    for status, category_id in posts:
+        for key in (post_key(status), _category_key(status, category_id)):
+            deltas[key] = deltas.get(key, 0) + 1
+    for key, delta in deltas.items():
+        increment(db, key, delta)
+
+
+def _category_key(status, category_id):
+    return _uncategorized_key(status) if category_id is None else post_key(status, category_id)
+
+
+def user_created(db, is_active=True):
+    """회원 생성 시 카운터 반영"""
+    increment(db, USERS_TOTAL, 1)
+    if is_active:
+        increment(db, USERS_ACTIVE, 1)
+
+
+def user_active_changed(db, was_active, is_active):
+    """회원 활성 상태 변경 시 카운터 반영"""
+    if bool(was_active) != bool(is_active):
+        increment(db, USERS_ACTIVE, 1 if is_active else -1)
+
+
+def report_status_changed(db, old_status, new_status):
+    """신고 생성/상태 변경 시 카운터 반영 (생성은 old_status=None)"""
+    if old_status == new_status:
+        return
+    if old_status is not None:
+        increment(db, report_key(old_status), -1)
+    increment(db, report_key(new_status), 1)
+
+
+def post_total(db, status, category_id=None):
+    """상태(및 카테고리)별 게시글 수, status가 None이면 전체 상태 합계"""
+    if status is None:
+        return get_sum(db, [post_key(s) for s in PostStatus])
+    return get(db, post_key(status, category_id))
+
+
+def report_total(db, status=None):
+    """상태별 신고 수, status가 None이면 전체 합계"""
+    if status is None:
+        return get_sum(db, [report_key(s) for s in ReportStatus])
+    return get(db, report_key(status))
+
+
+def rebuild(db):
+    """
+    모든 카운터를 원본 테이블에서 다시 계산 (GROUP BY 기반)
+
+    변경된 카운터 수를 반환하며, 커밋은 호출한 쪽에서 수행
+    """
+    counts = {}
+    for status, category_id, count in db.execute(
+        select(Post.status, Post.category_id, func.count()).group_by(Post.status, Post.category_id)
+    ):
+        counts[_category_key(status, category_id)] = count
+        counts[post_key(status)] = counts.get(post_key(status), 0) + count
+
+    total, active = db.execute(
+        select(func.count(User.id), func.coalesce(func.sum(case((User.is_active.is_(True), 1), else_=0)), 0))
+    ).one()
+    counts[USERS_TOTAL] = total
+    counts[USERS_ACTIVE] = active
+
+    for status, count in db.execute(select(Report.status, func.count()).group_by(Report.status)):
+        counts[report_key(status)] = count
+
+    managed = or_(*[StatCounter.key.startswith(prefix, autoescape=True) for prefix in _MANAGED_PREFIXES])
+    existing = dict(db.execute(select(StatCounter.key, StatCounter.value).where(managed)).all())
+    changed = sum(1 for key in set(existing) | set(counts) if existing.get(key, 0) != counts.get(key, 0))
+
+    db.execute(delete(StatCounter).where(managed))
+    if counts:
+        db.execute(
+            StatCounter.__table__.insert(),
+            [{'key': key, 'value': value} for key, value in counts.items()]
+        )
+    return changed
@@ -0,0 +1,127 @@
+"""
+관리자 데이터 내보내기 유틸리티
+서버 측 커서(yield_per)로 행을 나눠 읽어 NDJSON/CSV로 스트리밍 (테이블 크기와 관계없이 메모리 일정)
+"""
+import csv
+import io
+import json
+from datetime import datetime
+
+from models import Post, PostStatus, Report, ReportStatus, User
+from utils.errors import ValidationError
+from utils.serializers import (
+    post_list_select, serialize_admin_post_row,
+    user_list_select, serialize_user_row,
+    report_list_select, serialize_report_row,
+)
+
+# 서버 측 커서에서 한 번에 가져올 행 수
+YIELD_PER = 1000
+
+FORMATS = ('ndjson', 'csv')
+
+# 스프레드시트가 수식으로 해석하는 첫 글자 (사용자 입력 셀은 앞에 '를 붙여 문자열로 고정)
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def _post_status(value):
+    return Post.status == PostStatus[value.upper()]
+
+
+def _user_status(value):
+    if value not in ('active', 'inactive'):
+        raise KeyError(value)
+    return User.is_active.is_(value == 'active')
+
+
+def _report_status(value):
+    return Report.status == ReportStatus[value.upper()]
+
+
+# 리소스별 (쿼리, 직렬화 함수, CSV 컬럼, 상태 필터, 생성일 컬럼, 정렬 컬럼)
+EXPORTS = {
+    'posts': (
+        post_list_select, serialize_admin_post_row,
+        ('id', 'title', 'author_id', 'author_nickname', 'status',
+         'view_count', 'like_count', 'comment_count', 'created_at'),
+        _post_status, Post.created_at, Post.id,
+    ),
+    'users': (
+        user_list_select, serialize_user_row,
+        ('id', 'email', 'nickname', 'role', 'is_active', 'created_at'),
+        _user_status, User.created_at, User.id,
+    ),
+    'reports': (
+        report_list_select, lambda row: serialize_report_row(row, admin=True),
+        ('id', 'report_type', 'post_id', 'comment_id', 'reason', 'status', 'reporter_id',
+         'reporter_nickname', 'admin_note', 'processed_by', 'processed_at', 'created_at'),
+        _report_status, Report.created_at, Report.id,
+    ),
+}
+
+
+def _parse_date(value, name):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f'{name}는 ISO 8601 형식(YYYY-MM-DD)이어야 합니다')
+
+
+def build_query(resource, status=None, date_from=None, date_to=None):
+    """내보내기 쿼리 생성 (status, 생성일 범위 [date_from, date_to) 필터)"""
+    if resource not in EXPORTS:
+        raise ValidationError(f'지원하지 않는 내보내기 대상입니다: {resource}')
+    select_func, _, _, status_filter, created_col, id_col = EXPORTS[resource]
+    query = select_func()
+    if status:
+        try:
+            query = query.where(status_filter(status))
+        except KeyError:
+            raise ValidationError(f'유효하지 않은 상태입니다: {status}')
+    if date_from:
+        query = query.where(created_col >= _parse_date(date_from, 'from'))
+    if date_to:
+        query = query.where(created_col < _parse_date(date_to, 'to'))
+    return query.order_by(id_col).execution_options(yield_per=YIELD_PER)
+
+
+def iter_ndjson(rows, serialize):
+    """한 줄에 JSON 객체 하나"""
+    for row in rows:
+        yield json.dumps(serialize(row), ensure_ascii=False) + '\n'
+
+
+def _csv_cell(value):
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(rows, serialize, fields):
+    """헤더 + 행 단위 CSV (UTF-8 BOM 포함, 엑셀 호환, 수식 주입 방지)"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+    buffer.write('﻿')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({key: _csv_cell(value) for key, value in serialize(row).items()})
+        # 일정 크기마다 내보내 버퍼가 커지지 않도록 함
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_rows(db, resource, query, fmt):
+    """쿼리 결과를 형식에 맞는 문자열 조각으로 스트리밍"""
+    _, serialize, fields, _, _, _ = EXPORTS[resource]
+    rows = db.execute(query)
+    if fmt == 'csv':
+        return iter_csv(rows, serialize, fields)
+    return iter_ndjson(rows, serialize)
@@ -0,0 +1,232 @@
+"""
+인기(hot) 점수 유틸리티
+시간 감쇠 점수를 posts.hot_score 컬럼에 증분 유지
+
+이벤트마다 weight × 2^((발생 시각 - 기준 시각) / 반감기)를 더하는 방식으로,
+모든 게시글이 같은 비율로 감쇠하므로 저장된 값의 순서가 곧 감쇠 점수 순서가 됨.
+값이 계속 커지므로 rebase()로 기준 시각을 현재로 옮기며 전체를 다시 축소
+(ID 범위 배치로 나눠 옮기며, 진행 중에는 옮긴 게시글과 아닌 게시글이 각자의 기준 시각을 사용)
+
+기준 시각은 프로세스마다 STATE_TTL초 동안 캐시하므로 이벤트마다 stat_counters를 읽지 않음.
+재감쇠는 새 기준 시각을 커밋한 뒤 STATE_TTL초를 기다려 모든 프로세스가 진행 중임을 안 다음에 점수를 옮기고,
+진행 중인 동안에만 이벤트가 기준 시각 행을 잠가 읽음
+"""
+import os
+import time
+from datetime import timezone
+
+from sqlalchemy import bindparam, case, select, update
+
+from models import Post, PostLike, Comment, PostStatus, StatCounter
+from utils.sql import dialect_insert
+
+EPOCH_KEY = 'hot:epoch'
+# 진행 중인 재감쇠의 새 기준 시각 (0이면 진행 중 아님)과 새 기준 시각으로 옮긴 마지막 게시글 ID
+REBASE_EPOCH_KEY = 'hot:rebase_epoch'
+REBASED_ID_KEY = 'hot:rebased_id'
+
+HALF_LIFE = float(os.getenv('HOT_HALF_LIFE_HOURS', '24')) * 3600
+# 프로세스 내 기준 시각 캐시 유지 시간 (초)
+STATE_TTL = float(os.getenv('HOT_STATE_TTL', '30'))
+
+# (만료 시각, (기준 시각, 진행 중인 재감쇠의 새 기준 시각 또는 0))
+_cached = {}
+
+# 이벤트별 가중치
+POST_WEIGHT = 1.0
+LIKE_WEIGHT = 1.0
+COMMENT_WEIGHT = 2.0
+VIEW_WEIGHT = 0.05
+
+
+def _timestamp(value=None):
+    if value is None:
+        return time.time()
+    # DB의 DateTime은 UTC 기준 naive 값
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def get_epoch(db, for_update=False):
+    """점수 기준 시각(Unix 초), 없으면 현재 시각으로 생성"""
+    query = select(StatCounter.value).where(StatCounter.key == EPOCH_KEY)
+    value = db.execute(query.with_for_update(read=not for_update)).scalar()
+    if value is None:
+        stmt = dialect_insert(db, StatCounter.__table__).values(key=EPOCH_KEY, value=int(time.time()))
+        if db.get_bind().dialect.name == 'mysql':
+            stmt = stmt.prefix_with('IGNORE')
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=['key'])
+        db.execute(stmt)
+        value = db.execute(query).scalar()
+    return value
+
+
+def _state(db, for_update=False):
+    """(기준 시각, 진행 중인 재감쇠의 새 기준 시각 또는 0, 옮긴 마지막 게시글 ID), 기준 시각 행을 잠금"""
+    keys = (EPOCH_KEY, REBASE_EPOCH_KEY, REBASED_ID_KEY)
+    values = dict(db.execute(
+        select(StatCounter.key, StatCounter.value)
+        .where(StatCounter.key.in_(keys))
+        .with_for_update(read=not for_update)
+    ).all())
+    if EPOCH_KEY not in values:
+        values[EPOCH_KEY] = get_epoch(db, for_update)
+    return values[EPOCH_KEY], values.get(REBASE_EPOCH_KEY, 0), values.get(REBASED_ID_KEY, 0)
+
+
+def _cached_state(db):
+    """(기준 시각, 진행 중인 재감쇠의 새 기준 시각 또는 0), 잠그지 않고 읽어 STATE_TTL초 동안 캐시"""
+    now = time.monotonic()
+    cached = _cached.get('state')
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    values = dict(db.execute(
+        select(StatCounter.key, StatCounter.value).where(StatCounter.key.in_((EPOCH_KEY, REBASE_EPOCH_KEY)))
+    ).all())
+    if EPOCH_KEY not in values:
+        values[EPOCH_KEY] = get_epoch(db)
+    state = (values[EPOCH_KEY], values.get(REBASE_EPOCH_KEY, 0))
+    # 읽기 전 시각부터 재므로 재감쇠가 기다리는 시간 안에 반드시 만료됨
+    _cached['state'] = (now + STATE_TTL, state)
+    return state
+
+
+def _put(db, key, value):
+    stmt = dialect_insert(db, StatCounter.__table__).values(key=key, value=value)
+    if db.get_bind().dialect.name == 'mysql':
+        stmt = stmt.on_duplicate_key_update(value=value)
+    else:
+        stmt = stmt.on_conflict_do_update(index_elements=['key'], set_={'value': value})
+    db.execute(stmt)
+
+
+def weight_at(epoch, weight, when=None):
+    """기준 시각 대비 발생 시각의 가중치"""
+    return weight * 2 ** ((_timestamp(when) - epoch) / HALF_LIFE)
+
+
+def increment(db, weight, when=None):
+    """
+    이벤트 하나의 점수 증가분 (다른 컬럼 갱신과 같은 posts UPDATE에 포함할 때 사용)
+
+    재감쇠가 진행 중이면 게시글이 이미 새 기준 시각으로 옮겨졌는지에 따라 값을 고르는 SQL 식
+    """
+    epoch, rebase_epoch = _cached_state(db)
+    if not rebase_epoch:
+        return weight_at(epoch, weight, when)
+    # 재감쇠 중에는 기준 시각 행을 잠가 옮긴 범위를 배치 커밋과 어긋나지 않게 읽음 (끝났으면 새 기준 시각)
+    epoch, rebase_epoch, rebased_id = _state(db)
+    if not rebase_epoch:
+        return weight_at(epoch, weight, when)
+    return case(
+        (Post.id <= rebased_id, weight_at(rebase_epoch, weight, when)),
+        else_=weight_at(epoch, weight, when)
+    )
+
+
+def add(db, post_id, weight, when=None):
+    """게시글 점수에 이벤트 반영 (취소 이벤트는 음수 weight, 호출한 트랜잭션에 포함)"""
+    table = Post.__table__
+    db.execute(
+        update(table)
+        .where(table.c.id == post_id)
+        .values(hot_score=table.c.hot_score + increment(db, weight, when), updated_at=table.c.updated_at)
+    )
+
+
+def rebase(db, now=None, batch_size=1000):
+    """
+    기준 시각을 현재로 옮기고 전체 점수를 같은 비율로 축소 (주기적 재감쇠 작업)
+
+    새 기준 시각을 커밋하고 STATE_TTL초 기다린 뒤(다른 프로세스의 캐시 만료), 게시글 ID 범위 배치마다
+    옮긴 마지막 ID와 함께 커밋하며 마지막 배치 뒤에 기준 시각을 바꿈. 중단되면 다음 실행이 같은 새 기준 시각으로
+    이어서 진행. 순서는 그대로 유지되며, 갱신한 게시글 수를 반환
+    """
+    now = int(now if now is not None else time.time())
+    # 배치마다 기준 시각 행을 잠가 그 사이 점수 증가가 옮긴 범위를 잘못 읽지 않도록 함
+    epoch, rebase_epoch, rebased_id = _state(db, for_update=True)
+    if not rebase_epoch:
+        rebase_epoch, rebased_id = now, 0
+        _put(db, REBASE_EPOCH_KEY, rebase_epoch)
+        _put(db, REBASED_ID_KEY, rebased_id)
+    if not rebased_id:
+        # 아직 옮긴 게시글이 없으면 모든 프로세스가 진행 중임을 알 때까지 기다림 (캐시된 기준 시각으로 더하지 않도록)
+        db.commit()
+        _cached.clear()
+        time.sleep(STATE_TTL)
+        _state(db, for_update=True)
+    factor = 2 ** ((epoch - rebase_epoch) / HALF_LIFE)
+    table = Post.__table__
+    count = 0
+    while True:
+        ids = db.execute(
+            select(table.c.id).where(table.c.id > rebased_id).order_by(table.c.id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            _put(db, EPOCH_KEY, rebase_epoch)
+            _put(db, REBASE_EPOCH_KEY, 0)
+            db.commit()
+            _cached.clear()
+            return count
+        result = db.execute(
+            update(table)
+            .where(table.c.id > rebased_id, table.c.id <= ids[-1], table.c.hot_score != 0)
+            .values(hot_score=table.c.hot_score * factor, updated_at=table.c.updated_at)
+        )
+        count += result.rowcount
+        rebased_id = ids[-1]
+        _put(db, REBASED_ID_KEY, rebased_id)
+        db.commit()
+        _state(db, for_update=True)
+
+
+def rebuild(db, batch_size=500):
+    """
+    게시글 작성/좋아요/댓글 시각으로 점수를 다시 계산 (기존 데이터 채우기/보정용)
+
+    조회는 발생 시각이 없으므로 게시글 작성 시각 기준으로 계산. 갱신한 게시글 수를 반환
+    (재감쇠가 진행 중이었으면 그 새 기준 시각으로 계산하고 재감쇠를 끝냄)
+    """
+    epoch, rebase_epoch, _ = _state(db, for_update=True)
+    if rebase_epoch:
+        epoch = rebase_epoch
+        _put(db, EPOCH_KEY, epoch)
+        _put(db, REBASE_EPOCH_KEY, 0)
+        _cached.clear()
+    table = Post.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam('post_id'))
+        .values(hot_score=bindparam('score'), updated_at=table.c.updated_at)
+    )
+    last_id = 0
+    count = 0
+    while True:
+        posts = db.execute(
+            select(Post.id, Post.status, Post.created_at, Post.view_count)
+            .where(Post.id > last_id).order_by(Post.id).limit(batch_size)
+        ).all()
+        if not posts:
+            return count
+        scores = {}
+        for post in posts:
+            if post.status == PostStatus.PUBLISHED:
+                scores[post.id] = (weight_at(epoch, POST_WEIGHT, post.created_at)
+                                   + weight_at(epoch, VIEW_WEIGHT, post.created_at) * post.view_count)
+            else:
+                scores[post.id] = 0.0
+        ids = [post.id for post in posts]
+        for post_id, created_at in db.execute(
+            select(PostLike.post_id, PostLike.created_at).where(PostLike.post_id.in_(ids))
+        ):
+            if scores[post_id]:
+                scores[post_id] += weight_at(epoch, LIKE_WEIGHT, created_at)
+        for post_id, created_at in db.execute(
+            select(Comment.post_id, Comment.created_at)
+            .where(Comment.post_id.in_(ids), Comment.is_deleted.is_(False))
+        ):
+            if scores[post_id]:
+                scores[post_id] += weight_at(epoch, COMMENT_WEIGHT, created_at)
+        db.execute(stmt, [{'post_id': post_id, 'score': score} for post_id, score in scores.items()])
+        count += len(posts)
+        last_id = posts[-1].id
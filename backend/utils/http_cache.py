@@ -0,0 +1,50 @@
+"""
+HTTP 조건부 요청 유틸리티
+약한 ETag 생성, If-None-Match 비교(304 응답), 인증 여부에 따른 Cache-Control 설정
+"""
+import hashlib
+import json
+import os
+
+from flask import Response, jsonify, request
+
+# 비로그인 응답을 공유 캐시(CDN/프록시)가 재검증 없이 사용할 수 있는 시간(초)
+PUBLIC_MAX_AGE = int(os.getenv('HTTP_CACHE_MAX_AGE', '0'))
+
+
+def make_etag(*parts):
+    """리소스 버전 값들로 ETag 생성"""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:32]
+
+
+def data_etag(data):
+    """응답 데이터 내용으로 ETag 생성"""
+    return make_etag(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def not_modified(etag):
+    """If-None-Match가 ETag와 일치하면 304 응답, 아니면 None"""
+    if etag and request.if_none_match.contains_weak(etag):
+        return with_cache_headers(Response(status=304), etag)
+    return None
+
+
+def conditional_json(data, etag=None):
+    """ETag가 일치하면 304, 아니면 캐시 헤더를 붙인 JSON 응답 (etag 미지정 시 내용으로 생성)"""
+    etag = etag or data_etag(data)
+    return not_modified(etag) or with_cache_headers(jsonify(data), etag)
+
+
+def with_cache_headers(response, etag):
+    """
+    약한 ETag와 Cache-Control 설정
+
+    비로그인 응답은 공유 캐시 저장을 허용하고, 로그인 응답은 브라우저에만 저장하며 매번 재검증
+    """
+    response.set_etag(etag, weak=True)
+    if 'Authorization' in request.headers:
+        response.headers['Cache-Control'] = 'private, no-cache'
+    else:
+        response.headers['Cache-Control'] = f'public, max-age={PUBLIC_MAX_AGE}, must-revalidate'
+    response.vary.add('Authorization')
+    return response
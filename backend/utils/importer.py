@@ -0,0 +1,190 @@
+"""
+게시글 일괄 가져오기 유틸리티
+NDJSON(한 줄에 게시글 하나, 이미지/댓글 포함)을 스트리밍으로 검증하고 배치 단위로 일괄 INSERT
+"""
+import json
+from datetime import datetime, timezone
+
+from marshmallow import ValidationError as SchemaValidationError
+from sqlalchemy import insert, select
+
+from models import Category, Comment, Post, PostImage, PostStatus, User
+from utils import comment_paths, counters, hot
+from utils import search as search_index
+from utils.preview import apply_content
+from utils.validators import PostImportSchema
+
+DEFAULT_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 5000
+
+# 응답에 포함할 행 오류 최대 수
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportReport:
+    """가져오기 결과 (성공/실패 수, 행 번호별 오류)"""
+
+    def __init__(self):
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+        self.category_ids = set()
+
+    def add_error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def to_dict(self):
+        return {
+            'imported': self.imported,
+            'failed': self.failed,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+        }
+
+
+def iter_records(lines):
+    """NDJSON 줄을 (행 번호, 데이터 또는 None, 오류) 로 변환 (빈 줄은 건너뜀)"""
+    for line_no, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line), None
+        except ValueError as e:
+            yield line_no, None, {'_json': [f'JSON 형식이 올바르지 않습니다: {e}']}
+
+
+def import_posts(db, lines, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    NDJSON 게시글 일괄 가져오기
+
+    batch_size 행마다 검증/INSERT/커밋하며, 잘못된 행은 오류로 기록하고 나머지는 계속 처리.
+    ImportReport를 반환
+    """
+    batch_size = min(max(batch_size, 1), MAX_BATCH_SIZE)
+    schema = PostImportSchema()
+    report = ImportReport()
+    batch = []
+    for line_no, data, error in iter_records(lines):
+        if error is None:
+            try:
+                data = schema.load(data)
+            except SchemaValidationError as e:
+                error = e.messages
+        if error is not None:
+            report.add_error(line_no, error)
+            continue
+        batch.append((line_no, data))
+        if len(batch) >= batch_size:
+            _import_batch(db, batch, report)
+            batch = []
+    if batch:
+        _import_batch(db, batch, report)
+    return report
+
+
+def _import_batch(db, batch, report):
+    """배치 하나를 참조 검증 후 INSERT하고 커밋"""
+    user_ids = {data['author_id'] for _, data in batch}
+    user_ids.update(c['author_id'] for _, data in batch for c in data['comments'])
+    existing_users = set(db.execute(select(User.id).where(User.id.in_(user_ids))).scalars())
+    category_ids = {data['category_id'] for _, data in batch if data.get('category_id')}
+    existing_categories = set(
+        db.execute(select(Category.id).where(Category.id.in_(category_ids))).scalars()
+    ) if category_ids else set()
+
+    valid = []
+    for line_no, data in batch:
+        errors = {}
+        if data['author_id'] not in existing_users:
+            errors['author_id'] = ['존재하지 않는 사용자입니다']
+        if data.get('category_id') and data['category_id'] not in existing_categories:
+            errors['category_id'] = ['존재하지 않는 카테고리입니다']
+        missing = sorted({c['author_id'] for c in data['comments']} - existing_users)
+        if missing:
+            errors['comments'] = [f'존재하지 않는 댓글 작성자입니다: {missing}']
+        if errors:
+            report.add_error(line_no, errors)
+        else:
+            valid.append((line_no, data))
+
+    if valid:
+        epoch = hot.get_epoch(db)
+        try:
+            # 배치 전체를 savepoint 안에서 INSERT, 실패하면 행 단위로 다시 시도해 문제 행만 제외
+            with db.begin_nested():
+                _insert(db, valid, epoch)
+            imported = valid
+        except Exception:
+            imported = []
+            for line_no, data in valid:
+                try:
+                    with db.begin_nested():
+                        _insert(db, [(line_no, data)], epoch)
+                    imported.append((line_no, data))
+                except Exception as e:
+                    report.add_error(line_no, {'_database': [str(e.__cause__ or e)]})
+        report.imported += len(imported)
+        report.category_ids.update(data.get('category_id') for _, data in imported)
+    db.commit()
+
+
+def _insert(db, rows, epoch):
+    now = datetime.utcnow()
+    posts = []
+    for _, data in rows:
+        created_at = _naive(data.get('created_at')) or now
+        published = data['status'] == 'published'
+        comments = data['comments']
+        post = Post(
+            author_id=data['author_id'],
+            category_id=data.get('category_id'),
+            title=data['title'],
+            status=PostStatus.PUBLISHED if published else PostStatus.DRAFT,
+            comment_count=len(comments),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        apply_content(post, data['content'])
+        if published:
+            post.hot_score = hot.weight_at(epoch, hot.POST_WEIGHT, created_at) + sum(
+                hot.weight_at(epoch, hot.COMMENT_WEIGHT, _naive(c.get('created_at')) or now) for c in comments
+            )
+        posts.append(post)
+    db.add_all(posts)
+    db.flush()
+
+    images = []
+    comments = []
+    for post, (_, data) in zip(posts, rows):
+        images.extend(
+            {'post_id': post.id, 'image_url': url, 'order': idx, 'created_at': now}
+            for idx, url in enumerate(data['images'])
+        )
+        for comment in data['comments']:
+            created_at = _naive(comment.get('created_at')) or now
+            comments.append({
+                'post_id': post.id, 'author_id': comment['author_id'], 'parent_id': None,
+                'content': comment['content'], 'is_deleted': False,
+                'created_at': created_at, 'updated_at': created_at,
+            })
+        search_index.index_post(db, post)
+
+    # 이미지/댓글은 executemany로 일괄 INSERT
+    if images:
+        db.execute(insert(PostImage.__table__), images)
+    if comments:
+        db.execute(insert(Comment.__table__), comments)
+        comment_paths.backfill(db, post_ids=[post.id for post in posts], commit=False)
+    counters.posts_created(db, [(post.status, post.category_id) for post in posts])
+
+
+def _naive(value):
+    """시간대가 있는 값은 UTC 기준 naive datetime으로 변환"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
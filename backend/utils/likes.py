@@ -0,0 +1,75 @@
+"""
+게시글 좋아요 유틸리티
+(user_id, post_id) 유니크 키 기반 INSERT 무시/DELETE 와 SQL 측 like_count 증감
+"""
+from datetime import datetime
+
+from sqlalchemy import and_, delete, select, update
+
+from models import Post, PostLike
+from utils import hot
+from utils.sql import delete_returning, dialect_insert
+
+
+def add_like(db, user_id, post_id):
+    """
+    좋아요 추가 (이미 있으면 무시)
+
+    실제로 추가된 경우에만 like_count(와 인기 점수)를 증가시키며, (추가 여부, like_count) 반환
+    """
+    now = datetime.utcnow()
+    stmt = dialect_insert(db, PostLike.__table__).values(user_id=user_id, post_id=post_id, created_at=now)
+    if db.get_bind().dialect.name == 'mysql':
+        stmt = stmt.prefix_with('IGNORE')
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=['user_id', 'post_id'])
+    added = db.execute(stmt).rowcount == 1
+    if added:
+        return True, _change_like_count(db, post_id, 1, now)
+    return False, _get_like_count(db, post_id)
+
+
+def remove_like(db, user_id, post_id):
+    """
+    좋아요 취소 (없으면 무시)
+
+    실제로 삭제된 경우에만 like_count(와 인기 점수)를 감소시키며, (삭제 여부, like_count) 반환
+    (인기 점수는 좋아요를 누른 시각의 가중치만큼 빼서 추가 전 점수로 되돌림)
+    """
+    criteria = and_(PostLike.user_id == user_id, PostLike.post_id == post_id)
+    removed = delete_returning(db, delete(PostLike).where(criteria), [PostLike.created_at], criteria)
+    if removed:
+        return True, _change_like_count(db, post_id, -1, removed.created_at)
+    return False, _get_like_count(db, post_id)
+
+
+def toggle_like(db, user_id, post_id):
+    """좋아요 토글, (좋아요 상태, like_count) 반환"""
+    removed, like_count = remove_like(db, user_id, post_id)
+    if removed:
+        return False, like_count
+    # 동시에 들어온 같은 사용자의 토글이 먼저 추가했어도 결과는 좋아요 상태
+    _, like_count = add_like(db, user_id, post_id)
+    return True, like_count
+
+
+def _change_like_count(db, post_id, delta, liked_at):
+    # 인기 점수도 같은 UPDATE에서 함께 반영 (좋아요를 누른 시각 기준 가중치)
+    stmt = update(Post).where(Post.id == post_id).values(
+        like_count=Post.like_count + delta,
+        hot_score=Post.hot_score + hot.increment(db, hot.LIKE_WEIGHT * delta, liked_at),
+        updated_at=Post.updated_at
+    )
+    if delta < 0:
+        stmt = stmt.where(Post.like_count > 0)
+    if db.get_bind().dialect.update_returning:
+        value = db.execute(stmt.returning(Post.like_count)).scalar()
+        if value is not None:
+            return value
+    else:
+        db.execute(stmt)
+    return _get_like_count(db, post_id)
+
+
+def _get_like_count(db, post_id):
+    return db.execute(select(Post.like_count).where(Post.id == post_id)).scalar() or 0
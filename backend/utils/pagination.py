@@ -0,0 +1,90 @@
+"""
+페이지네이션 유틸리티
+(created_at, id) 기반 커서(keyset) 페이지네이션
+"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from utils.errors import ValidationError
+
+# 커서 이동 방향
+NEXT = 'next'
+PREV = 'prev'
+
+
+def encode_cursor(created_at, row_id, direction=NEXT):
+    """(created_at, id) 위치를 불투명 커서 문자열로 변환"""
+    raw = json.dumps([created_at.isoformat(), row_id, direction], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (created_at, id, direction)으로 복원"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id, direction = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if direction not in (NEXT, PREV):
+            raise ValueError(direction)
+        return datetime.fromisoformat(created_at), int(row_id), direction
+    except (ValueError, TypeError, UnicodeError):
+        raise ValidationError('유효하지 않은 커서입니다')
+
+
+def keyset_paginate(db, query, created_col, id_col, cursor, per_page, ascending=False):
+    """
+    최신순(created_at DESC, id DESC) 정렬 기준 커서 페이지네이션 (ascending=True면 오래된 순)
+
+    OFFSET 없이 (created_at, id) 인덱스 범위만 읽으며,
+    결과 Row와 함께 다음/이전 페이지 커서를 반환
+    """
+    direction = NEXT
+    if cursor:
+        created_at, row_id, direction = decode_cursor(cursor)
+    # 다음 페이지는 정렬 방향, 이전 페이지는 반대 방향으로 읽음
+    descending = (direction == NEXT) != ascending
+    if cursor:
+        if descending:
+            query = query.filter(or_(
+                created_col < created_at,
+                and_(created_col == created_at, id_col < row_id)
+            ))
+        else:
+            query = query.filter(or_(
+                created_col > created_at,
+                and_(created_col == created_at, id_col > row_id)
+            ))
+
+    if descending:
+        query = query.order_by(created_col.desc(), id_col.desc())
+    else:
+        query = query.order_by(created_col.asc(), id_col.asc())
+
+    # 한 건 더 조회해서 다음 페이지 존재 여부 판단
+    rows = db.execute(query.limit(per_page + 1)).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if direction == PREV:
+        rows.reverse()
+
+    # 이전 방향으로 왔으면 "더 있음"은 앞쪽, 커서가 있으면 뒤쪽은 항상 존재
+    has_next = has_more if direction == NEXT else bool(cursor)
+    has_prev = bool(cursor) if direction == NEXT else has_more
+
+    next_cursor = None
+    prev_cursor = None
+    if rows:
+        first, last = rows[0], rows[-1]
+        if has_next:
+            next_cursor = encode_cursor(_value(last, created_col), _value(last, id_col), NEXT)
+        if has_prev:
+            prev_cursor = encode_cursor(_value(first, created_col), _value(first, id_col), PREV)
+
+    return rows, next_cursor, prev_cursor
+
+
+def _value(row, column):
+    """Row에서 컬럼 값 추출"""
+    return getattr(row, column.key)
@@ -0,0 +1,100 @@
+"""
+게시글 비정규화 카운터(like_count, comment_count) 재계산
+게시글 ID 범위 배치마다 좋아요/댓글 수를 GROUP BY로 집계해 값이 다른 행만 고쳐 씀
+
+comment_count는 삭제되지 않은 댓글 수 (삭제된 댓글 아래 답글 포함)
+"""
+from sqlalchemy import bindparam, func, select, update
+
+from models import Comment, Post, PostLike
+from utils.cache import invalidate_post_detail, invalidate_post_lists
+
+
+def _counts(db, column, lower, upper, *criteria):
+    """post_id 범위의 게시글별 개수"""
+    rows = db.execute(
+        select(column, func.count())
+        .where(column.between(lower, upper), *criteria)
+        .group_by(column)
+    ).all()
+    return dict(rows)
+
+
+def reconcile(db, batch_size=1000, commit=True):
+    """
+    전체 게시글의 like_count/comment_count 재계산
+
+    배치마다 커밋해(commit=False면 호출한 트랜잭션에 포함) 긴 잠금을 피하며,
+    읽은 뒤 다른 요청이 카운터를 바꾼 행은 건너뛰고 다음 실행에서 다시 확인.
+    통계(확인한 게시글 수, 고친 게시글 수, 건너뛴 게시글 수, 카운터별 오차 합계와 최대 오차) 반환
+    """
+    table = Post.__table__
+    # 읽은 값 그대로일 때만 고침 (게시글 수정 시각은 유지)
+    stmt = (
+        update(table)
+        .where(
+            table.c.id == bindparam('post_id'),
+            table.c.like_count == bindparam('old_like_count'),
+            table.c.comment_count == bindparam('old_comment_count'),
+        )
+        .values(
+            like_count=bindparam('like_count'),
+            comment_count=bindparam('comment_count'),
+            updated_at=table.c.updated_at,
+        )
+    )
+    stats = {
+        'posts': 0, 'changed': 0, 'skipped': 0,
+        'like_drift': 0, 'comment_drift': 0, 'max_like_drift': 0, 'max_comment_drift': 0,
+    }
+    last_id = 0
+    while True:
+        posts = db.execute(
+            select(Post.id, Post.category_id, Post.like_count, Post.comment_count)
+            .where(Post.id > last_id)
+            .order_by(Post.id)
+            .limit(batch_size)
+        ).all()
+        if not posts:
+            return stats
+        lower, upper = posts[0].id, posts[-1].id
+        last_id = upper
+        likes = _counts(db, PostLike.post_id, lower, upper)
+        comments = _counts(db, Comment.post_id, lower, upper, Comment.is_deleted.is_(False))
+
+        params = []
+        categories = {}
+        for post in posts:
+            like_count = likes.get(post.id, 0)
+            comment_count = comments.get(post.id, 0)
+            if (like_count, comment_count) == (post.like_count, post.comment_count):
+                continue
+            like_drift = abs(like_count - post.like_count)
+            comment_drift = abs(comment_count - post.comment_count)
+            stats['like_drift'] += like_drift
+            stats['comment_drift'] += comment_drift
+            stats['max_like_drift'] = max(stats['max_like_drift'], like_drift)
+            stats['max_comment_drift'] = max(stats['max_comment_drift'], comment_drift)
+            params.append({
+                'post_id': post.id,
+                'old_like_count': post.like_count,
+                'old_comment_count': post.comment_count,
+                'like_count': like_count,
+                'comment_count': comment_count,
+            })
+            categories[post.id] = post.category_id
+
+        changed = []
+        for param in params:
+            if db.execute(stmt, param).rowcount == 1:
+                changed.append(param['post_id'])
+        stats['posts'] += len(posts)
+        stats['changed'] += len(changed)
+        stats['skipped'] += len(params) - len(changed)
+
+        if commit:
+            db.commit()
+        if changed:
+            for post_id in changed:
+                invalidate_post_detail(post_id)
+            invalidate_post_lists(*(categories[post_id] for post_id in changed))
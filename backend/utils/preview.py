@@ -0,0 +1,54 @@
+"""
+게시글 미리보기 유틸리티
+목록 조회에서 본문(content)을 읽지 않도록 미리보기와 본문 길이를 별도 컬럼에 저장
+"""
+from sqlalchemy import bindparam, select, update
+
+from models import Post
+
+# 목록 미리보기 길이 (글자 수)
+PREVIEW_LENGTH = 200
+
+
+def make_preview(content):
+    """본문에서 목록용 미리보기 생성"""
+    return (content or '')[:PREVIEW_LENGTH]
+
+
+def apply_content(post, content):
+    """본문 변경 시 미리보기/본문 길이도 함께 갱신"""
+    post.content = content
+    post.preview = make_preview(content)
+    post.content_length = len(content or '')
+
+
+def backfill(db, batch_size=500):
+    """
+    미리보기가 비어 있는 게시글을 ID 범위 단위로 채움
+
+    배치마다 커밋하여 긴 트랜잭션을 만들지 않으며, 처리한 게시글 수를 반환
+    """
+    table = Post.__table__
+    last_id = 0
+    total = 0
+    while True:
+        rows = db.execute(
+            select(table.c.id, table.c.content)
+            .where(table.c.id > last_id, table.c.preview.is_(None))
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return total
+        # 미리보기만 채우므로 게시글 수정 시각은 유지
+        db.execute(
+            update(table).where(table.c.id == bindparam('post_id')).values(
+                preview=bindparam('preview'), content_length=bindparam('content_length'),
+                updated_at=table.c.updated_at
+            ),
+            [{'post_id': r.id, 'preview': make_preview(r.content), 'content_length': len(r.content or '')}
+             for r in rows]
+        )
+        db.commit()
+        total += len(rows)
+        last_id = rows[-1].id
@@ -0,0 +1,214 @@
+"""
+신고 큐 유틸리티
+신고 대상별 집계(report_targets)를 신고 접수/상태 변경 시 증분 유지하고,
+처리 대기 신고 수가 기준(REPORT_AUTO_HIDE_THRESHOLD) 이상이 되면 대상을 자동 숨김 (reports 테이블은 읽지 않음)
+
+게시글은 hidden 상태로 바꾸고, 댓글은 별도 숨김 상태가 없으므로 소프트 삭제.
+관리자가 복구(restore)하면 대상을 되돌리고 처리 대기 신고는 반려
+"""
+import json
+import os
+from datetime import datetime
+
+from sqlalchemy import and_, case, select, update
+
+from models import Post, PostStatus, Report, ReportStatus, ReportTarget, ReportType
+from utils import comments
+from utils import counters
+from utils import search as search_index
+from utils.cache import invalidate_post_detail, invalidate_post_lists
+from utils.sql import dialect_insert, update_returning
+
+# 자동 숨김 기준 처리 대기 신고 수 (0이면 자동 숨김 안 함)
+AUTO_HIDE_THRESHOLD = int(os.getenv('REPORT_AUTO_HIDE_THRESHOLD', '10'))
+
+# 대상별로 보관하는 자주 나온 신고 사유 수와 사유 길이
+MAX_REASONS = 5
+REASON_LENGTH = 100
+
+
+def _target(target_type, target_id):
+    table = ReportTarget.__table__
+    return and_(table.c.target_type == target_type, table.c.target_id == target_id)
+
+
+def add_reason(top_reasons, reason):
+    """
+    자주 나온 사유 목록([[사유, 횟수], ...] JSON)에 사유 추가
+
+    최대 MAX_REASONS개만 보관하며, 가득 찬 상태에서 새 사유가 오면 가장 적은 사유를 대체하고 그 횟수를 이어받음
+    (Space-Saving 근사 집계)
+    """
+    reasons = json.loads(top_reasons) if top_reasons else []
+    reason = ' '.join(reason.split())[:REASON_LENGTH]
+    for item in reasons:
+        if item[0] == reason:
+            item[1] += 1
+            break
+    else:
+        if len(reasons) < MAX_REASONS:
+            reasons.append([reason, 1])
+        else:
+            reasons[-1] = [reason, reasons[-1][1] + 1]
+    reasons.sort(key=lambda item: -item[1])
+    return json.dumps(reasons, ensure_ascii=False)
+
+
+def reported(db, target_type, target_id, reason, now=None):
+    """
+    신고 접수 반영 (호출한 트랜잭션에 포함)
+
+    숨김 처리했으면 커밋 후 after_hide에 전달할 값, 아니면 None 반환
+    """
+    now = now or datetime.utcnow()
+    table = ReportTarget.__table__
+    values = {
+        'pending_count': table.c.pending_count + 1,
+        'total_count': table.c.total_count + 1,
+        'last_reported_at': now,
+    }
+    stmt = dialect_insert(db, table).values(
+        target_type=target_type, target_id=target_id, pending_count=1, total_count=1,
+        first_reported_at=now, last_reported_at=now,
+    )
+    if db.get_bind().dialect.name == 'mysql':
+        stmt = stmt.on_duplicate_key_update(values)
+    else:
+        stmt = stmt.on_conflict_do_update(index_elements=['target_type', 'target_id'], set_=values)
+    db.execute(stmt)
+
+    # 위 문장이 행 잠금을 잡았으므로 사유 목록은 같은 트랜잭션에서 읽고 고쳐 씀
+    row = db.execute(
+        select(table.c.id, table.c.pending_count, table.c.top_reasons, table.c.hidden_at)
+        .where(_target(target_type, target_id))
+    ).one()
+    db.execute(update(table).where(table.c.id == row.id).values(top_reasons=add_reason(row.top_reasons, reason)))
+    return _hide_if_over_threshold(db, target_type, target_id, row)
+
+
+def status_changed(db, target_type, target_id, old_status, new_status):
+    """
+    신고 상태 변경 반영 (처리 대기로 들어오거나 나간 경우만 증감, 호출한 트랜잭션에 포함)
+
+    숨김 처리했으면 커밋 후 after_hide에 전달할 값, 아니면 None 반환
+    """
+    delta = (new_status == ReportStatus.PENDING) - (old_status == ReportStatus.PENDING)
+    if not delta:
+        return None
+    table = ReportTarget.__table__
+    pending_count = table.c.pending_count + delta
+    row = update_returning(
+        db,
+        update(table)
+        .where(_target(target_type, target_id))
+        .values(pending_count=case((pending_count < 0, 0), else_=pending_count)),
+        [table.c.pending_count, table.c.hidden_at],
+        _target(target_type, target_id)
+    )
+    if row is None or delta < 0:
+        return None
+    return _hide_if_over_threshold(db, target_type, target_id, row)
+
+
+def _hide_if_over_threshold(db, target_type, target_id, row):
+    if AUTO_HIDE_THRESHOLD <= 0 or row.hidden_at is not None or row.pending_count < AUTO_HIDE_THRESHOLD:
+        return None
+    # 동시에 기준을 넘긴 요청 중 하나만 숨김 처리
+    table = ReportTarget.__table__
+    marked = db.execute(
+        update(table)
+        .where(_target(target_type, target_id), table.c.hidden_at.is_(None))
+        .values(hidden_at=datetime.utcnow())
+    ).rowcount
+    if marked != 1:
+        return None
+    hidden = hide(db, target_type, target_id)
+    if hidden is None:
+        # 이미 삭제 등으로 숨길 수 없던 대상은 숨김 표시를 남기지 않음 (복구 대상이 아님)
+        db.execute(update(table).where(_target(target_type, target_id)).values(hidden_at=None))
+    return hidden
+
+
+def hide(db, target_type, target_id):
+    """대상 숨김 (호출한 트랜잭션에 포함), 커밋 후 after_hide에 전달할 값 반환 (이미 숨겨졌거나 없으면 None)"""
+    if target_type == ReportType.COMMENT:
+        deleted = comments.soft_delete(db, target_id)
+        return (target_type, deleted) if deleted else None
+
+    post = update_returning(
+        db,
+        update(Post).where(Post.id == target_id, Post.status == PostStatus.PUBLISHED).values(status=PostStatus.HIDDEN),
+        [Post.category_id],
+        Post.id == target_id
+    )
+    if not post:
+        return None
+    counters.post_changed(db, PostStatus.PUBLISHED, post.category_id, PostStatus.HIDDEN, post.category_id)
+    search_index.remove_post(db, target_id)
+    return target_type, (target_id, post.category_id)
+
+
+def after_hide(hidden):
+    """숨김/복구 커밋 후 캐시 무효화"""
+    if hidden is None:
+        return
+    target_type, value = hidden
+    if target_type == ReportType.COMMENT:
+        comments.after_delete(value)
+    else:
+        post_id, category_id = value
+        invalidate_post_lists(category_id)
+        invalidate_post_detail(post_id)
+
+
+def restore(db, target_type, target_id, admin_id, note='신고 누적 숨김 복구'):
+    """
+    신고 누적으로 숨긴 대상을 되돌리고 처리 대기 신고를 모두 반려 (호출한 트랜잭션에 포함)
+
+    처리 대기 신고 수를 0으로 돌려 바로 다시 숨겨지지 않게 함.
+    숨긴 대상이 아니면 None, 되돌렸으면 커밋 후 after_hide에 전달할 값 반환 (None이면 호출한 쪽에서 롤백)
+    """
+    table = ReportTarget.__table__
+    # 숨김 표시를 먼저 지워 동시에 들어온 복구 요청 중 하나만 처리 (이후 신고 접수는 이 행 잠금 뒤로 밀림)
+    cleared = db.execute(
+        update(table)
+        .where(_target(target_type, target_id), table.c.hidden_at.is_not(None))
+        .values(hidden_at=None, pending_count=0)
+    ).rowcount
+    if cleared != 1:
+        return None
+
+    if target_type == ReportType.COMMENT:
+        restored = comments.restore(db, target_id)
+        if not restored:
+            return None
+        value = restored
+    else:
+        post = update_returning(
+            db,
+            update(Post)
+            .where(Post.id == target_id, Post.status == PostStatus.HIDDEN)
+            .values(status=PostStatus.PUBLISHED),
+            [Post.category_id, Post.title, Post.content],
+            Post.id == target_id
+        )
+        if not post:
+            return None
+        counters.post_changed(db, PostStatus.HIDDEN, post.category_id, PostStatus.PUBLISHED, post.category_id)
+        search_index.get_backend(db).index_post(db, target_id, post.title, post.content)
+        value = (target_id, post.category_id)
+
+    reports = Report.__table__
+    rejected = db.execute(
+        update(reports)
+        .where(
+            reports.c.report_type == target_type,
+            reports.c.target_id == target_id,
+            reports.c.status == ReportStatus.PENDING,
+        )
+        .values(status=ReportStatus.REJECTED, admin_note=note, processed_by=admin_id, processed_at=datetime.utcnow())
+    ).rowcount
+    if rejected:
+        counters.increment(db, counters.report_key(ReportStatus.PENDING), -rejected)
+        counters.increment(db, counters.report_key(ReportStatus.REJECTED), rejected)
+    return target_type, value
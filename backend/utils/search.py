@@ -0,0 +1,389 @@
+"""
+게시글 검색 인덱스
+한국어 bigram 토큰화 기반 전문 검색 (SQLite FTS5 / MySQL ngram FULLTEXT / 프로세스 내 역색인)
+"""
+import os
+import re
+import threading
+from collections import Counter
+
+from sqlalchemy import DDL, case, column, desc, event, select, table, text
+from sqlalchemy.orm import Session
+
+from models import Post, PostStatus
+
+# 한글 자모/음절 범위
+_HANGUL = 'ᄀ-ᇿ㄰-㆏가-힣'
+_TOKEN_RE = re.compile(rf'[{_HANGUL}]+|[^\W{_HANGUL}_]+')
+_HANGUL_RE = re.compile(rf'[{_HANGUL}]')
+
+FTS_TABLE = 'posts_fts'
+MYSQL_FULLTEXT_INDEX = 'ft_posts_title_content'
+
+# 역색인 사용 시 관련도 정렬 후보 최대 수
+MAX_CANDIDATES = 1000
+
+# MySQL ngram 파서의 토큰 길이 (서버 ngram_token_size와 같게 설정, 이보다 짧은 검색어는 LIKE로 검색)
+MYSQL_NGRAM_TOKEN_SIZE = int(os.getenv('MYSQL_NGRAM_TOKEN_SIZE', '2'))
+
+_fts_table = table(FTS_TABLE, column('rowid'), column('rank'))
+
+
+def tokenize(value):
+    """
+    검색용 토큰 분리
+
+    한글은 조사가 붙은 형태나 단어 일부로도 찾을 수 있도록 글자 bigram으로,
+    그 외 문자는 단어 단위 소문자로 분리
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(value or ''):
+        if _HANGUL_RE.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run.lower())
+    return tokens
+
+
+def _is_partial(token):
+    """접두어 검색이 필요한 토큰 여부 (한 글자 한글, 영문/숫자 단어)"""
+    return not _HANGUL_RE.match(token) or len(token) == 1
+
+
+class Fts5Backend:
+    """SQLite FTS5 가상 테이블 (rowid = 게시글 ID)"""
+    name = 'fts5'
+
+    def ensure(self, db):
+        pass
+
+    def index_post(self, db, post_id, title, content):
+        self.remove_post(db, post_id)
+        db.execute(
+            text(f'INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (:id, :title, :content)'),
+            {'id': post_id, 'title': ' '.join(tokenize(title)), 'content': ' '.join(tokenize(content))}
+        )
+
+    def remove_post(self, db, post_id):
+        db.execute(text(f'DELETE FROM {FTS_TABLE} WHERE rowid = :id'), {'id': post_id})
+
+    def rebuild(self, db, batch_size=500):
+        db.execute(text(f'DELETE FROM {FTS_TABLE}'))
+        count = 0
+        for rows in _iter_posts(db, batch_size):
+            db.execute(
+                text(f'INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (:id, :title, :content)'),
+                [{'id': r.id, 'title': ' '.join(tokenize(r.title)), 'content': ' '.join(tokenize(r.content))}
+                 for r in rows]
+            )
+            count += len(rows)
+        return count
+
+    def apply(self, db, query, search, by_relevance):
+        tokens = tokenize(search)
+        if not tokens:
+            return query
+        match = ' '.join(f'"{t}"*' if _is_partial(t) else f'"{t}"' for t in dict.fromkeys(tokens))
+        hits = (
+            select(_fts_table.c.rowid.label('post_id'), _fts_table.c.rank.label('score'))
+            .where(text(f'{FTS_TABLE} MATCH :match').bindparams(match=match))
+            .subquery('search_hits')
+        )
+        query = query.join(hits, hits.c.post_id == Post.id)
+        if by_relevance:
+            # FTS5 rank(bm25)는 값이 작을수록 관련도가 높음
+            query = query.order_by(hits.c.score)
+        return query
+
+
+class MySQLFulltextBackend:
+    """MySQL FULLTEXT 인덱스 (WITH PARSER ngram, 기본 ngram_token_size=2)"""
+    name = 'mysql-ngram'
+
+    def ensure(self, db):
+        pass
+
+    def index_post(self, db, post_id, title, content):
+        # posts 테이블 자체 인덱스이므로 MySQL이 자동 갱신
+        pass
+
+    def remove_post(self, db, post_id):
+        pass
+
+    def rebuild(self, db, batch_size=500):
+        db.execute(text('OPTIMIZE TABLE posts'))
+        return 0
+
+    def apply(self, db, query, search, by_relevance):
+        terms = [t.replace('"', '') for t in search.split() if t.replace('"', '')]
+        if not terms:
+            return query
+        # ngram 토큰보다 짧은 검색어(한 글자 한글 등)는 FULLTEXT로 찾을 수 없으므로 LIKE로 검색
+        short = [t for t in terms if len(t) < MYSQL_NGRAM_TOKEN_SIZE]
+        for term in short:
+            query = query.filter(Post.title.contains(term, autoescape=True) | Post.content.contains(term, autoescape=True))
+        terms = [t for t in terms if len(t) >= MYSQL_NGRAM_TOKEN_SIZE]
+        if not terms:
+            return query
+        score = text(
+            'MATCH (posts.title, posts.content) AGAINST (:match IN BOOLEAN MODE)'
+        ).bindparams(match=' '.join(f'+"{t}"' for t in terms))
+        query = query.filter(score)
+        if by_relevance:
+            query = query.order_by(desc(score))
+        return query
+
+
+class InvertedIndexBackend:
+    """
+    프로세스 내 역색인 (FTS 미지원 DB용 대체 구현)
+
+    첫 검색 시 DB에서 적재하며 이후 작성/수정/삭제 시 함께 갱신 (트랜잭션 커밋 후 반영, 롤백되면 버림).
+    워커별로 따로 유지되므로 다중 워커 환경에서는 다른 워커의 변경이 반영되지 않음
+    """
+    name = 'inverted-index'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._documents = {}
+        self._loaded = False
+
+    def ensure(self, db):
+        if not self._loaded:
+            self.rebuild(db)
+
+    def index_post(self, db, post_id, title, content):
+        _after_commit(db, lambda: self._index(post_id, title, content))
+
+    def remove_post(self, db, post_id):
+        _after_commit(db, lambda: self._discard(post_id))
+
+    def _index(self, post_id, title, content):
+        with self._lock:
+            self._remove(post_id)
+            counts = Counter(tokenize(title) + tokenize(content))
+            self._documents[post_id] = counts
+            for token, tf in counts.items():
+                self._postings.setdefault(token, {})[post_id] = tf
+
+    def _discard(self, post_id):
+        with self._lock:
+            self._remove(post_id)
+
+    def _remove(self, post_id):
+        for token in self._documents.pop(post_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(post_id, None)
+                if not postings:
+                    del self._postings[token]
+
+    def rebuild(self, db, batch_size=500):
+        with self._lock:
+            self._postings = {}
+            self._documents = {}
+            self._loaded = True
+        count = 0
+        for rows in _iter_posts(db, batch_size):
+            for r in rows:
+                self._index(r.id, r.title, r.content)
+            count += len(rows)
+        return count
+
+    def _scores(self, tokens):
+        scores = None
+        with self._lock:
+            for token in dict.fromkeys(tokens):
+                if _is_partial(token):
+                    matched = {}
+                    for key, postings in self._postings.items():
+                        if key.startswith(token):
+                            for post_id, tf in postings.items():
+                                matched[post_id] = matched.get(post_id, 0) + tf
+                else:
+                    matched = dict(self._postings.get(token, {}))
+                if scores is None:
+                    scores = matched
+                else:
+                    scores = {pid: s + matched[pid] for pid, s in scores.items() if pid in matched}
+                if not scores:
+                    return {}
+        return scores or {}
+
+    def apply(self, db, query, search, by_relevance):
+        tokens = tokenize(search)
+        if not tokens:
+            return query
+        scores = self._scores(tokens)
+        if not by_relevance:
+            return query.filter(Post.id.in_(list(scores)))
+        # 관련도순은 점수 상위 후보만 정렬식에 넣음
+        top = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))[:MAX_CANDIDATES]
+        query = query.filter(Post.id.in_([post_id for post_id, _ in top]))
+        if top:
+            query = query.order_by(desc(case(dict(top), value=Post.id, else_=0)))
+        return query
+
+
+# 커밋 후 실행할 프로세스 내 인덱스 변경 ([(트랜잭션, 함수), ...], 세션별 보관)
+_PENDING_KEY = 'search_index_pending'
+
+
+def _after_commit(db, change):
+    """트랜잭션 안이면 커밋 후로 미루고, 아니면 바로 반영"""
+    transaction = db.get_nested_transaction() or db.get_transaction()
+    if transaction is None:
+        change()
+        return
+    db.info.setdefault(_PENDING_KEY, []).append((transaction, change))
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_pending(session):
+    # 세이브포인트 해제 시에도 호출되므로 최상위 커밋에서만 반영
+    if session.in_nested_transaction():
+        return
+    for _, change in session.info.pop(_PENDING_KEY, ()):
+        change()
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_rolled_back(session, previous_transaction):
+    # 롤백된 트랜잭션(세이브포인트 포함)과 그 안에서 열린 세이브포인트의 변경만 버림
+    pending = session.info.get(_PENDING_KEY)
+    if pending:
+        session.info[_PENDING_KEY] = [
+            (transaction, change) for transaction, change in pending
+            if not _within(transaction, previous_transaction)
+        ]
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _clear_pending(session, transaction):
+    # 커밋/롤백 없이 닫힌 최상위 트랜잭션의 변경도 남기지 않음
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _within(transaction, ancestor):
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+def _iter_posts(db, batch_size):
+    """삭제되지 않은 게시글을 ID 범위 단위로 순회"""
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Post.id, Post.title, Post.content)
+            .where(Post.id > last_id, Post.status != PostStatus.DELETED)
+            .order_by(Post.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+_FTS5_CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+    "USING fts5(title, content, tokenize = 'unicode61')"
+)
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def _fts5_available(connection):
+    try:
+        options = [row[0] for row in connection.exec_driver_sql('PRAGMA compile_options')]
+    except Exception:
+        return False
+    return 'ENABLE_FTS5' in options
+
+
+def _fts5_table_exists(db):
+    return db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': FTS_TABLE}
+    ).first() is not None
+
+
+def get_backend(db):
+    """
+    현재 DB에 맞는 검색 백엔드 반환 (엔진별 1회 결정)
+
+    SQLite는 FTS5 테이블이 만들어져 있을 때만 FTS5를 사용하고,
+    그 외에는 프로세스 내 역색인으로 대체
+    """
+    bind = db.get_bind()
+    key = str(bind.url)
+    backend = _backends.get(key)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(key)
+            if backend is None:
+                if bind.dialect.name == 'sqlite' and _fts5_table_exists(db):
+                    backend = Fts5Backend()
+                elif bind.dialect.name == 'mysql':
+                    backend = MySQLFulltextBackend()
+                else:
+                    backend = InvertedIndexBackend()
+                _backends[key] = backend
+    backend.ensure(db)
+    return backend
+
+
+def create_index(db):
+    """검색 인덱스 저장소 생성 (SQLite FTS5 테이블), 이후 백엔드 재선택"""
+    bind = db.get_bind()
+    if bind.dialect.name == 'sqlite' and _fts5_available(db.connection()):
+        db.execute(text(_FTS5_CREATE_SQL))
+    _backends.pop(str(bind.url), None)
+
+
+def apply_search(db, query, search, by_relevance=False):
+    """게시글 쿼리에 검색 조건(및 관련도 정렬) 적용"""
+    return get_backend(db).apply(db, query, search, by_relevance)
+
+
+def index_post(db, post):
+    """게시글 작성/수정 시 인덱스 갱신 (호출한 트랜잭션에 포함)"""
+    get_backend(db).index_post(db, post.id, post.title, post.content)
+
+
+def remove_post(db, post_id):
+    """게시글 삭제 시 인덱스에서 제거"""
+    get_backend(db).remove_post(db, post_id)
+
+
+def rebuild_index(db):
+    """전체 인덱스 재구축, 색인한 게시글 수 반환"""
+    return get_backend(db).rebuild(db)
+
+
+# create_all/drop_all 시 검색 인덱스도 함께 생성/삭제
+event.listen(
+    Post.__table__, 'after_create',
+    DDL(_FTS5_CREATE_SQL).execute_if(
+        dialect='sqlite', callable_=lambda ddl, target, bind, **kw: _fts5_available(bind)
+    )
+)
+event.listen(
+    Post.__table__, 'before_drop',
+    DDL(f'DROP TABLE IF EXISTS {FTS_TABLE}').execute_if(dialect='sqlite')
+)
+event.listen(
+    Post.__table__, 'after_create',
+    DDL(
+        f'ALTER TABLE posts ADD FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} (title, content) WITH PARSER ngram'
+    ).execute_if(dialect='mysql')
+)
@@ -0,0 +1,284 @@
+"""
+목록 조회용 컬럼 선택 쿼리와 직렬화 함수
+ORM 객체 대신 필요한 컬럼만 select() 하여 Row를 바로 dict로 변환
+"""
+import json
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import aliased
+
+from models import Comment, Post, PostImage, User, Category, Report, ReportTarget, ReportType
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+# ---------------------------------------------------------------------- #
+# 게시글
+# ---------------------------------------------------------------------- #
+def _first_image_thumbnail():
+    """첫 번째 이미지의 썸네일 (없으면 원본) URL 상관 서브쿼리"""
+    return (
+        select(func.coalesce(PostImage.thumbnail_url, PostImage.image_url))
+        .where(PostImage.post_id == Post.id)
+        .order_by(PostImage.order, PostImage.id)
+        .limit(1)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+
+
+def post_list_select():
+    """게시글 목록 쿼리 (작성자 닉네임, 카테고리명, 대표 이미지 썸네일 포함, 본문 제외)"""
+    return (
+        select(
+            Post.id, Post.title, Post.preview, Post.author_id,
+            User.nickname.label('author_nickname'),
+            Post.category_id, Category.name.label('category_name'),
+            Post.status, Post.view_count, Post.like_count, Post.comment_count,
+            Post.created_at, Post.updated_at,
+            _first_image_thumbnail().label('thumbnail_url'),
+        )
+        .select_from(Post)
+        .join(User, Post.author_id == User.id)
+        .outerjoin(Category, Post.category_id == Category.id)
+    )
+
+
+def serialize_post_row(row):
+    """게시글 목록 항목"""
+    return {
+        'id': row.id,
+        'title': row.title,
+        'content': row.preview or '',  # 미리보기
+        'author_id': row.author_id,
+        'author_nickname': row.author_nickname,
+        'category_id': row.category_id,
+        'category_name': row.category_name,
+        'view_count': row.view_count,
+        'like_count': row.like_count,
+        'comment_count': row.comment_count,
+        'thumbnail_url': row.thumbnail_url,
+        'created_at': _isoformat(row.created_at),
+        'updated_at': _isoformat(row.updated_at)
+    }
+
+
+def post_detail_select():
+    """게시글 상세 쿼리 (목록 쿼리 + 본문)"""
+    return post_list_select().add_columns(Post.content)
+
+
+def post_images_by_post(db, post_ids):
+    """게시글별 이미지 목록 (순서대로, 한 번의 쿼리)"""
+    images = {}
+    for row in db.execute(
+        select(
+            PostImage.post_id, PostImage.image_url, PostImage.thumbnail_url,
+            PostImage.width, PostImage.height,
+        )
+        .where(PostImage.post_id.in_(post_ids))
+        .order_by(PostImage.post_id, PostImage.order, PostImage.id)
+    ):
+        images.setdefault(row.post_id, []).append({
+            'url': row.image_url,
+            'thumbnail_url': row.thumbnail_url,
+            'width': row.width,
+            'height': row.height,
+        })
+    return images
+
+
+def serialize_post_detail_row(row, images):
+    """게시글 상세 항목 (images는 원본 URL 목록, image_variants는 썸네일/크기 포함)"""
+    data = serialize_post_row(row)
+    data['content'] = row.content
+    data['images'] = [image['url'] for image in images]
+    data['image_variants'] = images
+    return data
+
+
+def serialize_admin_post_row(row):
+    """게시글 목록 항목 (관리자용)"""
+    return {
+        'id': row.id,
+        'title': row.title,
+        'author_id': row.author_id,
+        'author_nickname': row.author_nickname,
+        'status': row.status.value,
+        'view_count': row.view_count,
+        'like_count': row.like_count,
+        'comment_count': row.comment_count,
+        'created_at': _isoformat(row.created_at)
+    }
+
+
+# ---------------------------------------------------------------------- #
+# 댓글
+# ---------------------------------------------------------------------- #
+def _reply_count():
+    """삭제되지 않은 직속 답글 수 상관 서브쿼리 (post_id, parent_id 인덱스 사용)"""
+    child = aliased(Comment)
+    return (
+        select(func.count())
+        .where(child.post_id == Comment.post_id, child.parent_id == Comment.id, child.is_deleted.is_(False))
+        .correlate(Comment)
+        .scalar_subquery()
+    )
+
+
+def comment_select():
+    """댓글 목록 쿼리 (작성자 닉네임, 답글 수 포함)"""
+    return (
+        select(
+            Comment.id, Comment.post_id, Comment.author_id,
+            User.nickname.label('author_nickname'),
+            Comment.parent_id, Comment.depth, Comment.path, Comment.content,
+            Comment.created_at, Comment.updated_at,
+            _reply_count().label('reply_count'),
+        )
+        .select_from(Comment)
+        .join(User, Comment.author_id == User.id)
+    )
+
+
+def replies_by_parent(db, parent_ids, limit):
+    """부모 댓글별 처음 limit개 답글 (작성 순, 한 번의 쿼리)"""
+    ranked = (
+        comment_select()
+        .add_columns(
+            func.row_number().over(
+                partition_by=Comment.parent_id, order_by=(Comment.created_at, Comment.id)
+            ).label('position')
+        )
+        .where(Comment.parent_id.in_(parent_ids), Comment.is_deleted.is_(False))
+        .subquery()
+    )
+    replies = {}
+    for row in db.execute(
+        select(ranked).where(ranked.c.position <= limit).order_by(ranked.c.parent_id, ranked.c.position)
+    ):
+        replies.setdefault(row.parent_id, []).append(serialize_comment_row(row))
+    return replies
+
+
+def serialize_comment_row(row, replies=None):
+    """댓글 항목 (replies는 함께 내려주는 답글, 나머지는 reply_count로 판단)"""
+    return {
+        'id': row.id,
+        'post_id': row.post_id,
+        'author_id': row.author_id,
+        'author_nickname': row.author_nickname,
+        'parent_id': row.parent_id,
+        'depth': row.depth,
+        'content': row.content,
+        'reply_count': row.reply_count,
+        'created_at': _isoformat(row.created_at),
+        'updated_at': _isoformat(row.updated_at),
+        'replies': replies or []
+    }
+
+
+# ---------------------------------------------------------------------- #
+# 회원
+# ---------------------------------------------------------------------- #
+def user_list_select():
+    """회원 목록 쿼리"""
+    return select(User.id, User.email, User.nickname, User.role, User.is_active, User.created_at)
+
+
+def serialize_user_row(row):
+    """회원 목록 항목"""
+    return {
+        'id': row.id,
+        'email': row.email,
+        'nickname': row.nickname,
+        'role': row.role.value,
+        'is_active': row.is_active,
+        'created_at': _isoformat(row.created_at)
+    }
+
+
+# ---------------------------------------------------------------------- #
+# 신고
+# ---------------------------------------------------------------------- #
+def report_list_select():
+    """신고 목록 쿼리 (신고자 닉네임 포함)"""
+    reporter = aliased(User)
+    return (
+        select(
+            Report.id, Report.report_type, Report.post_id, Report.comment_id, Report.reason,
+            Report.status, Report.reporter_id, reporter.nickname.label('reporter_nickname'),
+            Report.admin_note, Report.processed_by, Report.processed_at, Report.created_at,
+        )
+        .select_from(Report)
+        .join(reporter, Report.reporter_id == reporter.id)
+    )
+
+
+def serialize_report_row(row, admin=False):
+    """신고 목록 항목 (admin=True면 처리자/처리 시각 포함)"""
+    data = {
+        'id': row.id,
+        'report_type': row.report_type.value,
+        'post_id': row.post_id,
+        'comment_id': row.comment_id,
+        'reason': row.reason,
+        'status': row.status.value,
+        'reporter_id': row.reporter_id,
+        'reporter_nickname': row.reporter_nickname,
+        'admin_note': row.admin_note,
+        'created_at': _isoformat(row.created_at)
+    }
+    if admin:
+        data['processed_by'] = row.processed_by
+        data['processed_at'] = _isoformat(row.processed_at)
+    return data
+
+
+def report_target_select():
+    """신고 큐 쿼리 (대상 게시글 제목/상태, 대상 댓글 내용 포함)"""
+    return (
+        select(
+            ReportTarget.id, ReportTarget.target_type, ReportTarget.target_id, ReportTarget.pending_count,
+            ReportTarget.total_count, ReportTarget.top_reasons, ReportTarget.first_reported_at,
+            ReportTarget.last_reported_at, ReportTarget.hidden_at,
+            Post.title.label('post_title'), Post.status.label('post_status'),
+            func.substr(Comment.content, 1, 100).label('comment_content'),
+            Comment.post_id.label('comment_post_id'), Comment.is_deleted.label('comment_is_deleted'),
+        )
+        .select_from(ReportTarget)
+        .outerjoin(Post, and_(ReportTarget.target_type == ReportType.POST, Post.id == ReportTarget.target_id))
+        .outerjoin(Comment, and_(ReportTarget.target_type == ReportType.COMMENT, Comment.id == ReportTarget.target_id))
+    )
+
+
+def serialize_report_target_row(row):
+    """신고 큐 항목"""
+    if row.target_type == ReportType.POST:
+        target = {
+            'post_id': row.target_id,
+            'title': row.post_title,
+            'status': row.post_status.value if row.post_status else None,
+        }
+    else:
+        target = {
+            'comment_id': row.target_id,
+            'post_id': row.comment_post_id,
+            'content': row.comment_content,
+            'is_deleted': row.comment_is_deleted,
+        }
+    return {
+        'target_type': row.target_type.value,
+        'target_id': row.target_id,
+        'target': target,
+        'pending_count': row.pending_count,
+        'total_count': row.total_count,
+        'top_reasons': [
+            {'reason': reason, 'count': count} for reason, count in json.loads(row.top_reasons or '[]')
+        ],
+        'first_reported_at': _isoformat(row.first_reported_at),
+        'last_reported_at': _isoformat(row.last_reported_at),
+        'hidden_at': _isoformat(row.hidden_at)
+    }
@@ -0,0 +1,73 @@
+"""
+SQL 유틸리티
+DB 종류별(SQLite/MySQL/PostgreSQL) 구문 차이 처리
+"""
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+_INSERTS = {
+    'sqlite': sqlite.insert,
+    'mysql': mysql.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def dialect_insert(db, table):
+    """현재 DB 방언의 INSERT 구문 생성 (ON CONFLICT / ON DUPLICATE KEY 사용 가능)"""
+    name = db.get_bind().dialect.name
+    if name not in _INSERTS:
+        raise NotImplementedError(f'지원하지 않는 데이터베이스입니다: {name}')
+    return _INSERTS[name](table)
+
+
+def upsert_add(db, table, key_column, key, value_column, delta):
+    """key 행의 value_column에 delta를 더함 (행이 없으면 delta로 생성)"""
+    stmt = dialect_insert(db, table).values({key_column.key: key, value_column.key: delta})
+    if db.get_bind().dialect.name == 'mysql':
+        stmt = stmt.on_duplicate_key_update({value_column.key: value_column + delta})
+    else:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[key_column], set_={value_column.key: value_column + delta}
+        )
+    db.execute(stmt)
+
+
+def update_returning(db, stmt, columns, key):
+    """
+    UPDATE 실행 후 갱신된 행의 columns 반환 (갱신된 행이 없으면 None)
+
+    RETURNING을 지원하면 한 번에, 아니면(MySQL) key 조건으로 다시 조회
+    """
+    if db.get_bind().dialect.update_returning:
+        return db.execute(stmt.returning(*columns)).first()
+    if db.execute(stmt).rowcount == 0:
+        return None
+    return db.execute(select(*columns).where(key)).first()
+
+
+def insert_returning(db, stmt, columns):
+    """
+    INSERT 실행 후 추가된 행의 columns 반환
+
+    RETURNING을 지원하면 한 번에, 아니면(MySQL) 새 기본 키로 다시 조회
+    """
+    if db.get_bind().dialect.insert_returning:
+        return db.execute(stmt.returning(*columns)).one()
+    key = db.execute(stmt).inserted_primary_key
+    return db.execute(
+        select(*columns).where(*[column == value for column, value in zip(stmt.table.primary_key.columns, key)])
+    ).one()
+
+
+def delete_returning(db, stmt, columns, key):
+    """
+    DELETE 실행 후 삭제된 행의 columns 반환 (삭제된 행이 없으면 None)
+
+    RETURNING을 지원하면 한 번에, 아니면(MySQL) key 조건으로 행을 잠가 먼저 조회
+    """
+    if db.get_bind().dialect.delete_returning:
+        return db.execute(stmt.returning(*columns)).first()
+    row = db.execute(select(*columns).where(key).with_for_update()).first()
+    if row is None or db.execute(stmt).rowcount == 0:
+        return None
+    return row
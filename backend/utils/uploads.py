@@ -0,0 +1,274 @@
+"""
+이미지 업로드 유틸리티
+업로드 파일을 조각 단위로 저장하며 SHA-256을 계산해 같은 내용은 한 번만 저장(content-addressed)하고,
+썸네일 생성은 프로세스 풀에 넘겨 요청은 바로 반환
+
+저장 위치 (UPLOAD_DIR 기준)
+    originals/ab/<hash>.<ext>     원본
+    thumbnails/ab/<hash>.<ext>    썸네일
+    thumbnails/ab/<hash>.json     원본/썸네일 크기 (썸네일 생성 완료 표시)
+"""
+import atexit
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import select, update
+
+from database import SessionLocal
+from models import Post, PostImage
+from utils.cache import invalidate_post_detail, invalidate_post_lists
+from utils.errors import APIError, ValidationError
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 시 썸네일 없이 원본만 사용
+    Image = None
+
+UPLOAD_DIR = os.getenv('UPLOAD_DIR', os.path.join(os.path.dirname(os.path.dirname(__file__)), 'uploads'))
+UPLOAD_URL_PREFIX = '/uploads'
+MAX_UPLOAD_SIZE = int(os.getenv('MAX_UPLOAD_SIZE', str(10 * 1024 * 1024)))
+THUMBNAIL_SIZE = int(os.getenv('THUMBNAIL_SIZE', '320'))
+# 썸네일 생성 프로세스 수 (0이면 요청 처리 중에 바로 생성)
+THUMBNAIL_WORKERS = int(os.getenv('THUMBNAIL_WORKERS', '2'))
+
+CHUNK_SIZE = 64 * 1024
+
+# 파일 앞부분(매직 바이트)으로 판별하는 허용 형식
+_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
+
+
+def detect_format(head):
+    """파일 앞부분으로 이미지 형식(확장자) 판별, 허용하지 않는 형식이면 None"""
+    for signature, ext in _SIGNATURES:
+        if head.startswith(signature):
+            return ext
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def _original_path(content_hash, ext):
+    return os.path.join('originals', content_hash[:2], f'{content_hash}.{ext}')
+
+
+def _meta_path(content_hash):
+    return os.path.join(UPLOAD_DIR, 'thumbnails', content_hash[:2], f'{content_hash}.json')
+
+
+def _url(relative_path):
+    return f"{UPLOAD_URL_PREFIX}/{relative_path.replace(os.sep, '/')}"
+
+
+def save_upload(stream):
+    """
+    업로드 스트림을 저장하고 {'content_hash', 'url', 'size', 'created', 'thumbnail_url', 'width', 'height'} 반환
+
+    같은 내용의 파일이 이미 있으면 새로 저장하지 않음. 썸네일이 아직 없으면 생성 작업 예약
+    """
+    tmp_dir = os.path.join(UPLOAD_DIR, 'tmp')
+    os.makedirs(tmp_dir, exist_ok=True)
+    hasher = hashlib.sha256()
+    head = b''
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    raise APIError(f'파일 크기는 {MAX_UPLOAD_SIZE // (1024 * 1024)}MB를 넘을 수 없습니다', 413)
+                if len(head) < 16:
+                    head += chunk[:16 - len(head)]
+                hasher.update(chunk)
+                tmp.write(chunk)
+
+        ext = detect_format(head)
+        if ext is None:
+            raise ValidationError('JPEG, PNG, GIF, WebP 이미지만 업로드할 수 있습니다')
+
+        content_hash = hasher.hexdigest()
+        relative_path = _original_path(content_hash, ext)
+        dest = os.path.join(UPLOAD_DIR, relative_path)
+        created = not os.path.exists(dest)
+        if created:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            os.replace(tmp_path, dest)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    meta = read_meta(content_hash) or schedule_thumbnail(content_hash, dest)
+    return dict(
+        {'thumbnail_url': None, 'width': None, 'height': None},
+        **(meta or {}),
+        content_hash=content_hash,
+        url=_url(relative_path),
+        size=size,
+        created=created,
+    )
+
+
+def read_meta(content_hash):
+    """썸네일 생성 결과 (없으면 None)"""
+    try:
+        with open(_meta_path(content_hash), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def image_metadata(image_url):
+    """
+    게시글 이미지 URL에 대응하는 PostImage 컬럼 값
+
+    이 서버에 업로드한 파일이면 content_hash와 (생성됐다면) 썸네일/크기, 외부 URL이면 빈 dict
+    """
+    prefix = f'{UPLOAD_URL_PREFIX}/originals/'
+    if not image_url or not image_url.startswith(prefix):
+        return {}
+    content_hash = image_url.rsplit('/', 1)[-1].split('.', 1)[0]
+    if len(content_hash) != 64:
+        return {}
+    meta = read_meta(content_hash) or {}
+    return {
+        'content_hash': content_hash,
+        'width': meta.get('width'),
+        'height': meta.get('height'),
+        'thumbnail_url': meta.get('thumbnail_url'),
+    }
+
+
+# ---------------------------------------------------------------------- #
+# 썸네일 생성
+# ---------------------------------------------------------------------- #
+def make_thumbnail(content_hash, src, upload_dir, size):
+    """
+    썸네일과 메타 파일 생성 (프로세스 풀에서 실행), 메타 dict 반환
+
+    투명도가 있는 이미지는 PNG, 나머지는 JPEG로 저장
+    """
+    with Image.open(src) as img:
+        width, height = img.size
+        img.thumbnail((size, size))
+        has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+        if has_alpha:
+            thumb, ext, fmt = img.convert('RGBA'), 'png', 'PNG'
+        else:
+            thumb, ext, fmt = img.convert('RGB'), 'jpg', 'JPEG'
+
+    relative_path = os.path.join('thumbnails', content_hash[:2], f'{content_hash}.{ext}')
+    dest = os.path.join(upload_dir, relative_path)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    # 임시 파일에 쓴 뒤 교체해 다른 프로세스가 쓰는 중인 파일을 읽지 않도록 함
+    tmp_path = f'{dest}.{os.getpid()}.tmp'
+    thumb.save(tmp_path, fmt, quality=85)
+    os.replace(tmp_path, dest)
+
+    meta = {
+        'width': width,
+        'height': height,
+        'thumbnail_url': _url(relative_path),
+        'thumbnail_width': thumb.width,
+        'thumbnail_height': thumb.height,
+    }
+    meta_path = os.path.join(upload_dir, 'thumbnails', content_hash[:2], f'{content_hash}.json')
+    with open(f'{meta_path}.{os.getpid()}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(f'{meta_path}.{os.getpid()}.tmp', meta_path)
+    return meta
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # 요청 처리 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+                _executor = ProcessPoolExecutor(
+                    max_workers=THUMBNAIL_WORKERS, mp_context=multiprocessing.get_context('spawn')
+                )
+                atexit.register(_executor.shutdown, wait=False)
+    return _executor
+
+
+def schedule_thumbnail(content_hash, src):
+    """
+    썸네일 생성 예약 (Pillow 미설치 시 생략), 완료되면 해당 이미지 행에 결과 반영
+
+    THUMBNAIL_WORKERS=0이면 바로 생성해 메타 dict 반환, 그 외에는 None
+    """
+    if Image is None:
+        return None
+    if THUMBNAIL_WORKERS <= 0:
+        try:
+            meta = make_thumbnail(content_hash, src, UPLOAD_DIR, THUMBNAIL_SIZE)
+        except Exception:
+            return None  # 손상된 이미지 등은 원본만 사용
+        apply_thumbnail(content_hash, meta)
+        return meta
+    future = _get_executor().submit(make_thumbnail, content_hash, src, UPLOAD_DIR, THUMBNAIL_SIZE)
+    future.add_done_callback(lambda f: _on_thumbnail_done(content_hash, f))
+    return None
+
+
+def _on_thumbnail_done(content_hash, future):
+    try:
+        meta = future.result()
+    except Exception:
+        return  # 손상된 이미지 등은 원본만 사용
+    try:
+        apply_thumbnail(content_hash, meta)
+    except Exception:
+        pass  # 다음 게시글 작성 시 메타 파일에서 다시 채워짐
+
+
+def apply_thumbnail(content_hash, meta):
+    """
+    같은 내용의 이미지 행에 크기/썸네일 URL 기록 후 관련 게시글 캐시 무효화
+
+    게시글 수정 시각은 그대로 두고 이미지 버전을 올려 상세 ETag가 바뀌게 함. 갱신한 행 수를 반환
+    """
+    db = SessionLocal.session_factory()
+    try:
+        posts = db.execute(
+            select(Post.id, Post.category_id)
+            .join(PostImage, PostImage.post_id == Post.id)
+            .where(PostImage.content_hash == content_hash)
+            .distinct()
+        ).all()
+        if not posts:
+            return 0
+        result = db.execute(
+            update(PostImage)
+            .where(PostImage.content_hash == content_hash)
+            .values(width=meta['width'], height=meta['height'], thumbnail_url=meta['thumbnail_url'])
+        )
+        db.execute(
+            update(Post)
+            .where(Post.id.in_([post.id for post in posts]))
+            .values(image_version=Post.image_version + 1, updated_at=Post.updated_at)
+        )
+        db.commit()
+    finally:
+        db.close()
+    for post in posts:
+        invalidate_post_detail(post.id)
+    invalidate_post_lists(*(post.category_id for post in posts))
+    return result.rowcount
@@ -77,6 +77,43 @@ class CommentCreateSchema(Schema):
     parent_id = fields.Int(allow_none=True)
 
 
+class CommentImportSchema(Schema):
+    """일괄 가져오기 댓글 검증"""
+    author_id = fields.Int(required=True, error_messages={'required': '댓글 작성자 ID를 입력해주세요'})
+    content = fields.Str(
+        required=True,
+        validate=validate.Length(min=1, max=1000, error='댓글은 1~1000자 사이여야 합니다'),
+        error_messages={'required': '댓글 내용을 입력해주세요'}
+    )
+    created_at = fields.DateTime(allow_none=True)
+
+
+class PostImportSchema(Schema):
+    """일괄 가져오기 게시글 검증 (NDJSON 한 줄)"""
+    author_id = fields.Int(required=True, error_messages={'required': '작성자 ID를 입력해주세요'})
+    title = fields.Str(
+        required=True,
+        validate=validate.Length(min=1, max=500, error='제목은 1~500자 사이여야 합니다'),
+        error_messages={'required': '제목을 입력해주세요'}
+    )
+    content = fields.Str(
+        required=True,
+        validate=validate.Length(min=1, error='내용을 입력해주세요'),
+        error_messages={'required': '내용을 입력해주세요'}
+    )
+    category_id = fields.Int(allow_none=True)
+    status = fields.Str(
+        validate=validate.OneOf(['published', 'draft'], error='상태는 published 또는 draft여야 합니다'),
+        missing='published'
+    )
+    created_at = fields.DateTime(allow_none=True)
+    images = fields.List(
+        fields.Str(validate=validate.Length(min=1, max=500, error='이미지 URL은 1~500자 사이여야 합니다')),
+        missing=list
+    )
+    comments = fields.List(fields.Nested(CommentImportSchema), missing=list)
+
+
 class ReportCreateSchema(Schema):
     """신고 생성 요청 검증"""
     report_type = fields.Str(
@@ -0,0 +1,207 @@
+"""
+조회수 버퍼
+게시글 조회수 증가분을 메모리(또는 Redis)에 모았다가 주기적으로/일정 건수마다
+게시글별 UPDATE posts SET view_count = view_count + n 으로 일괄 반영 (인기 점수 포함)
+"""
+import atexit
+import os
+import threading
+import time
+import uuid
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from database import engine
+from models import Post
+from utils import hot
+
+try:
+    import redis
+except ImportError:  # 공유 버퍼는 선택 기능
+    redis = None
+
+
+class LocalPending:
+    """프로세스 내 미반영 조회수"""
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def add(self, post_id, n=1):
+        with self._lock:
+            self._counts[post_id] = self._counts.get(post_id, 0) + n
+            return self._counts[post_id]
+
+    def get(self, post_id):
+        with self._lock:
+            return self._counts.get(post_id, 0)
+
+    def drain(self):
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            return counts
+
+
+class RedisPending:
+    """여러 워커가 공유하는 미반영 조회수 (Redis 해시)"""
+
+    def __init__(self, url, key='community:view_counts'):
+        self._client = redis.Redis.from_url(url)
+        self._key = key
+
+    def add(self, post_id, n=1):
+        return int(self._client.hincrby(self._key, post_id, n))
+
+    def get(self, post_id):
+        return int(self._client.hget(self._key, post_id) or 0)
+
+    def drain(self):
+        # RENAME은 원자적이므로 이후 증가분은 새 해시에 쌓임
+        flushing = f'{self._key}:flushing:{uuid.uuid4().hex}'
+        try:
+            self._client.rename(self._key, flushing)
+        except redis.ResponseError:  # 미반영 조회수 없음
+            return {}
+        raw = self._client.hgetall(flushing)
+        self._client.delete(flushing)
+        return {int(post_id): int(n) for post_id, n in raw.items()}
+
+
+class ViewCountBuffer:
+    """
+    조회수 증가 버퍼
+
+    flush_interval > 0 이면 백그라운드 스레드가 주기적으로(또는 flush_size 도달 시) 반영하고,
+    0 이하이면 flush_size 도달 시 record()를 호출한 쪽에서 바로 반영
+    """
+
+    def __init__(self, engine, flush_size=100, flush_interval=5.0, pending=None):
+        self.engine = engine
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.pending = pending if pending is not None else LocalPending()
+        self._recorded = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def record(self, post_id):
+        """조회 1회 기록, 아직 DB에 반영되지 않은 해당 게시글 조회수 반환"""
+        count = self.pending.add(post_id)
+        with self._lock:
+            self._recorded += 1
+            full = self._recorded >= self.flush_size
+        if self.flush_interval > 0:
+            self._start()
+            if full:
+                self._wakeup.set()
+        elif full:
+            self.flush()
+        return count
+
+    def pending_count(self, post_id):
+        """아직 DB에 반영되지 않은 조회수"""
+        return self.pending.get(post_id)
+
+    def flush(self):
+        """미반영 조회수를 DB에 일괄 반영, 반영한 게시글 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                self._recorded = 0
+            counts = self.pending.drain()
+            if not counts:
+                return 0
+            table = Post.__table__
+            try:
+                with Session(self.engine) as session, session.begin():
+                    # 조회는 게시글 수정이 아니므로 updated_at은 그대로 유지
+                    stmt = (
+                        update(table)
+                        .where(table.c.id == bindparam('post_id'))
+                        .values(
+                            view_count=table.c.view_count + bindparam('delta'),
+                            hot_score=table.c.hot_score + bindparam('delta') * hot.increment(session, hot.VIEW_WEIGHT),
+                            updated_at=table.c.updated_at,
+                        )
+                    )
+                    # 게시글 ID 순으로 갱신해 워커 간 잠금 순서를 통일
+                    session.execute(stmt, [
+                        {'post_id': post_id, 'delta': n}
+                        for post_id, n in sorted(counts.items())
+                    ])
+            except Exception:
+                # 실패한 증가분은 다음 반영 때 다시 시도
+                for post_id, n in counts.items():
+                    self.pending.add(post_id, n)
+                raise
+            return len(counts)
+
+    def close(self):
+        """백그라운드 스레드 종료 후 남은 조회수 반영 (프로세스 종료 시 호출)"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def _start(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._stopped.is_set():
+                    self._thread = threading.Thread(target=self._run, name='view-count-flusher', daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._stopped.is_set():
+            self._wakeup.wait(max(0.0, next_flush - time.monotonic()))
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+            try:
+                self.flush()
+            except Exception:
+                pass  # 증가분은 버퍼에 복구되어 다음 주기에 재시도
+            next_flush = time.monotonic() + self.flush_interval
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_view_buffer():
+    """
+    프로세스 공용 조회수 버퍼 반환
+
+    VIEW_COUNT_REDIS_URL(없으면 CACHE_REDIS_URL) 지정 시 여러 워커가 공유하는 Redis 버퍼 사용
+    """
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                redis_url = os.getenv('VIEW_COUNT_REDIS_URL') or os.getenv('CACHE_REDIS_URL', '')
+                pending = RedisPending(redis_url) if redis_url and redis is not None else None
+                _buffer = ViewCountBuffer(
+                    engine,
+                    flush_size=int(os.getenv('VIEW_COUNT_FLUSH_SIZE', '100')),
+                    flush_interval=float(os.getenv('VIEW_COUNT_FLUSH_INTERVAL', '5')),
+                    pending=pending,
+                )
+                atexit.register(_buffer.close)
+    return _buffer
+
+
+def record_view(post_id):
+    """게시글 조회 기록, 미반영 조회수 반환"""
+    return get_view_buffer().record(post_id)
+
+
+def flush():
+    """미반영 조회수 즉시 반영"""
+    if _buffer is None:
+        return 0
+    return _buffer.flush()
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { useParams, useNavigate, Link } from 'react-router-dom'
 import { getPost, deletePost, likePost } from '../services/posts'
-import { getComments, createComment, deleteComment } from '../services/comments'
+import { getComments, getReplies, createComment, deleteComment } from '../services/comments'
 import { getUser, isAuthenticated } from '../services/auth'
 import './PostDetail.css'
 
@@ -13,6 +13,7 @@ function PostDetail() {
   const navigate = useNavigate()
   const [post, setPost] = useState(null)
   const [comments, setComments] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [commentContent, setCommentContent] = useState('')
@@ -47,11 +48,49 @@ function PostDetail() {
     try {
       const data = await getComments(id)
       setComments(data.comments || [])
+      setNextCursor(data.next_cursor)
     } catch (err) {
       console.error('댓글 로드 실패:', err)
     }
   }
 
+  /**
+   * 다음 페이지 댓글 로드
+   */
+  const loadMoreComments = async () => {
+    try {
+      const data = await getComments(id, { cursor: nextCursor })
+      setComments((prev) => [...prev, ...(data.comments || [])])
+      setNextCursor(data.next_cursor)
+    } catch (err) {
+      console.error('댓글 로드 실패:', err)
+    }
+  }
+
+  /**
+   * 답글 더 보기 (이미 받은 답글은 제외하고 이어 붙임)
+   */
+  const loadMoreReplies = async (comment) => {
+    try {
+      const params = comment.replies_cursor ? { cursor: comment.replies_cursor } : {}
+      const data = await getReplies(comment.id, params)
+      const updateTree = (list) => list.map((item) => {
+        if (item.id !== comment.id) {
+          return { ...item, replies: updateTree(item.replies || []) }
+        }
+        const loadedIds = new Set(item.replies.map((reply) => reply.id))
+        return {
+          ...item,
+          replies: [...item.replies, ...data.replies.filter((reply) => !loadedIds.has(reply.id))],
+          replies_cursor: data.next_cursor
+        }
+      })
+      setComments((prev) => updateTree(prev))
+    } catch (err) {
+      console.error('답글 로드 실패:', err)
+    }
+  }
+
   /**
    * 댓글 작성
    */
@@ -151,6 +190,11 @@ function PostDetail() {
             {renderComments(comment.replies, depth + 1)}
           </div>
         )}
+        {comment.reply_count > (comment.replies?.length || 0) && (
+          <button onClick={() => loadMoreReplies(comment)} className="more-replies-btn">
+            답글 {comment.reply_count - (comment.replies?.length || 0)}개 더 보기
+          </button>
+        )}
       </div>
     ))
   }
@@ -209,7 +253,7 @@ function PostDetail() {
 
       {/* 댓글 섹션 */}
       <section className="comments-section">
-        <h2>댓글 ({comments.length})</h2>
+        <h2>댓글 ({post.comment_count})</h2>
 
         {isAuthenticated() && (
           <form onSubmit={handleSubmitComment} className="comment-form">
@@ -233,6 +277,12 @@ function PostDetail() {
             renderComments(comments)
           )}
         </div>
+
+        {nextCursor && (
+          <button onClick={loadMoreComments} className="more-comments-btn">
+            댓글 더 보기
+          </button>
+        )}
       </section>
     </div>
   )
@@ -4,10 +4,18 @@
 import api from './api'
 
 /**
- * 댓글 목록 조회
+ * 댓글 목록 조회 (최상위 댓글 커서 페이지, params: cursor, per_page, replies)
  */
-export const getComments = async (postId) => {
-  const response = await api.get('/comments', { params: { post_id: postId } })
+export const getComments = async (postId, params = {}) => {
+  const response = await api.get('/comments', { params: { post_id: postId, ...params } })
+  return response.data
+}
+
+/**
+ * 답글 목록 조회 (params: cursor, per_page)
+ */
+export const getReplies = async (commentId, params = {}) => {
+  const response = await api.get(`/comments/${commentId}/replies`, { params })
   return response.data
 }
 